@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Per-line cost of the extractor keyword/pattern checks, before and after
+precompiling them in ``resume_parser.patterns``.
+
+"Before" reproduces the previous code: ``any(kw in line for kw in [...])`` over a
+list literal and ``re.match`` on pattern strings built per call.
+
+Usage:
+    python benchmarks/bench_matchers.py [--number N]
+"""
+
+import argparse
+import re
+import timeit
+
+from resume_parser import patterns
+from resume_parser.resume_parser import is_job_header_line
+
+LINES = [
+    "john smith",
+    "senior software engineer | platform / infrastructure",
+    "jan 2019 - present (5 years 2 months)",
+    "• increased revenue by 35% across 4 regions by building a new pricing engine for "
+    "enterprise customers worldwide, resulting in $2m of new annual recurring revenue",
+    "greater seattle area",
+    "honors-awards",
+]
+
+
+def _old_is_job_header_line(line: str) -> bool:
+    line = line.strip()
+    date_range_pattern = (
+        "(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\\.?\\s+\\d{4}\\s*[-–]\\s*"
+        "(?:Present|(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\\.?\\s+\\d{4})"
+    )
+    if re.search(date_range_pattern, line, re.IGNORECASE):
+        return True
+    tenure_pattern = (
+        "^(\\(?\\d+\\s+(?:yr|yrs|year|years|mo|mos|month|months).*)"
+        "|(^\\d{4}\\s*[-–]\\s*(?:Present|\\d{4}))"
+    )
+    if re.match(tenure_pattern, line, re.IGNORECASE):
+        return True
+    titles = list(patterns.JOB_TITLES)
+    title_suffixes = list(patterns.JOB_TITLE_SUFFIXES)
+    title_pattern = f"^(?:{'|'.join(titles)})\\s*(?:{'|'.join(title_suffixes)})?$"
+    if re.match(title_pattern, line, re.IGNORECASE):
+        return True
+    if len(line) < 50 and (not line.startswith(("•", "-", "*"))) and ("." not in line):
+        words = line.split()
+        if 1 <= len(words) <= 5 and all(w[0].isupper() for w in words if w.isalpha()):
+            return True
+    return False
+
+
+def per_line_us(func, number: int) -> float:
+    total = timeit.timeit(lambda: [func(line) for line in LINES], number=number)
+    return total / (number * len(LINES)) * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--number", type=int, default=20000, help="repetitions per check")
+    args = parser.parse_args()
+
+    rows = []
+    for name in [
+        "ROLE_KEYWORDS",
+        "ROLE_SKIP",
+        "NON_NAME_INDICATORS",
+        "IMPACT",
+        "CONTACT",
+        "AWARDS_STOP_HEADERS",
+        "AWARD_ENDINGS",
+    ]:
+        matcher = getattr(patterns, name)
+
+        def before(line, keywords=matcher.keywords):
+            return any(kw in line for kw in list(keywords))
+
+        for line in LINES:
+            assert before(line) == bool(matcher.search(line)), (name, line)
+        rows.append(
+            (name, per_line_us(before, args.number), per_line_us(matcher.search, args.number))
+        )
+
+    for line in LINES:
+        assert _old_is_job_header_line(line) == is_job_header_line(line), line
+    rows.append(
+        (
+            "is_job_header_line",
+            per_line_us(_old_is_job_header_line, args.number),
+            per_line_us(is_job_header_line, args.number),
+        )
+    )
+
+    print(f"{'check':<22}{'before µs':>12}{'after µs':>12}{'speedup':>10}")
+    for name, before_us, after_us in rows:
+        print(f"{name:<22}{before_us:>12.3f}{after_us:>12.3f}{before_us / after_us:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+"""
+Timing suite over a synthetic resume corpus, with stored baselines.
+
+Builds (or reuses) the corpus from ``benchmarks/corpus.py`` and reports
+milliseconds per file, per layout, for ``extract_text_from_pdf``, every
+``extract_*`` function (on already extracted text), end-to-end
+``parse_resume``, and ``parse_resumes`` batch throughput. Each figure is the
+best of ``--repeat`` runs.
+
+``--save-baseline`` stores the figures; later runs compare against them and
+exit with status 1 when any figure is more than ``--threshold`` slower (and
+slower by at least ``--min-delta`` ms, to ignore noise on microsecond-scale
+checks). Baselines are only meaningful on the machine that recorded them.
+
+Usage:
+    python benchmarks/bench_suite.py [--save-baseline] [--threshold 0.2]
+"""
+
+import argparse
+import glob
+import json
+import logging
+import os
+import platform
+import sys
+import time
+
+import pymupdf as fitz
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from corpus import STYLES, build_corpus, style_of
+
+import resume_parser
+from resume_parser import (
+    extract_achievements,
+    extract_awards_and_honors,
+    extract_email,
+    extract_linkedin,
+    extract_location,
+    extract_name,
+    extract_phone,
+    extract_role,
+    extract_summary,
+    extract_text_from_pdf,
+    get_nlp,
+    parse_resume,
+    parse_resumes,
+)
+from resume_parser.model import model_id
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+
+def best_ms(func, items: list, repeat: int, min_seconds: float = 0.05) -> float:
+    """Best-of-``repeat`` milliseconds per item of ``func`` over ``items``."""
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            for item in items:
+                func(item)
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_seconds:
+            break
+        number *= 2
+    runs = [elapsed]
+    for _ in range(repeat - 1):
+        start = time.perf_counter()
+        for _ in range(number):
+            for item in items:
+                func(item)
+        runs.append(time.perf_counter() - start)
+    return min(runs) / (number * len(items)) * 1000
+
+
+def run_suite(paths: list[str], repeat: int) -> dict[str, float]:
+    nlp = get_nlp()
+    by_style = {style: [p for p in paths if style_of(p) == style] for style in STYLES}
+    timings = {}
+    for style, files in by_style.items():
+        texts = [extract_text_from_pdf(path) for path in files]
+        nlp_docs = {text: nlp(text[:2000]) if nlp else None for text in texts}
+        names = {text: extract_name(text, nlp_docs[text]) for text in texts}
+        checks = {
+            "extract_text_from_pdf": (extract_text_from_pdf, files),
+            "extract_email": (extract_email, texts),
+            "extract_phone": (extract_phone, texts),
+            "extract_linkedin": (extract_linkedin, texts),
+            "extract_name": (lambda t: extract_name(t, nlp_docs[t]), texts),
+            "extract_role": (lambda t: extract_role(t, names[t]), texts),
+            "extract_location": (lambda t: extract_location(t, nlp_docs[t]), texts),
+            "extract_summary": (extract_summary, texts),
+            "extract_achievements": (extract_achievements, texts),
+            "extract_awards_and_honors": (extract_awards_and_honors, texts),
+            "parse_resume": (parse_resume, files),
+        }
+        for name, (func, items) in checks.items():
+            timings[f"{name}/{style}"] = best_ms(func, items, repeat)
+            print(f"  {name}/{style}: {timings[f'{name}/{style}']:.3f} ms", file=sys.stderr)
+    timings["parse_resumes/all"] = best_ms(
+        lambda batch: parse_resumes(batch), [paths], repeat, min_seconds=0
+    ) / len(paths)
+    return timings
+
+
+def environment(args) -> dict:
+    return {
+        "resume_parser": resume_parser.__version__,
+        "model": model_id() if get_nlp() else None,
+        "python": platform.python_version(),
+        "pymupdf": fitz.VersionBind,
+        "machine": platform.machine(),
+        "corpus": {"per_style": args.per_style, "seed": args.seed},
+    }
+
+
+def compare(timings: dict, baseline: dict, threshold: float, min_delta: float) -> list[str]:
+    """Print the comparison table; return the names of regressed figures."""
+    print(f"{'benchmark':<42}{'ms/file':>11}{'baseline':>11}{'change':>9}")
+    regressions = []
+    for name, ms in timings.items():
+        base = baseline.get(name)
+        if base is None:
+            print(f"{name:<42}{ms:>11.3f}{'-':>11}{'':>9}")
+            continue
+        change = ms / base - 1 if base else 0.0
+        regressed = change > threshold and ms - base > min_delta
+        flag = "  REGRESSED" if regressed else ""
+        print(f"{name:<42}{ms:>11.3f}{base:>11.3f}{change:>+8.0%}{flag}")
+        if regressed:
+            regressions.append(name)
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--corpus", default=os.path.join(HERE, ".corpus"), help="corpus cache directory"
+    )
+    parser.add_argument("--per-style", type=int, default=5, help="PDFs per layout")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=5, help="runs per figure (best is kept)")
+    parser.add_argument(
+        "--baseline", default=os.path.join(HERE, "baseline.json"), help="baseline file"
+    )
+    parser.add_argument("--save-baseline", action="store_true", help="store this run as baseline")
+    parser.add_argument(
+        "--threshold", type=float, default=0.2, help="allowed slowdown (0.2 = 20%%)"
+    )
+    parser.add_argument(
+        "--min-delta", type=float, default=0.05, help="ignore slowdowns below this many ms"
+    )
+    args = parser.parse_args()
+
+    # Per-file warnings (e.g. no spaCy model installed) would drown the report.
+    logging.getLogger("resume_parser").setLevel(logging.ERROR)
+    corpus_dir = os.path.join(args.corpus, f"seed{args.seed}-n{args.per_style}")
+    if not os.path.isdir(corpus_dir):
+        build_corpus(corpus_dir, args.per_style, args.seed)
+    paths = sorted(glob.glob(os.path.join(corpus_dir, "*.pdf")))
+    env = environment(args)
+    model = env["model"] or "none, rules only"
+    print(f"Timing {len(paths)} PDFs (model: {model})", file=sys.stderr)
+    timings = run_suite(paths, args.repeat)
+
+    baseline = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline, encoding="utf-8") as f:
+            stored = json.load(f)
+        baseline = stored["timings"]
+        # A different parser version is the point of the comparison; anything
+        # else changing makes the figures incomparable.
+        recorded = {k: v for k, v in stored["environment"].items() if k != "resume_parser"}
+        if recorded != {k: v for k, v in env.items() if k != "resume_parser"}:
+            print(
+                f"warning: baseline was recorded with {stored['environment']}, now {env}",
+                file=sys.stderr,
+            )
+    regressions = compare(timings, baseline, args.threshold, args.min_delta)
+    if args.save_baseline:
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump({"environment": env, "timings": timings}, f, indent=2, sort_keys=True)
+        print(f"Saved baseline to {args.baseline}", file=sys.stderr)
+        return 0
+    if regressions:
+        print(
+            f"{len(regressions)} figures regressed by more than {args.threshold:.0%}: "
+            + ", ".join(regressions),
+            file=sys.stderr,
+        )
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
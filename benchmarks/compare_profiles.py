@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Compare the "fast" (rules only) and "full" (spaCy) parsing profiles.
+
+Parses every PDF with both profiles and reports, per field, the share of
+files on which the two agree exactly (overall and per layout of the synthetic
+corpus), then the milliseconds per file of each profile and the speedup.
+Pass PDF paths to use your own documents instead of the synthetic corpus.
+
+Without an installed spaCy model the full profile falls back to the same
+rules, so agreement is trivially 100%; the script warns when that happens.
+
+Usage:
+    python benchmarks/compare_profiles.py [PDF ...] [--repeat 3] [--json out.json]
+"""
+
+import argparse
+import glob
+import json
+import logging
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from bench_suite import best_ms
+from corpus import build_corpus, style_of
+
+from resume_parser import FIELDS, get_nlp, parse_resume
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+
+def _descriptions(value):
+    return [item.get("description") for item in value or []]
+
+
+def agreement(full: dict[str, dict], fast: dict[str, dict], groups: dict[str, list[str]]) -> dict:
+    """``{row: {group: share of files where both profiles agree}}``.
+
+    One row per field, plus ``<field> descriptions`` for achievements and
+    awards, whose titles are built with spaCy but whose items are not.
+    """
+    rows = {field: lambda data, field=field: data.get(field) for field in FIELDS}
+    for field in ("achievements", "awards"):
+        rows[f"{field} descriptions"] = lambda data, field=field: _descriptions(data.get(field))
+    table = {}
+    for row, value in rows.items():
+        table[row] = {}
+        for group, paths in groups.items():
+            same = sum(value(full[p]) == value(fast[p]) for p in paths)
+            table[row][group] = same / len(paths) if paths else 1.0
+    return table
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("paths", nargs="*", help="PDFs to compare on (default: synthetic corpus)")
+    parser.add_argument(
+        "--corpus", default=os.path.join(HERE, ".corpus"), help="corpus cache directory"
+    )
+    parser.add_argument("--per-style", type=int, default=5, help="PDFs per layout")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=3, help="timing runs (best is kept)")
+    parser.add_argument("--json", help="also write the figures to this file")
+    args = parser.parse_args()
+
+    logging.getLogger("resume_parser").setLevel(logging.ERROR)
+    paths = args.paths
+    if not paths:
+        corpus_dir = os.path.join(args.corpus, f"seed{args.seed}-n{args.per_style}")
+        if not os.path.isdir(corpus_dir):
+            build_corpus(corpus_dir, args.per_style, args.seed)
+        paths = sorted(glob.glob(os.path.join(corpus_dir, "*.pdf")))
+    if get_nlp() is None:
+        print("warning: no spaCy model installed; both profiles use the rules", file=sys.stderr)
+
+    full = {path: parse_resume(path) for path in paths}
+    fast = {path: parse_resume(path, profile="fast") for path in paths}
+    groups = {"all": paths}
+    if not args.paths:
+        for path in paths:
+            groups.setdefault(style_of(path), []).append(path)
+    table = agreement(full, fast, groups)
+
+    print(f"{'field':<26}" + "".join(f"{group:>13}" for group in groups))
+    for row, shares in table.items():
+        print(f"{row:<26}" + "".join(f"{shares[group]:>13.0%}" for group in groups))
+
+    full_ms = best_ms(parse_resume, paths, args.repeat)
+    fast_ms = best_ms(lambda path: parse_resume(path, profile="fast"), paths, args.repeat)
+    speedup = full_ms / fast_ms if fast_ms else float("inf")
+    print(f"\nfull: {full_ms:.2f} ms/file  fast: {fast_ms:.2f} ms/file  speedup: {speedup:.1f}x")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "files": len(paths),
+                    "agreement": table,
+                    "ms_per_file": {"full": full_ms, "fast": fast_ms},
+                    "speedup": speedup,
+                },
+                f,
+                indent=2,
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,252 @@
+#!/usr/bin/env python3
+"""
+Reproducible synthetic resume PDFs for benchmarking, built offline with PyMuPDF.
+
+Four layouts are generated from a seeded random generator, so the same seed
+always gives the same text:
+
+- ``linkedin``: LinkedIn "Save to PDF" export (contact sidebar first, then the
+  name, headline, location, summary and experience with tenure lines)
+- ``traditional``: upper-case name, pipe-separated title line, bulleted roles
+- ``multicolumn``: contact and skills in a narrow left column, experience in a
+  wide right column on the same page
+- ``academic``: 20+ page CV with publications, grants, teaching and awards
+
+Usage:
+    python benchmarks/corpus.py OUTPUT_DIR [--per-style N] [--seed S]
+"""
+
+import argparse
+import os
+import random
+
+import pymupdf as fitz
+
+STYLES = ("linkedin", "traditional", "multicolumn", "academic")
+
+FIRST_NAMES = ["Sarah", "John", "Maria", "Wei", "Priya", "Alex", "Fatima", "Lucas", "Aiko", "Omar"]
+LAST_NAMES = ["Johnson", "Smith", "Garcia", "Chen", "Patel", "Kim", "Haddad", "Silva", "Tanaka"]
+TITLES = [
+    "Senior Software Engineer",
+    "Product Manager",
+    "Director of Engineering",
+    "Data Scientist",
+    "Staff Engineer",
+    "Engineering Manager",
+]
+CITIES = ["Austin, TX", "Seattle, WA", "Boston, MA", "Denver, CO", "San Jose, CA", "Chicago, IL"]
+COMPANIES = ["Acme Corp", "Globex", "Initech", "Umbrella Labs", "Stark Industries", "Hooli"]
+SKILLS = ["Python", "Kubernetes", "PostgreSQL", "Kafka", "React", "Terraform", "Go", "Spark"]
+VERBS = ["Increased", "Reduced", "Led", "Built", "Launched", "Optimized", "Developed", "Scaled"]
+OBJECTS = [
+    "revenue for the enterprise pricing engine",
+    "cloud spend across compute fleets",
+    "a team of engineers delivering the payments platform",
+    "data pipelines for event ingestion",
+    "the mobile app for consumer customers",
+    "search ranking for monthly active users",
+    "fraud detection models for card transactions",
+]
+METRICS = ["by 35%", "by $1.2M annually", "to 5M+ transactions per day", "to 300k users", "by 18%"]
+AWARDS = ["Engineer of the Year", "Best Paper Award", "Hackathon Winner", "President's Club Award"]
+
+
+def _bullet(rng: random.Random) -> str:
+    return (
+        f"{rng.choice(VERBS)} {rng.choice(OBJECTS)} {rng.choice(METRICS)} "
+        f"while partnering with {rng.choice(COMPANIES)} teams across {rng.randint(2, 9)} regions"
+    )
+
+
+def _person(rng: random.Random) -> dict:
+    first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+    return {
+        "name": f"{first} {last}",
+        "title": rng.choice(TITLES),
+        "city": rng.choice(CITIES),
+        "email": f"{first.lower()}.{last.lower()}@example.com",
+        "phone": f"({rng.randint(200, 989)}) {rng.randint(200, 989)}-{rng.randint(1000, 9999)}",
+        "linkedin": f"{first.lower()}{last.lower()}{rng.randint(1, 99)}",
+    }
+
+
+def _jobs(rng: random.Random, count: int, bullets: int, style: str) -> list[str]:
+    lines = []
+    year = 2024
+    for _ in range(count):
+        start = year - rng.randint(1, 4)
+        if style == "linkedin":
+            lines += [rng.choice(COMPANIES), rng.choice(TITLES)]
+            lines.append(f"January {start} - December {year} ({year - start} years)")
+        else:
+            lines.append(f"{rng.choice(COMPANIES)} | {rng.choice(TITLES)} | {start} - {year}")
+        lines += [f"• {_bullet(rng)}" for _ in range(bullets)]
+        year = start
+    return lines
+
+
+def _linkedin(rng: random.Random) -> tuple[list[str], None]:
+    p = _person(rng)
+    lines = [
+        "Contact",
+        p["email"],
+        f"www.linkedin.com/in/{p['linkedin']} (LinkedIn)",
+        "Top Skills",
+        *rng.sample(SKILLS, 3),
+        "Honors-Awards",
+        *rng.sample(AWARDS, 2),
+        p["name"],
+        f"{p['title']} at {rng.choice(COMPANIES)}",
+        f"Greater {p['city'].split(',')[0]} Area",
+        "Summary",
+        "Engineer focused on reliable distributed systems and growing strong teams.",
+        "Experience",
+        *_jobs(rng, rng.randint(4, 7), rng.randint(3, 5), "linkedin"),
+        "Education",
+        "State University",
+        "Bachelor of Science, Computer Science",
+    ]
+    return lines, None
+
+
+def _traditional(rng: random.Random) -> tuple[list[str], None]:
+    p = _person(rng)
+    lines = [
+        p["name"].upper(),
+        f"{p['title']} | Cloud / Platform",
+        f"{p['phone']} | {p['email']} | linkedin.com/in/{p['linkedin']}",
+        p["city"],
+        "PROFESSIONAL SUMMARY",
+        "Engineer with over ten years of experience shipping customer-facing products.",
+        "EXPERIENCE",
+        *_jobs(rng, rng.randint(3, 6), rng.randint(3, 5), "traditional"),
+        "SKILLS",
+        ", ".join(rng.sample(SKILLS, 5)),
+        "AWARDS",
+        *rng.sample(AWARDS, 2),
+        "EDUCATION",
+        "B.S. Computer Science, State University",
+    ]
+    return lines, None
+
+
+def _academic(rng: random.Random) -> tuple[list[str], None]:
+    p = _person(rng)
+    lines = [
+        "Curriculum Vitae",
+        p["name"],
+        "Professor of Computer Science",
+        p["email"],
+        p["city"],
+        "Summary",
+        "Research in distributed systems, databases and machine learning systems.",
+        "Experience",
+        *_jobs(rng, 4, 3, "traditional"),
+        "Publications",
+    ]
+    for number in range(rng.randint(800, 900)):
+        authors = ", ".join(
+            f"{rng.choice(LAST_NAMES)}, {rng.choice(FIRST_NAMES)[0]}." for _ in range(3)
+        )
+        lines.append(
+            f"[{number + 1}] {authors} ({rng.randint(1998, 2024)}). On {rng.choice(OBJECTS)}. "
+            f"Proceedings of the {rng.randint(10, 50)}th Conference, pp. {rng.randint(1, 900)}."
+        )
+    lines += ["Grants", *(f"NSF Award {rng.randint(100000, 999999)}" for _ in range(12))]
+    lines += ["Awards", *rng.sample(AWARDS, 3), "Teaching", "Distributed Systems (CS 512)"]
+    return lines, None
+
+
+def _fill(page, rect: "fitz.Rect", lines: list[str], fontsize: float) -> int:
+    """Write as many of ``lines`` as fit into ``rect``; return how many."""
+    # insert_textbox writes nothing when the text overflows; binary search for
+    # the largest prefix that fits on a scratch page, then write it for real.
+    scratch = fitz.open().new_page()
+    low, high = 0, min(len(lines), int(rect.height // fontsize))
+    while low < high:
+        middle = (low + high + 1) // 2
+        if scratch.insert_textbox(rect, "\n".join(lines[:middle]), fontsize=fontsize) < 0:
+            high = middle - 1
+        else:
+            low = middle
+    if low:
+        page.insert_textbox(rect, "\n".join(lines[:low]), fontsize=fontsize)
+    return low
+
+
+def _write(path: str, main: list[str], sidebar: list[str] | None = None) -> None:
+    """Flow ``main`` over as many pages as needed, beside ``sidebar`` if given."""
+    doc = fitz.open()
+    main_rect = fitz.Rect(40, 40, 560, 800) if sidebar is None else fitz.Rect(190, 40, 570, 800)
+    while main:
+        page = doc.new_page()
+        if sidebar:
+            sidebar = sidebar[_fill(page, fitz.Rect(30, 40, 170, 800), sidebar, 8) :]
+        written = _fill(page, main_rect, main, 9)
+        if not written:
+            raise ValueError(f"line does not fit on a page: {main[0]!r}")
+        main = main[written:]
+    doc.save(path, garbage=3, deflate=True, no_new_id=True)
+
+
+def _multicolumn(rng: random.Random) -> tuple[list[str], list[str]]:
+    p = _person(rng)
+    sidebar = [
+        "Contact",
+        p["phone"],
+        p["email"],
+        f"linkedin.com/in/{p['linkedin']}",
+        "Skills",
+        *rng.sample(SKILLS, 5),
+        "Awards",
+        *rng.sample(AWARDS, 2),
+    ]
+    main = [
+        p["name"],
+        p["title"],
+        p["city"],
+        "Summary",
+        "Hands-on leader who builds platforms, teams and measurable outcomes.",
+        "Experience",
+        *_jobs(rng, rng.randint(3, 4), 3, "traditional"),
+    ]
+    return main, sidebar
+
+
+_BUILDERS = {
+    "linkedin": _linkedin,
+    "traditional": _traditional,
+    "multicolumn": _multicolumn,
+    "academic": _academic,
+}
+
+
+def build_corpus(directory: str, per_style: int = 5, seed: int = 0) -> list[str]:
+    """Write ``per_style`` PDFs of every style to ``directory``; return their paths."""
+    os.makedirs(directory, exist_ok=True)
+    paths = []
+    for style in STYLES:
+        for number in range(per_style):
+            rng = random.Random(f"{seed}-{style}-{number}")
+            path = os.path.join(directory, f"{style}-{number:02d}.pdf")
+            _write(path, *_BUILDERS[style](rng))
+            paths.append(path)
+    return paths
+
+
+def style_of(path: str) -> str:
+    return os.path.basename(path).split("-")[0]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("output", help="directory to write the PDFs to")
+    parser.add_argument("--per-style", type=int, default=5, help="PDFs per layout")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    paths = build_corpus(args.output, args.per_style, args.seed)
+    print(f"Wrote {len(paths)} PDFs to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+"""
+Load test of the HTTP parsing service (``resume_parser.server``).
+
+Starts a ``ParseServer`` on a free local port (or targets ``--url``), then
+posts the PDFs of the synthetic corpus from ``--clients`` concurrent
+keep-alive connections until ``--requests`` uploads have been answered.
+Reports requests per second and client-side latency percentiles, plus the
+server's own ``/latency`` figures (including the mean batch size). With
+``--compare`` the run is repeated with ``--max-batch 1`` (no micro-batching)
+first. Nothing outside this machine is used.
+
+Usage:
+    python benchmarks/load_test.py [--clients 16] [--requests 400] [--workers 2]
+        [--max-batch 8] [--max-wait-ms 10] [--compare] [--url http://host:port]
+"""
+
+import argparse
+import asyncio
+import glob
+import http.client
+import json
+import logging
+import os
+import sys
+import threading
+import time
+import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from corpus import build_corpus
+
+from resume_parser.server import ParseServer
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+
+class BackgroundServer:
+    """Run a ``ParseServer`` on an event loop in a background thread."""
+
+    def __init__(self, server: ParseServer):
+        self.server = server
+        self._ready = threading.Event()
+        self._thread = threading.Thread(target=asyncio.run, args=(self._main(),), daemon=True)
+
+    async def _main(self):
+        self._loop = asyncio.get_running_loop()
+        self._stop = asyncio.Event()
+        async with self.server:
+            self._ready.set()
+            await self._stop.wait()
+
+    def __enter__(self) -> ParseServer:
+        self._thread.start()
+        self._ready.wait()
+        return self.server
+
+    def __exit__(self, *exc_info) -> None:
+        self._loop.call_soon_threadsafe(self._stop.set)
+        self._thread.join()
+
+
+def _get(host: str, port: int, path: str) -> dict:
+    conn = http.client.HTTPConnection(host, port, timeout=60)
+    conn.request("GET", path)
+    return json.loads(conn.getresponse().read())
+
+
+def run_load(host: str, port: int, pdfs: list[bytes], clients: int, requests: int) -> dict:
+    """Post ``requests`` uploads from ``clients`` connections; return the figures."""
+    counter = iter(range(requests))
+    lock = threading.Lock()
+    latencies = []
+    statuses = {}
+
+    def client():
+        conn = http.client.HTTPConnection(host, port, timeout=120)
+        while True:
+            with lock:
+                i = next(counter, None)
+            if i is None:
+                break
+            start = time.perf_counter()
+            conn.request(
+                "POST",
+                "/parse",
+                body=pdfs[i % len(pdfs)],
+                headers={"Content-Type": "application/pdf"},
+            )
+            response = conn.getresponse()
+            response.read()
+            if response.getheader("Connection") == "close":
+                conn.close()
+            with lock:
+                latencies.append(time.perf_counter() - start)
+                statuses[response.status] = statuses.get(response.status, 0) + 1
+        conn.close()
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(clients) as executor:
+        for future in [executor.submit(client) for _ in range(clients)]:
+            future.result()
+    elapsed = time.perf_counter() - start
+    latencies.sort()
+
+    def ms(share):
+        return latencies[max(0, int(share * len(latencies)) - 1)] * 1000
+
+    return {
+        "requests": len(latencies),
+        "statuses": statuses,
+        "requests_per_second": len(latencies) / elapsed,
+        "p50_ms": ms(0.5),
+        "p90_ms": ms(0.9),
+        "p99_ms": ms(0.99),
+        "server": _get(host, port, "/latency"),
+    }
+
+
+def _report(label: str, figures: dict) -> None:
+    server = figures["server"]
+    print(
+        f"{label:<14} {figures['requests_per_second']:>8.1f} req/s  "
+        f"p50 {figures['p50_ms']:>7.1f} ms  p90 {figures['p90_ms']:>7.1f} ms  "
+        f"p99 {figures['p99_ms']:>7.1f} ms  batch {server['mean_batch_size']:>4.1f}  "
+        f"statuses {figures['statuses']}"
+    )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("paths", nargs="*", help="PDFs to upload (default: synthetic corpus)")
+    parser.add_argument(
+        "--corpus", default=os.path.join(HERE, ".corpus"), help="corpus cache directory"
+    )
+    parser.add_argument("--per-style", type=int, default=5, help="PDFs per layout")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--clients", type=int, default=16, help="concurrent connections")
+    parser.add_argument("--requests", type=int, default=400, help="uploads per run")
+    parser.add_argument("--workers", type=int, default=2, help="server worker processes")
+    parser.add_argument("--max-batch", type=int, default=8)
+    parser.add_argument("--max-wait-ms", type=float, default=10.0)
+    parser.add_argument("--profile", choices=("full", "fast"), default="full")
+    parser.add_argument("--compare", action="store_true", help="also run with --max-batch 1")
+    parser.add_argument("--url", help="load an already running server instead")
+    parser.add_argument("--json", help="also write the figures to this file")
+    args = parser.parse_args()
+
+    logging.getLogger("resume_parser").setLevel(logging.ERROR)
+    paths = args.paths
+    if not paths:
+        corpus_dir = os.path.join(args.corpus, f"seed{args.seed}-n{args.per_style}")
+        if not os.path.isdir(corpus_dir):
+            build_corpus(corpus_dir, args.per_style, args.seed)
+        # The 20+ page academic CVs would dominate; upload the one-page layouts.
+        paths = sorted(
+            path
+            for path in glob.glob(os.path.join(corpus_dir, "*.pdf"))
+            if not os.path.basename(path).startswith("academic")
+        )
+    pdfs = []
+    for path in paths:
+        with open(path, "rb") as f:
+            pdfs.append(f.read())
+
+    figures = {}
+    if args.url:
+        url = urllib.parse.urlsplit(args.url)
+        figures["server"] = run_load(url.hostname, url.port, pdfs, args.clients, args.requests)
+        _report("server", figures["server"])
+    else:
+        batches = ([1] if args.compare else []) + [args.max_batch]
+        for max_batch in batches:
+            server = ParseServer(
+                port=0,
+                workers=args.workers,
+                max_batch=max_batch,
+                max_wait=args.max_wait_ms / 1000,
+                max_queue=max(256, args.clients),
+                profile=args.profile,
+            )
+            with BackgroundServer(server):
+                label = f"max_batch={max_batch}"
+                figures[label] = run_load(
+                    "127.0.0.1", server.port, pdfs, args.clients, args.requests
+                )
+                _report(label, figures[label])
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(figures, f, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
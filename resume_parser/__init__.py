@@ -4,6 +4,100 @@ Resume Parser
 Extract structured information from PDF resumes using NLP and pattern matching
 """
 
-__version__ = "0.1.0"
+__version__ = "0.2.0"
 __author__ = "Rahul Bagai"
 
+from .aio import AsyncResumeParser, aparse_resume, aparse_resumes
+from .bulk import BulkReport, FileResult, parse_resumes_parallel
+from .cache import ResultCache
+from .docstore import DocStore
+from .document import ResumeDocument
+from .facts import LineFactsCache, line_facts_cache
+from .limits import Limits
+from .metrics import ParseMetrics
+from .model import configure_model, download_model, ensure_spacy_model, get_nlp
+from .results import (
+    Achievement,
+    Award,
+    ParsedResume,
+    SectionSpan,
+    decode_results,
+    encode_results,
+    to_arrow,
+    to_columns,
+)
+from .resume_parser import (
+    FIELDS,
+    HEADER_FIELDS,
+    PROFILES,
+    clean_text,
+    extract_achievements,
+    extract_awards_and_honors,
+    extract_email,
+    extract_linkedin,
+    extract_location,
+    extract_name,
+    extract_phone,
+    extract_role,
+    extract_sections,
+    extract_summary,
+    extract_text_from_pdf,
+    parse_resume,
+    parse_resume_header,
+    parse_resumes,
+)
+from .revisions import RevisionStore
+from .server import ParseServer
+from .stores import Stores
+from .stream import FieldUpdate, iter_resume_fields
+
+__all__ = [
+    "FIELDS",
+    "HEADER_FIELDS",
+    "PROFILES",
+    "Achievement",
+    "AsyncResumeParser",
+    "Award",
+    "BulkReport",
+    "DocStore",
+    "FieldUpdate",
+    "FileResult",
+    "Limits",
+    "LineFactsCache",
+    "ParseMetrics",
+    "ParseServer",
+    "ParsedResume",
+    "ResultCache",
+    "ResumeDocument",
+    "RevisionStore",
+    "SectionSpan",
+    "Stores",
+    "aparse_resume",
+    "aparse_resumes",
+    "clean_text",
+    "configure_model",
+    "decode_results",
+    "download_model",
+    "encode_results",
+    "ensure_spacy_model",
+    "extract_achievements",
+    "extract_awards_and_honors",
+    "extract_email",
+    "extract_linkedin",
+    "extract_location",
+    "extract_name",
+    "extract_phone",
+    "extract_role",
+    "extract_sections",
+    "extract_summary",
+    "extract_text_from_pdf",
+    "get_nlp",
+    "iter_resume_fields",
+    "line_facts_cache",
+    "parse_resume",
+    "parse_resume_header",
+    "parse_resumes",
+    "parse_resumes_parallel",
+    "to_arrow",
+    "to_columns",
+]
@@ -0,0 +1,234 @@
+"""Asyncio front end for use inside async web servers.
+
+The PyMuPDF and spaCy work runs on a thread or process executor so the event
+loop is never blocked. An :class:`AsyncResumeParser` caps the number of parses
+in flight; further calls wait for a slot (optionally up to ``max_pending``
+waiters, after which they are rejected) and each call can carry a timeout that
+covers both the wait and the parse.
+"""
+
+import asyncio
+import logging
+import os
+import weakref
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import TypeVar, cast
+
+from .bulk import _init_worker, _worker_initargs
+from .resume_parser import PROFILES, parse_resume
+from .sources import PdfSource, picklable
+from .stores import Stores
+
+logger = logging.getLogger(__name__)
+
+_Parser = TypeVar("_Parser", bound="AsyncResumeParser")
+
+
+class _Slots:
+    """Per-event-loop concurrency limit (asyncio primitives bind to one loop)."""
+
+    def __init__(self, size: int):
+        self.semaphore = asyncio.Semaphore(size)
+        self.waiting = 0
+        self.running = 0
+
+    def release(self) -> None:
+        self.running -= 1
+        self.semaphore.release()
+
+
+class AsyncResumeParser:
+    """Run ``parse_resume`` off the event loop with bounded concurrency.
+
+    ``executor`` is ``"thread"``, ``"process"`` or an existing
+    ``concurrent.futures.Executor``. Threads share one spaCy model but are
+    limited by the GIL; processes give CPU parallelism at the cost of one
+    model per worker and of copying in-memory PDFs to the worker.
+
+    ``stores``, ``metrics`` and ``profile`` are passed to every
+    ``parse_resume`` call.
+
+    Cancelling a call (or hitting its timeout) cancels the work if it has not
+    started. Work that is already running cannot be interrupted; its slot is
+    freed when it finishes, so ``max_concurrency`` always bounds real CPU use.
+    """
+
+    def __init__(
+        self,
+        executor: Executor | str = "thread",
+        max_concurrency: int | None = None,
+        max_pending: int | None = None,
+        stores: Stores | None = None,
+        metrics=None,
+        profile: str = "full",
+    ):
+        if profile not in PROFILES:
+            raise ValueError(f"Unknown profile {profile!r}; expected one of {PROFILES}")
+        self.max_concurrency = max_concurrency or os.cpu_count() or 1
+        self.max_pending = max_pending
+        self.stores = stores
+        self.metrics = metrics
+        self.profile = profile
+        self._owns_executor = isinstance(executor, str)
+        if executor == "thread":
+            executor = ThreadPoolExecutor(
+                max_workers=self.max_concurrency, thread_name_prefix="resume-parser"
+            )
+        elif executor == "process":
+            executor = ProcessPoolExecutor(
+                max_workers=self.max_concurrency,
+                initializer=_init_worker,
+                initargs=_worker_initargs(load=profile != "fast"),
+            )
+        elif isinstance(executor, str):
+            raise ValueError(
+                f"executor must be 'thread', 'process' or an Executor, not {executor!r}"
+            )
+        self.executor = executor
+        self._in_process = not isinstance(executor, ProcessPoolExecutor)
+        if metrics is not None and not self._in_process:
+            raise ValueError("metrics can only be recorded with a thread executor")
+        self._slots: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+    async def __aenter__(self: _Parser) -> _Parser:
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self, wait: bool = True) -> None:
+        """Shut down the executor if this parser created it."""
+        if self._owns_executor:
+            self.executor.shutdown(wait=wait, cancel_futures=True)
+
+    @property
+    def in_flight(self) -> int:
+        """Parses holding a slot on the running event loop."""
+        slots = self._slots.get(asyncio.get_running_loop())
+        return slots.running if slots else 0
+
+    @property
+    def pending(self) -> int:
+        """Calls waiting for a slot on the running event loop."""
+        slots = self._slots.get(asyncio.get_running_loop())
+        return slots.waiting if slots else 0
+
+    async def parse(self, source: PdfSource, timeout: float | None = None) -> dict:
+        """Parse one resume; raises ``asyncio.TimeoutError`` after ``timeout`` seconds.
+
+        Raises ``asyncio.QueueFull`` straight away when all slots are busy and
+        ``max_pending`` calls are already waiting.
+        """
+        return await asyncio.wait_for(self._parse(source), timeout)
+
+    async def parse_many(
+        self, sources, timeout: float | None = None, return_exceptions: bool = False
+    ) -> list:
+        """Parse an iterable (or async iterable) of sources, in input order.
+
+        Sources are pulled from the iterable only as slots free up, so a long
+        or unbounded input is never materialized as pending tasks. ``timeout``
+        applies to each file. With ``return_exceptions`` a failed file yields
+        its exception in place of the result; otherwise the first failure
+        cancels the remaining work and is raised.
+        """
+        window = asyncio.Semaphore(self.max_concurrency)
+        tasks = []
+
+        async def run(source):
+            try:
+                return await self.parse(source, timeout)
+            finally:
+                window.release()
+
+        try:
+            async for source in _aiter(sources):
+                await window.acquire()
+                tasks.append(asyncio.ensure_future(run(source)))
+                if not return_exceptions and any(_failed(t) for t in tasks):
+                    break
+            return await asyncio.gather(*tasks, return_exceptions=return_exceptions)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+
+    async def _parse(self, source: PdfSource) -> dict:
+        loop = asyncio.get_running_loop()
+        slots = self._slots.get(loop)
+        if slots is None:
+            slots = self._slots[loop] = _Slots(self.max_concurrency)
+        if (
+            self.max_pending is not None
+            and slots.semaphore.locked()
+            and slots.waiting >= self.max_pending
+        ):
+            raise asyncio.QueueFull(f"{slots.waiting} parses already waiting for a slot")
+        slots.waiting += 1
+        try:
+            await slots.semaphore.acquire()
+        finally:
+            slots.waiting -= 1
+        slots.running += 1
+        try:
+            future = self.executor.submit(
+                parse_resume, self._prepare(source), self.stores, self.metrics, profile=self.profile
+            )
+        except BaseException:
+            slots.release()
+            raise
+        future.add_done_callback(lambda _: _release_threadsafe(loop, slots))
+        return cast(dict, await asyncio.wrap_future(future, loop=loop))
+
+    def _prepare(self, source: PdfSource) -> PdfSource:
+        # Buffers and open files cannot be pickled; send the bytes instead.
+        return source if self._in_process else picklable(source)
+
+
+def _release_threadsafe(loop: asyncio.AbstractEventLoop, slots: _Slots) -> None:
+    try:
+        loop.call_soon_threadsafe(slots.release)
+    except RuntimeError:
+        # The loop has been closed; nothing is waiting on it any more.
+        pass
+
+
+def _failed(task: asyncio.Task) -> bool:
+    return task.done() and not task.cancelled() and task.exception() is not None
+
+
+async def _aiter(sources):
+    if hasattr(sources, "__aiter__"):
+        async for source in sources:
+            yield source
+    else:
+        for source in sources:
+            yield source
+
+
+_default_parser = None
+
+
+def _default() -> AsyncResumeParser:
+    global _default_parser
+    if _default_parser is None:
+        _default_parser = AsyncResumeParser()
+    return _default_parser
+
+
+async def aparse_resume(
+    source: PdfSource, timeout: float | None = None, parser: AsyncResumeParser | None = None
+) -> dict:
+    """Async ``parse_resume`` on a shared thread pool (or the given ``parser``)."""
+    return await (parser or _default()).parse(source, timeout)
+
+
+async def aparse_resumes(
+    sources,
+    timeout: float | None = None,
+    return_exceptions: bool = False,
+    parser: AsyncResumeParser | None = None,
+) -> list:
+    """Async ``parse_resumes``; see :meth:`AsyncResumeParser.parse_many`."""
+    return await (parser or _default()).parse_many(sources, timeout, return_exceptions)
@@ -0,0 +1,323 @@
+"""Multi-process bulk parsing.
+
+Files are split into chunks and each chunk is parsed by a worker process with
+``parse_resumes``, so spaCy work inside a chunk goes through ``nlp.pipe``. The
+model is loaded once per worker, or once in the parent before forking so the
+workers share its memory pages copy-on-write.
+"""
+
+import collections
+import gc
+import itertools
+import logging
+import multiprocessing
+import os
+import sqlite3
+import time
+from collections.abc import Callable, Iterator, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+
+from .limits import run_sandboxed
+from .model import configure_model, get_nlp, is_injected, model_name
+from .resume_parser import (
+    _cache_config,
+    _cache_lookup,
+    _cacheable,
+    _parse_loaded,
+    _parse_texts,
+    _plan,
+    _read_document,
+    _read_stored,
+    _store_pipeline,
+    _using_profile,
+    _using_revisions,
+)
+from .sources import PdfSource, describe, load_source, picklable
+from .stores import Stores
+
+logger = logging.getLogger(__name__)
+
+# What reading, caching or parsing one file may raise (PyMuPDF and the
+# sandbox raise RuntimeError); such a file fails alone.
+_FILE_ERRORS = (OSError, RuntimeError, TypeError, ValueError, LookupError, sqlite3.Error)
+
+
+@dataclass
+class FileResult:
+    """Outcome of parsing one file. ``data`` is None when the parse failed.
+
+    ``path`` is the file's path, or a short description of an in-memory source.
+    """
+
+    path: str
+    data: dict | None
+    error: str | None = None
+    seconds: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+@dataclass
+class BulkReport:
+    """Results in input order plus throughput figures for the run."""
+
+    results: list[FileResult] = field(default_factory=list)
+    elapsed: float = 0.0
+    workers: int = 1
+
+    @property
+    def failures(self) -> list[FileResult]:
+        return [r for r in self.results if not r.ok]
+
+    @property
+    def files_per_second(self) -> float:
+        return len(self.results) / self.elapsed if self.elapsed else 0.0
+
+    def summary(self) -> str:
+        return (
+            f"Parsed {len(self.results)} files in {self.elapsed:.2f}s "
+            f"({self.files_per_second:.1f} files/s, {self.workers} workers, "
+            f"{len(self.failures)} failed)"
+        )
+
+
+def _init_worker(model, load: bool = True) -> None:
+    if model is not None:
+        configure_model(model)
+    if load:
+        get_nlp()
+
+
+def _worker_initargs(context=None, load: bool = True) -> tuple[str | None, bool]:
+    """``_init_worker`` arguments for a pool started with ``context`` (None
+    for the default start method).
+
+    Workers load the configured model by name. A pipeline injected with
+    ``configure_model(nlp)`` has no name: forked workers inherit it, other
+    start methods would silently fall back to the packaged model, so they
+    are refused.
+    """
+    if not is_injected():
+        return model_name(), load
+    start_method = (context or multiprocessing.get_context()).get_start_method()
+    if start_method != "fork":
+        raise ValueError(
+            f"A pipeline injected with configure_model() cannot be used by {start_method!r} "
+            "worker processes; configure a model name or path instead"
+        )
+    return None, False
+
+
+def _parse_chunk(
+    paths: Sequence[PdfSource],
+    stores: Stores | None = None,
+    fields=None,
+    layout: bool = False,
+    profile: str = "full",
+    limits=None,
+) -> list[FileResult]:
+    stores = stores or Stores()
+    with _using_profile(profile), _using_revisions(stores.revisions):
+        return _parse_paths(paths, stores, fields, layout, profile, limits)
+
+
+def _parse_paths(
+    paths: Sequence[PdfSource], stores: Stores, fields, layout, profile, limits=None
+) -> list[FileResult]:
+    cache, doc_store = stores.cache, stores.docs
+    start = time.perf_counter()
+    config = _cache_config(fields, layout, profile, limits)
+    nlp = _store_pipeline(doc_store, _plan(fields))
+    sandboxed = limits is not None and limits.sandboxed
+    datas = []
+    keys = []
+    errors = []
+    texts = {}
+    entries = {}
+    for i, path in enumerate(paths):
+        error = None
+        try:
+            source = load_source(path, read_path=cache is not None or nlp is not None)
+            key, data = _cache_lookup(cache, source, config)
+            if data is None and sandboxed:
+                options = (fields, layout, profile, stores, limits)
+                data = run_sandboxed(_parse_loaded, (source, *options), limits)
+                if cache is not None and key and _cacheable(data):
+                    cache.put(key, data)
+            elif data is None and nlp is None:
+                texts[i] = _read_document(source, layout, limits)
+            elif data is None:
+                texts[i], entries[i] = _read_stored(source, layout, doc_store, nlp, limits)
+        except _FILE_ERRORS as e:
+            key, data = None, None
+            error = f"{type(e).__name__}: {e}"
+        datas.append(data)
+        keys.append(key)
+        errors.append(error)
+    todo = [i for i in texts if errors[i] is None]
+    parsed: Sequence[dict | None]
+    try:
+        parsed = _parse_texts(
+            [texts[i] for i in todo], fields, doc_store, [entries.get(i) for i in todo], limits
+        )
+    except _FILE_ERRORS:
+        # Retry one by one so a single bad document cannot fail its chunk.
+        logger.exception("Batch parse failed, retrying files individually")
+        retried: list[dict | None] = []
+        for i in todo:
+            try:
+                retried.append(
+                    _parse_texts([texts[i]], fields, doc_store, [entries.get(i)], limits)[0]
+                )
+            except _FILE_ERRORS as e:
+                retried.append(None)
+                errors[i] = f"{type(e).__name__}: {e}"
+        parsed = retried
+    for i, data in zip(todo, parsed):
+        datas[i] = data
+        key = keys[i]
+        if cache is not None and key and data is not None and _cacheable(data):
+            cache.put(key, data)
+    per_file = (time.perf_counter() - start) / max(len(paths), 1)
+    results = []
+    for path, data, error in zip(paths, datas, errors):
+        status = (data or {}).get("status", {})
+        if error is None and (not data or status.get("state") == "empty"):
+            error = "No text extracted"
+        elif error is None and status.get("state") == "aborted":
+            error = f"Aborted: {', '.join(status['reasons'])}"
+        results.append(FileResult(describe(path), data if error is None else None, error, per_file))
+    return results
+
+
+def _chunks(items, size: int):
+    iterator = iter(items)
+    while chunk := list(itertools.islice(iterator, size)):
+        yield chunk
+
+
+def iter_resumes_parallel(
+    file_paths,
+    workers: int | None = None,
+    chunksize: int = 16,
+    preload: bool = True,
+    stores: Stores | None = None,
+    fields=None,
+    layout: bool = False,
+    profile: str = "full",
+    limits=None,
+) -> Iterator[FileResult]:
+    """Yield a ``FileResult`` per file, in input order, as soon as it is ready.
+
+    ``file_paths`` may be any iterable and is consumed lazily: at most two
+    chunks per worker are queued at a time, so memory does not grow with the
+    number of files. Otherwise behaves like ``parse_resumes_parallel``.
+    """
+    paths: Iterator[PdfSource] = iter(file_paths)
+    workers = workers or os.cpu_count() or 1
+    # Look ahead far enough to not start more workers than there are chunks.
+    head = list(itertools.islice(paths, workers * chunksize))
+    workers = max(1, min(workers, -(-len(head) // chunksize)))
+    paths = itertools.chain(head, paths)
+    options = (stores, fields, layout, profile, limits)
+    # The fast profile never loads (or imports) spaCy.
+    load = profile != "fast"
+    start = time.perf_counter()
+    done = 0
+    if workers == 1:
+        if load:
+            get_nlp()
+        for chunk in _chunks(paths, chunksize):
+            yield from _parse_chunk(chunk, *options)
+        return
+    use_fork = preload and "fork" in multiprocessing.get_all_start_methods()
+    initializer: Callable[..., None] | None = None
+    initargs: tuple = ()
+    context = None
+    if use_fork:
+        if load:
+            get_nlp()
+        # Keep the preloaded model out of the cyclic GC so collections in the
+        # children do not touch (and copy) its pages.
+        gc.freeze()
+        context = multiprocessing.get_context("fork")
+    else:
+        initializer, initargs = _init_worker, _worker_initargs(context, load)
+    try:
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=context,
+            initializer=initializer,
+            initargs=initargs,
+        ) as executor:
+            chunks = _chunks(map(picklable, paths), chunksize)
+            pending = collections.deque(
+                executor.submit(_parse_chunk, chunk, *options)
+                for chunk in itertools.islice(chunks, 2 * workers)
+            )
+            try:
+                while pending:
+                    results = pending.popleft().result()
+                    for chunk in itertools.islice(chunks, 1):
+                        pending.append(executor.submit(_parse_chunk, chunk, *options))
+                    yield from results
+                    done += len(results)
+                    rate = done / (time.perf_counter() - start)
+                    logger.info(f"Parsed {done} files ({rate:.1f} files/s)")
+            finally:
+                # Stopped early (consumer closed the generator or an error).
+                for future in pending:
+                    future.cancel()
+    finally:
+        if use_fork:
+            gc.unfreeze()
+
+
+def parse_resumes_parallel(
+    file_paths,
+    workers: int | None = None,
+    chunksize: int = 16,
+    preload: bool = True,
+    stores: Stores | None = None,
+    fields=None,
+    layout: bool = False,
+    profile: str = "full",
+    limits=None,
+) -> BulkReport:
+    """Parse many PDFs with a pool of worker processes.
+
+    ``workers`` defaults to the CPU count; ``workers=1`` parses in-process.
+    With ``preload`` the spaCy model is loaded in the parent and the pool is
+    forked (where available) so workers share it instead of reloading it.
+    Results keep input order and a failing file never fails the run. The
+    ``stores`` are shared by all workers. ``stores``, ``fields``, ``layout``,
+    ``profile`` and ``limits`` are as for ``parse_resume``; a file aborted by a
+    limit is reported as failed.
+
+    ``file_paths`` may also hold the in-memory sources ``parse_resume``
+    accepts; worker processes are sent a copy of buffers and streams.
+    """
+    paths = list(file_paths)
+    workers = workers or os.cpu_count() or 1
+    workers = max(1, min(workers, -(-len(paths) // chunksize) or 1))
+    report = BulkReport(workers=workers)
+    start = time.perf_counter()
+    report.results.extend(
+        iter_resumes_parallel(
+            paths,
+            workers,
+            chunksize,
+            preload,
+            stores,
+            fields,
+            layout,
+            profile,
+            limits,
+        )
+    )
+    report.elapsed = time.perf_counter() - start
+    logger.info(report.summary())
+    return report
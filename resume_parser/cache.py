@@ -0,0 +1,161 @@
+"""Content-addressed on-disk cache of parse results.
+
+Results are keyed by a SHA-256 of the PDF bytes together with the parser
+version and configuration, and stored in a SQLite file that several processes
+can share. When the store grows past ``max_bytes`` the least recently used
+entries are evicted. The storage itself (``BlobStore``) is also used by the
+stores in ``resume_parser.docstore`` and ``resume_parser.revisions``; each
+store needs its own file.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+
+from . import __version__
+from .model import model_id
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    key TEXT PRIMARY KEY,
+    value BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    accessed REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS results_accessed ON results (accessed);
+"""
+
+
+class BlobStore:
+    """SQLite-backed LRU store of binary values by key.
+
+    Safe to share between threads and processes: each thread of each process
+    opens its own connection, the database runs in WAL mode and writers wait
+    up to ``timeout`` seconds for a lock. ``hits`` and ``misses`` count lookups
+    made through this instance.
+    """
+
+    def __init__(self, path: str, max_bytes: int = 512 * 1024 * 1024, timeout: float = 30.0):
+        self.path = os.fspath(path)
+        self.max_bytes = max_bytes
+        self.timeout = timeout
+        self.hits = 0
+        self.misses = 0
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._connect()
+
+    def __getstate__(self):
+        # Connections cannot cross process boundaries; reopen after unpickling.
+        state = self.__dict__.copy()
+        del state["_local"], state["_lock"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._local = threading.local()
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn: sqlite3.Connection | None = getattr(self._local, "conn", None)
+        if conn is not None and self._local.pid == os.getpid():
+            return conn
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        conn = sqlite3.connect(self.path, timeout=self.timeout, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.executescript(_SCHEMA)
+        self._local.conn = conn
+        self._local.pid = os.getpid()
+        return conn
+
+    def _get_blob(self, key: str) -> bytes | None:
+        conn = self._connect()
+        row = conn.execute("SELECT value FROM results WHERE key = ?", (key,)).fetchone()
+        with self._lock:
+            if row is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        if row is None:
+            return None
+        conn.execute("UPDATE results SET accessed = ? WHERE key = ?", (time.time(), key))
+        blob: bytes = row[0]
+        return blob
+
+    def _put_blob(self, key: str, blob: bytes) -> None:
+        conn = self._connect()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            conn.execute(
+                "INSERT OR REPLACE INTO results (key, value, size, accessed) VALUES (?, ?, ?, ?)",
+                (key, blob, len(blob), time.time()),
+            )
+            self._evict(conn)
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+
+    def _evict(self, conn: sqlite3.Connection) -> None:
+        (total,) = conn.execute("SELECT COALESCE(SUM(size), 0) FROM results").fetchone()
+        if total <= self.max_bytes:
+            return
+        evicted = conn.execute(
+            """
+            DELETE FROM results WHERE key IN (
+                SELECT key FROM (
+                    SELECT key, SUM(size) OVER (ORDER BY accessed DESC, key) AS running
+                    FROM results
+                ) WHERE running > ?
+            )
+            """,
+            (self.max_bytes,),
+        ).rowcount
+        logger.info(f"Evicted {evicted} cached entries to stay under {self.max_bytes} bytes")
+
+    def stats(self) -> dict[str, int]:
+        entries, size = (
+            self._connect()
+            .execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM results")
+            .fetchone()
+        )
+        return {"hits": self.hits, "misses": self.misses, "entries": entries, "bytes": size}
+
+    def clear(self) -> None:
+        self._connect().execute("DELETE FROM results")
+
+    def close(self) -> None:
+        conn = getattr(self._local, "conn", None)
+        if conn is not None and self._local.pid == os.getpid():
+            conn.close()
+        self._local.conn = None
+
+
+class ResultCache(BlobStore):
+    """LRU cache of ``parse_resume`` results in a ``BlobStore``."""
+
+    @staticmethod
+    def key_for(pdf_bytes: bytes | memoryview, config: dict | None = None) -> str:
+        """Return the cache key for a PDF under the current parser configuration."""
+        digest = hashlib.sha256()
+        fingerprint = {"version": __version__, "model": model_id(), **(config or {})}
+        digest.update(json.dumps(fingerprint, sort_keys=True).encode("utf-8"))
+        digest.update(b"\0")
+        digest.update(pdf_bytes)
+        return digest.hexdigest()
+
+    def get(self, key: str) -> dict | None:
+        blob = self._get_blob(key)
+        return None if blob is None else json.loads(blob)
+
+    def put(self, key: str, value: dict) -> None:
+        self._put_blob(key, json.dumps(value, ensure_ascii=False).encode("utf-8"))
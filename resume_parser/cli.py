@@ -0,0 +1,143 @@
+"""Command line interface: ``resume-parser``."""
+
+import argparse
+import logging
+import sys
+
+from .cache import ResultCache
+from .docstore import DocStore
+from .ingest import ingest, iter_pdf_paths
+from .limits import Limits
+from .model import configure_model
+from .resume_parser import FIELDS, PROFILES
+from .stores import Stores
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="resume-parser",
+        description="Extract structured information from PDF resumes.",
+    )
+    parser.add_argument("paths", nargs="*", help="PDF files, directories of PDFs or glob patterns")
+    parser.add_argument(
+        "--manifest", help="file listing one PDF path per line ('-' for standard input)"
+    )
+    parser.add_argument("-o", "--output", help="write JSON lines here instead of standard output")
+    parser.add_argument(
+        "--checkpoint",
+        help="record finished files here and skip them when the run is restarted "
+        "(requires --output)",
+    )
+    parser.add_argument(
+        "--retry-failed",
+        action="store_true",
+        help="parse files that failed in the checkpointed run again",
+    )
+    parser.add_argument(
+        "-w", "--workers", type=int, default=None, help="worker processes (default: CPUs)"
+    )
+    parser.add_argument(
+        "--chunksize", type=int, default=16, help="files handed to a worker at a time"
+    )
+    parser.add_argument(
+        "--fields",
+        type=lambda value: value.split(","),
+        help=f"comma-separated fields to extract (default: all of {','.join(FIELDS)})",
+    )
+    parser.add_argument(
+        "--layout",
+        action="store_true",
+        help="use font sizes and positions (name, section headers, columns)",
+    )
+    parser.add_argument(
+        "--profile",
+        choices=PROFILES,
+        default="full",
+        help="'fast' skips spaCy entirely and uses the rule-based extractors (default: full)",
+    )
+    parser.add_argument("--max-pages", type=int, help="read at most this many pages per PDF")
+    parser.add_argument("--max-chars", type=int, help="read at most this many characters per PDF")
+    parser.add_argument("--max-lines", type=int, help="parse at most this many lines per PDF")
+    parser.add_argument(
+        "--timeout", type=float, help="abort a PDF after this many seconds (own process)"
+    )
+    parser.add_argument(
+        "--max-memory", type=int, help="abort a PDF using more than this many MiB (own process)"
+    )
+    parser.add_argument("--model", help="spaCy model name or path")
+    parser.add_argument("--cache", help="SQLite file for the content-addressed result cache")
+    parser.add_argument(
+        "--doc-store",
+        help="SQLite file keeping the extracted text and spaCy docs, so re-runs skip them",
+    )
+    parser.add_argument(
+        "--cache-size",
+        type=int,
+        default=512,
+        help="size limit of the cache and of the doc store in MiB (default: 512)",
+    )
+    parser.add_argument(
+        "--no-preload",
+        action="store_true",
+        help="load the model in each worker instead of once before forking",
+    )
+    parser.add_argument("-v", "--verbose", action="store_true", help="log progress")
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if not args.paths and args.manifest is None:
+        parser.error("give PDF paths or --manifest")
+    if args.checkpoint and not args.output:
+        parser.error("--checkpoint requires --output")
+    if args.fields and not set(args.fields) <= set(FIELDS):
+        parser.error(f"--fields must be some of {','.join(FIELDS)}")
+    logging.basicConfig(
+        level=logging.INFO if args.verbose else logging.WARNING,
+        format="%(asctime)s %(levelname)s %(name)s: %(message)s",
+    )
+    if args.model:
+        configure_model(args.model)
+    cache = None
+    if args.cache:
+        cache = ResultCache(args.cache, max_bytes=args.cache_size * 1024 * 1024)
+    limits = None
+    if any(
+        value is not None
+        for value in (args.max_pages, args.max_chars, args.max_lines, args.timeout, args.max_memory)
+    ):
+        try:
+            limits = Limits(
+                max_pages=args.max_pages,
+                max_chars=args.max_chars,
+                max_lines=args.max_lines,
+                timeout=args.timeout,
+                max_memory=None if args.max_memory is None else args.max_memory * 1024 * 1024,
+            )
+        except ValueError as e:
+            parser.error(str(e))
+    doc_store = None
+    if args.doc_store:
+        doc_store = DocStore(args.doc_store, max_bytes=args.cache_size * 1024 * 1024)
+    report = ingest(
+        iter_pdf_paths(args.paths, args.manifest),
+        output=args.output or "-",
+        checkpoint=args.checkpoint,
+        workers=args.workers,
+        chunksize=args.chunksize,
+        preload=not args.no_preload,
+        stores=Stores(cache=cache, docs=doc_store),
+        fields=args.fields,
+        layout=args.layout,
+        profile=args.profile,
+        limits=limits,
+        retry_failed=args.retry_failed,
+    )
+    print(report.summary(), file=sys.stderr)
+    return 1 if report.failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,65 @@
+"""On-disk store of the spaCy analyses made while parsing.
+
+Re-parsing an archive after changing the extraction rules spends most of its
+time in spaCy, although the texts it analyses (the first 2000 characters and
+the name and achievement candidate lines) mostly do not change. A
+:class:`DocStore` keeps, per PDF, the extracted text together with every
+spaCy ``Doc`` the parse used, serialized with ``DocBin``. Later parses with the
+same pipeline read both back instead of extracting and analysing again; only
+texts the changed rules newly send to spaCy are analysed, and are added to the
+stored entry.
+
+Entries are keyed by a SHA-256 of the PDF bytes and the pipeline (spaCy
+version, model name and version, components), but not the parser version, so
+they survive upgrades of the parser itself.
+"""
+
+import hashlib
+import json
+
+from .cache import BlobStore
+
+
+def pipeline_id(nlp) -> str:
+    """Identify a loaded pipeline: spaCy version, model name and version, components."""
+    import spacy
+
+    meta = nlp.meta
+    return (
+        f"spacy-{spacy.__version__}/{meta.get('lang', '')}_{meta.get('name', '')}"
+        f"-{meta.get('version', '')}/{','.join(nlp.pipe_names)}"
+    )
+
+
+class DocStore(BlobStore):
+    """LRU store of extracted text and spaCy ``Doc`` objects in a ``BlobStore``."""
+
+    @staticmethod
+    def key_for(pdf_bytes: bytes | memoryview, nlp, config: dict | None = None) -> str:
+        """Return the store key of a PDF analysed by ``nlp``."""
+        digest = hashlib.sha256()
+        fingerprint = {"pipeline": pipeline_id(nlp), **(config or {})}
+        digest.update(json.dumps(fingerprint, sort_keys=True).encode("utf-8"))
+        digest.update(b"\0")
+        digest.update(pdf_bytes)
+        return digest.hexdigest()
+
+    def load(self, key: str, nlp) -> tuple[str, dict] | None:
+        """Return ``(text, {doc text: Doc})`` for ``key``, or None if not stored."""
+        blob = self._get_blob(key)
+        if blob is None:
+            return None
+        import srsly
+        from spacy.tokens import DocBin
+
+        entry = srsly.msgpack_loads(blob)
+        docs = DocBin().from_bytes(entry["docs"]).get_docs(nlp.vocab)
+        return entry["text"], {doc.text: doc for doc in docs}
+
+    def save(self, key: str, text: str, docs) -> None:
+        """Store the extracted ``text`` and the spaCy ``docs`` made from it."""
+        import srsly
+        from spacy.tokens import DocBin
+
+        doc_bin = DocBin(docs=docs, store_user_data=False)
+        self._put_blob(key, srsly.msgpack_dumps({"text": text, "docs": doc_bin.to_bytes()}))
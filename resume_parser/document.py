@@ -0,0 +1,74 @@
+"""Preprocessed resume text shared by all extractors of one parse."""
+
+import re
+from functools import cached_property
+
+from .sections import SectionIndex
+
+BULLET_PATTERN = re.compile("^[●•\\-\\*\\u2022\\u2023\\u2043\\u204c]")
+
+
+class ResumeDocument:
+    """Resume text split into lines once.
+
+    ``lines`` holds the stripped, non-empty lines and ``lower`` their lowercased
+    form; ``line_indexes`` maps each of them back to its position in
+    ``text.splitlines()``. Per-line features are computed on first use and are
+    aligned with ``lines``.
+
+    ``layout``, when the text was read in layout mode, holds one
+    ``resume_parser.layout.LayoutLine`` per entry of ``lines``. ``truncated``
+    names the ``resume_parser.limits.Limits`` that cut the text short.
+    """
+
+    def __init__(self, text: str, layout: list | None = None):
+        self.text = text
+        self.lines = []
+        self.line_indexes = []
+        for i, line in enumerate(text.splitlines()):
+            line = line.strip()
+            if line:
+                self.lines.append(line)
+                self.line_indexes.append(i)
+        self.lower = [line.lower() for line in self.lines]
+        if layout is not None and [line.text for line in layout] != self.lines:
+            raise ValueError("layout lines do not match the text")
+        self.layout = layout
+        self.truncated: list[str] = []
+
+    @classmethod
+    def of(cls, text: "str | ResumeDocument") -> "ResumeDocument":
+        """Return ``text`` if it already is a document, else build one."""
+        return text if isinstance(text, ResumeDocument) else cls(text)
+
+    def __len__(self) -> int:
+        return len(self.lines)
+
+    def __bool__(self) -> bool:
+        return bool(self.text)
+
+    @cached_property
+    def is_bullet(self) -> list[bool]:
+        return [bool(BULLET_PATTERN.match(line)) for line in self.lines]
+
+    @cached_property
+    def is_upper(self) -> list[bool]:
+        return [line.isupper() for line in self.lines]
+
+    @cached_property
+    def has_digit(self) -> list[bool]:
+        return [any(char.isdigit() for char in line) for line in self.lines]
+
+    @cached_property
+    def has_at(self) -> list[bool]:
+        return ["@" in line for line in self.lines]
+
+    @cached_property
+    def sections(self) -> SectionIndex:
+        """Section boundaries, found in one pass and shared by the extractors."""
+        return SectionIndex(self)
+
+
+def text_of(text: "str | ResumeDocument") -> str:
+    """Return the raw text of a string or document."""
+    return text.text if isinstance(text, ResumeDocument) else text
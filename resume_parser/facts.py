@@ -0,0 +1,132 @@
+"""Memoized spaCy analyses of short lines.
+
+The name and achievement extractors send single lines to spaCy and only look
+at a few things in the result: the entities, the first token's part of
+speech, the noun chunks and the token texts. :class:`LineFacts` holds just
+those, and a process-wide :class:`LineFactsCache` keeps the most recently used
+ones, so lines that repeat across resumes (LinkedIn boilerplate, common titles
+and bullet wording of one employer's exports) are analysed once.
+
+Lines are keyed by their text as the extractors pass it (already stripped and
+whitespace-collapsed), together with the pipeline that analysed them; the
+cache empties itself when a different pipeline is configured.
+"""
+
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+
+from .metrics import increment
+
+DEFAULT_MAXSIZE = 4096
+
+
+@dataclass(frozen=True)
+class LineFacts:
+    """What the extractors use from a spaCy ``Doc`` of one line."""
+
+    tokens: tuple[str, ...]
+    first_pos: str
+    ents: tuple[tuple[str, str], ...]  # (text, label)
+    noun_chunks: tuple[tuple[str, str], ...]  # (text, part of speech of the root)
+
+    @classmethod
+    def from_doc(cls, doc) -> "LineFacts":
+        # Pipelines without a dependency parser have no noun chunks.
+        chunks = doc.noun_chunks if doc.has_annotation("DEP") else ()
+        return cls(
+            tokens=tuple(token.text for token in doc),
+            first_pos=doc[0].pos_ if len(doc) else "",
+            ents=tuple((ent.text, ent.label_) for ent in doc.ents),
+            noun_chunks=tuple((chunk.text, chunk.root.pos_) for chunk in chunks),
+        )
+
+    def __len__(self) -> int:
+        return len(self.tokens)
+
+
+class LineFactsCache:
+    """Thread-safe LRU of :class:`LineFacts` by line text.
+
+    ``maxsize=0`` disables caching. ``hits`` and ``misses`` count lookups.
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_MAXSIZE):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, LineFacts] = OrderedDict()
+        self._nlp = None
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _check_pipeline(self, nlp) -> None:
+        # Called with the lock held.
+        if nlp is not self._nlp:
+            self._entries.clear()
+            self._nlp = nlp
+
+    def contains(self, nlp, text: str) -> bool:
+        """Whether ``text`` is cached for ``nlp`` (not counted as a lookup)."""
+        with self._lock:
+            self._check_pipeline(nlp)
+            return text in self._entries
+
+    def lookup(self, nlp, text: str, analyse) -> LineFacts:
+        """Return the facts of ``text``, calling ``analyse(nlp, text)`` on a miss."""
+        with self._lock:
+            self._check_pipeline(nlp)
+            facts = self._entries.get(text)
+            if facts is not None:
+                self._entries.move_to_end(text)
+                self.hits += 1
+            else:
+                self.misses += 1
+        if facts is not None:
+            increment("line_facts_hits")
+            return facts
+        increment("line_facts_misses")
+        facts = LineFacts.from_doc(analyse(nlp, text))
+        with self._lock:
+            if self.maxsize > 0 and nlp is self._nlp:
+                self._entries[text] = facts
+                self._entries.move_to_end(text)
+                while len(self._entries) > self.maxsize:
+                    self._entries.popitem(last=False)
+        return facts
+
+    def resize(self, maxsize: int) -> None:
+        """Change the capacity, evicting the least recently used lines."""
+        with self._lock:
+            self.maxsize = maxsize
+            while len(self._entries) > max(maxsize, 0):
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop every entry and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> dict:
+        """Return entry count, capacity, hits, misses and hit rate."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "maxsize": self.maxsize,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
+
+
+_cache = LineFactsCache()
+
+
+def line_facts_cache() -> LineFactsCache:
+    """Return the process-wide cache used by the extractors."""
+    return _cache
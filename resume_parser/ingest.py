@@ -0,0 +1,212 @@
+"""Resumable, streaming ingestion of a PDF corpus into JSON lines.
+
+Each resume is written to the output as soon as it is parsed, using the same
+record as the CLI: ``{"path", "result", "error"}`` where ``result`` is the
+``parse_resume`` dict. With a checkpoint file, a run that crashed or was
+killed picks up where it stopped: finished files are skipped and any output
+written after the last checkpoint entry is discarded, so every file appears in
+the output exactly once (failed files retried with ``retry_failed`` once per
+attempt). Memory use does not depend on the corpus size (apart
+from the set of already finished paths when resuming).
+"""
+
+import contextlib
+import glob
+import json
+import logging
+import os
+import sys
+import time
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from typing import BinaryIO
+
+from .bulk import FileResult, iter_resumes_parallel
+from .stores import Stores
+
+logger = logging.getLogger(__name__)
+
+_GLOB_CHARS = frozenset("*?[")
+
+
+def iter_pdf_paths(inputs, manifest: str | None = None) -> Iterator[str]:
+    """Yield the PDF paths named by ``inputs`` and ``manifest``, lazily.
+
+    Directories are walked recursively (sorted) for ``.pdf`` files, patterns
+    containing ``*``, ``?`` or ``[`` are expanded with ``glob`` (``**``
+    recurses) and anything else is yielded as is. ``manifest`` is a file, or
+    ``-`` for standard input, listing one path per line.
+    """
+    for path in inputs:
+        path = os.fspath(path)
+        if os.path.isdir(path):
+            for root, dirs, names in os.walk(path):
+                dirs.sort()
+                for name in sorted(names):
+                    if name.lower().endswith(".pdf"):
+                        yield os.path.join(root, name)
+        elif _GLOB_CHARS.intersection(path) and not os.path.exists(path):
+            yield from sorted(glob.iglob(path, recursive=True))
+        else:
+            yield path
+    if manifest == "-":
+        yield from _manifest_paths(sys.stdin)
+    elif manifest is not None:
+        with open(manifest, encoding="utf-8") as f:
+            yield from _manifest_paths(f)
+
+
+def _manifest_paths(lines: Iterable[str]) -> Iterator[str]:
+    for line in lines:
+        line = line.strip()
+        if line and not line.startswith("#"):
+            yield line
+
+
+class Checkpoint:
+    """Append-only log of finished files.
+
+    Each line is ``{"path": ..., "offset": ...}`` where ``offset`` is the size
+    of the output file once that file's record had been written; files that
+    failed also have ``"failed": true``.
+    """
+
+    def __init__(self, path: str):
+        self.path = os.fspath(path)
+
+    def load(self, retry_failed: bool = False) -> tuple[set[str], int]:
+        """Return the finished paths and the output size they account for.
+
+        With ``retry_failed``, files that failed are not counted as finished.
+        A last line cut short by a crash is dropped from the file; that file
+        is parsed again.
+        """
+        done: set[str] = set()
+        offset = 0
+        try:
+            with open(self.path, "r+b") as f:
+                valid = 0
+                for line in f:
+                    if not line.endswith(b"\n"):
+                        break
+                    entry = json.loads(line)
+                    if retry_failed and entry.get("failed"):
+                        done.discard(entry["path"])
+                    else:
+                        done.add(entry["path"])
+                    offset = entry["offset"]
+                    valid += len(line)
+                f.truncate(valid)
+        except FileNotFoundError:
+            pass
+        return done, offset
+
+    def record(self, path: str, offset: int, failed: bool = False) -> None:
+        entry = {"path": path, "offset": offset, **({"failed": True} if failed else {})}
+        # Reopened per record: a PDF parse costs far more than an open.
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(entry) + "\n")
+
+
+@dataclass
+class IngestReport:
+    """Counts for one (possibly resumed) ingestion run."""
+
+    parsed: int = 0
+    failed: int = 0
+    skipped: int = 0
+    elapsed: float = 0.0
+
+    @property
+    def files_per_second(self) -> float:
+        return self.parsed / self.elapsed if self.elapsed else 0.0
+
+    def summary(self) -> str:
+        return (
+            f"Parsed {self.parsed} files in {self.elapsed:.2f}s "
+            f"({self.files_per_second:.1f} files/s, {self.failed} failed, "
+            f"{self.skipped} already done)"
+        )
+
+
+def _record(result: FileResult) -> bytes:
+    record = {"path": result.path, "result": result.data, "error": result.error}
+    return (json.dumps(record, ensure_ascii=False) + "\n").encode("utf-8")
+
+
+def ingest(
+    file_paths,
+    output: str,
+    checkpoint: str | None = None,
+    workers: int | None = None,
+    chunksize: int = 16,
+    preload: bool = True,
+    stores: Stores | None = None,
+    fields=None,
+    layout: bool = False,
+    profile: str = "full",
+    limits=None,
+    retry_failed: bool = False,
+) -> IngestReport:
+    """Parse ``file_paths`` into the JSON lines file ``output`` as results arrive.
+
+    ``file_paths`` must be paths (``str`` or ``os.PathLike``): the output and
+    the checkpoint identify files by path. ``output`` may be ``-`` for
+    standard output (without a checkpoint). With ``checkpoint``, files it
+    lists are skipped and the output is truncated to the last checkpointed
+    record before appending. With ``retry_failed``, files that failed in an
+    earlier run are parsed again; their new record follows the old one.
+    """
+    report = IngestReport()
+    done: set[str] = set()
+    offset = 0
+    with contextlib.ExitStack() as stack:
+        log: Checkpoint | None = None
+        if checkpoint is not None:
+            if output == "-":
+                raise ValueError("a checkpoint needs an output file, not standard output")
+            log = Checkpoint(checkpoint)
+            done, offset = log.load(retry_failed)
+            if done:
+                logger.info(f"Resuming after {len(done)} finished files")
+        out: BinaryIO
+        if output == "-":
+            out = sys.stdout.buffer
+        elif offset:
+            out = stack.enter_context(open(output, "r+b"))
+            if os.fstat(out.fileno()).st_size < offset:
+                raise ValueError(f"{output} is shorter than {checkpoint} records")
+            out.truncate(offset)
+            out.seek(offset)
+        else:
+            out = stack.enter_context(open(output, "wb"))
+
+        def todo():
+            for path in file_paths:
+                if os.fspath(path) in done:
+                    report.skipped += 1
+                else:
+                    yield path
+
+        start = time.perf_counter()
+        results = iter_resumes_parallel(
+            todo(),
+            workers,
+            chunksize,
+            preload,
+            stores,
+            fields,
+            layout,
+            profile,
+            limits,
+        )
+        for result in results:
+            out.write(_record(result))
+            out.flush()
+            report.parsed += 1
+            report.failed += not result.ok
+            if log is not None:
+                log.record(result.path, out.tell(), failed=not result.ok)
+    report.elapsed = time.perf_counter() - start
+    logger.info(report.summary())
+    return report
@@ -0,0 +1,119 @@
+"""Font and position data of PDF text lines (``page.get_text("dict")``).
+
+Plain ``get_text()`` keeps only the characters. In layout mode each text line
+also carries its font size, boldness and bounding box, which lets the parser
+
+- take the name from the largest text at the top of the first page, instead
+  of falling back to spaCy NER on individual lines,
+- recognise section headers by their style (any short line set like the known
+  headers, e.g. "Volunteer Work" next to "Experience"), and
+- read side-by-side columns one after the other instead of in content-stream
+  order.
+"""
+
+import re
+from dataclasses import dataclass
+
+from . import patterns
+
+_BOLD_FLAG = 16
+# How much larger than the body text a line must be to count as emphasised.
+_LARGER = 1.15
+_NAME_PUNCTUATION = re.compile("[.'\\-]")
+
+
+@dataclass(frozen=True)
+class LayoutLine:
+    """One text line with its style and position (PDF points, origin top left)."""
+
+    text: str
+    size: float
+    bold: bool
+    x0: float
+    y0: float
+    x1: float
+    y1: float
+    page: int
+
+    @property
+    def style(self) -> tuple[float, bool]:
+        return round(self.size, 1), self.bold
+
+
+def page_lines(page, number: int = 0) -> list[LayoutLine]:
+    """Non-empty text lines of a PyMuPDF page in reading order.
+
+    Lines separated by a vertical gutter are treated as columns and read left
+    to right, each top to bottom; a line spanning the gutter merges the
+    columns. PyMuPDF's own blocks follow the content stream and can mix
+    columns, so they are not used for this.
+    """
+    lines = []
+    for block in page.get_text("dict")["blocks"]:
+        for line in block.get("lines", ()):
+            spans = [span for span in line["spans"] if span["text"].strip()]
+            # Collapsing whitespace also drops characters splitlines() breaks
+            # on, which would misalign the lines with ResumeDocument.lines.
+            text = " ".join("".join(span["text"] for span in line["spans"]).split())
+            if not spans or not text:
+                continue
+            bold = all(
+                span["flags"] & _BOLD_FLAG or "bold" in span["font"].lower() for span in spans
+            )
+            size = max(span["size"] for span in spans)
+            x0, y0, x1, y1 = line["bbox"]
+            lines.append(LayoutLine(text, size, bold, x0, y0, x1, y1, number))
+    return [
+        line
+        for column in _columns(lines)
+        for line in sorted(column, key=lambda line: (line.y0, line.x0))
+    ]
+
+
+def _columns(lines: list[LayoutLine]) -> list[list[LayoutLine]]:
+    columns: list[list[LayoutLine]] = []
+    right = None
+    for line in sorted(lines, key=lambda line: line.x0):
+        if right is not None and line.x0 < right:
+            columns[-1].append(line)
+            right = max(right, line.x1)
+        else:
+            columns.append([line])
+            right = line.x1
+    return columns
+
+
+def body_size(lines: list[LayoutLine]) -> float:
+    """Font size of the bulk of the text (weighted by characters)."""
+    sizes: dict[float, int] = {}
+    for line in lines:
+        sizes[round(line.size, 1)] = sizes.get(round(line.size, 1), 0) + len(line.text)
+    return max(sizes, key=sizes.__getitem__) if sizes else 0.0
+
+
+def layout_name(lines: list[LayoutLine]) -> str:
+    """Return the largest text on the first page (the topmost, among equally
+    large lines) if it looks like a person's name, else ``""``."""
+    first_page = [line for line in lines if line.page == 0]
+    if not first_page:
+        return ""
+    threshold = body_size(lines) * _LARGER
+    for line in sorted(first_page, key=lambda line: (-line.size, line.y0)):
+        if line.size < threshold:
+            break
+        words = line.text.split()
+        lower = line.text.lower()
+        if (
+            1 < len(words) <= 4
+            and all(_NAME_PUNCTUATION.sub("", word).isalpha() for word in words)
+            and lower not in patterns.NOT_A_NAME
+            and not patterns.NAME_HEADER_SKIP.search(lower)
+            and not patterns.NON_NAME_INDICATORS.search(lower)
+        ):
+            return line.text.title()
+    return ""
+
+
+def is_emphasised(line: LayoutLine, body: float) -> bool:
+    """Whether ``line`` is bold or set larger than the body text."""
+    return line.bold or line.size >= body * _LARGER
@@ -0,0 +1,162 @@
+"""Resource limits for parsing untrusted or pathological PDFs.
+
+A :class:`Limits` passed as ``limits=`` bounds the work of each parse:
+
+- ``max_pages``, ``max_chars`` and ``max_lines`` cut the extracted text short
+  (at a line boundary), so no extractor ever sees more than that;
+- ``timeout`` (seconds of wall-clock time) and ``max_memory`` (bytes the parse
+  may allocate) are enforced by running the parse in a separate process,
+  which is killed when it runs over.
+
+Parses under limits report what happened in a ``status`` entry of the result:
+``{"state": "ok" | "truncated" | "degraded" | "empty" | "aborted", "reasons":
+[...]}``, where the reasons name the limits that were hit (``"timeout"``,
+``"max_memory"``, ``"crashed"`` for an aborted sandbox). Aborted parses have
+no other fields. Parses with a ``deadline`` also list the ``complete`` fields
+and those taken from the ``degraded`` (rules only) path once it had passed.
+"""
+
+import logging
+import multiprocessing
+import os
+from dataclasses import asdict, dataclass
+from multiprocessing.context import BaseContext
+
+logger = logging.getLogger(__name__)
+
+STATES = ("ok", "truncated", "degraded", "empty", "aborted")
+
+
+@dataclass(frozen=True)
+class Limits:
+    """Per-document limits; ``None`` leaves a resource unbounded."""
+
+    max_pages: int | None = None
+    max_chars: int | None = None
+    max_lines: int | None = None
+    timeout: float | None = None
+    max_memory: int | None = None
+
+    def __post_init__(self):
+        for name, value in asdict(self).items():
+            if value is not None and value <= 0:
+                raise ValueError(f"{name} must be positive, got {value!r}")
+
+    @property
+    def sandboxed(self) -> bool:
+        """Whether parses run in a separate process (``timeout`` or ``max_memory``)."""
+        return self.timeout is not None or self.max_memory is not None
+
+    def config(self) -> dict:
+        """The limits on the text that are set (for cache keys); results that
+        are not aborted do not depend on ``timeout`` and ``max_memory``."""
+        text_limits = ("max_pages", "max_chars", "max_lines")
+        return {name: getattr(self, name) for name in text_limits if getattr(self, name)}
+
+
+def with_status(data: dict, truncated: list[str], degraded: set[str] | None = None) -> dict:
+    """Return ``data`` with its ``status`` entry, given the limits that cut it
+    short and, for a parse with a deadline, the fields that were degraded."""
+    reasons = list(truncated)
+    if degraded:
+        reasons.append("deadline")
+    if not data:
+        return {"status": {"state": "empty", "reasons": reasons}}
+    state = "truncated" if truncated else "degraded" if degraded else "ok"
+    status = {"state": state, "reasons": reasons}
+    if degraded is not None:
+        status["complete"] = [field for field in data if field not in degraded]
+        status["degraded"] = [field for field in data if field in degraded]
+    return {**data, "status": status}
+
+
+def aborted(reason: str) -> dict:
+    """The result of a parse stopped by ``reason``."""
+    return {"status": {"state": "aborted", "reasons": [reason]}}
+
+
+def first_lines(text: str, max_lines: int) -> tuple[str, bool]:
+    """Cut ``text`` after its ``max_lines``-th non-empty line.
+
+    Returns the text and whether anything was cut.
+    """
+    count = offset = 0
+    for line in text.splitlines(keepends=True):
+        if line.strip():
+            if count == max_lines:
+                return text[:offset], True
+            count += 1
+        offset += len(line)
+    return text, False
+
+
+def _address_space() -> int:
+    """Current virtual memory size of this process, or 0 where unknown."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[0]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError):
+        return 0
+
+
+def _run_child(conn, max_memory, function, args) -> None:
+    if max_memory is not None:
+        try:
+            import resource
+
+            ceiling = _address_space() + max_memory
+            resource.setrlimit(resource.RLIMIT_AS, (ceiling, ceiling))
+        except (ImportError, ValueError, OSError) as e:
+            logger.warning(f"Could not limit the memory of the parse: {e}")
+    try:
+        result = ("ok", function(*args))
+    except MemoryError:
+        result = ("aborted", "max_memory")
+    except (OSError, RuntimeError, TypeError, ValueError, LookupError) as e:
+        result = ("error", f"{type(e).__name__}: {e}")
+    conn.send(result)
+    conn.close()
+
+
+def run_sandboxed(function, args: tuple, limits: Limits) -> dict:
+    """Call ``function(*args)`` in a child process within ``limits``.
+
+    The child is forked where possible (so a loaded spaCy model is shared) and
+    killed once ``limits.timeout`` has passed. ``max_memory`` is added to the
+    address space the child starts with. Returns the function's result, or an
+    ``aborted`` result when a limit is hit or the child dies. The errors a
+    parse may raise (``OSError``, ``RuntimeError``, ``TypeError``,
+    ``ValueError``, ``LookupError``) are raised again as ``RuntimeError``;
+    any other exception ends the child, which is reported as ``crashed``.
+    """
+    context: BaseContext
+    if "fork" in multiprocessing.get_all_start_methods():
+        context = multiprocessing.get_context("fork")
+    else:
+        context = multiprocessing.get_context()
+        # Buffers cannot be pickled for a spawned child.
+        args = tuple(bytes(arg) if isinstance(arg, memoryview) else arg for arg in args)
+    receiver, sender = context.Pipe(duplex=False)
+    child = context.Process(target=_run_child, args=(sender, limits.max_memory, function, args))
+    child.start()
+    sender.close()
+    try:
+        if receiver.poll(limits.timeout):
+            try:
+                kind, value = receiver.recv()
+            except EOFError:
+                kind, value = "aborted", "crashed"
+        else:
+            kind, value = "aborted", "timeout"
+    finally:
+        if child.is_alive():
+            child.kill()
+        child.join()
+        receiver.close()
+    if kind == "error":
+        raise RuntimeError(value)
+    if kind == "aborted":
+        logger.warning(f"Parse aborted: {value}")
+        return aborted(value)
+    result: dict = value
+    return result
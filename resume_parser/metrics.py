@@ -0,0 +1,179 @@
+"""Optional per-stage timing of parses.
+
+Pass a :class:`ParseMetrics` (or any object with ``observe(stage, seconds)``
+and ``increment(counter, amount)`` methods) as ``metrics=`` to
+``parse_resume`` / ``parse_resumes``. Stages are timed only while a metrics
+object is active, so with instrumentation off each stage costs one
+``ContextVar`` lookup.
+
+Recorded stages: ``parse`` (whole call), ``pdf_open``, ``pdf_page`` (each
+page's text extraction), ``spacy_pipe`` (batch ``nlp.pipe``), ``spacy_doc``
+(the header doc) and one ``extract_<field>`` per extractor. Counters:
+``parses``, ``nlp_calls`` (direct ``nlp()`` calls), ``nlp_piped_texts`` and
+``line_facts_hits`` / ``line_facts_misses`` (see ``resume_parser.facts``) and
+``doc_store_hits`` / ``doc_store_misses`` (see ``resume_parser.docstore``),
+``revision_page_hits`` / ``revision_page_misses`` and
+``revision_section_hits`` / ``revision_section_misses`` (see
+``resume_parser.revisions``).
+"""
+
+import bisect
+import os
+import tempfile
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
+
+_current: ContextVar = ContextVar("resume_parser_metrics", default=None)
+
+DEFAULT_BUCKETS = (
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+
+class ParseMetrics:
+    """Thread-safe histograms of stage wall times plus counters.
+
+    ``prefix`` is prepended to the exported metric names.
+    """
+
+    def __init__(self, buckets=DEFAULT_BUCKETS, prefix: str = "resume_parser"):
+        self.buckets = tuple(sorted(buckets))
+        self.prefix = prefix
+        self._lock = threading.Lock()
+        self._histograms: dict[str, list] = {}
+        self._counters: dict[str, float] = {}
+
+    def observe(self, stage: str, seconds: float) -> None:
+        with self._lock:
+            histogram = self._histograms.get(stage)
+            if histogram is None:
+                # Per-bucket counts (last one is +Inf), then sum and count.
+                histogram = self._histograms[stage] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            histogram[0][bisect.bisect_left(self.buckets, seconds)] += 1
+            histogram[1] += seconds
+            histogram[2] += 1
+
+    def increment(self, counter: str, amount: float = 1) -> None:
+        with self._lock:
+            self._counters[counter] = self._counters.get(counter, 0) + amount
+
+    def snapshot(self) -> dict:
+        """``{"stages": {stage: {"count", "sum"}}, "counters": {...}}``."""
+        with self._lock:
+            stages = {
+                stage: {"count": count, "sum": total}
+                for stage, (_, total, count) in self._histograms.items()
+            }
+            return {"stages": stages, "counters": dict(self._counters)}
+
+    def reset(self) -> None:
+        with self._lock:
+            self._histograms.clear()
+            self._counters.clear()
+
+    def to_prometheus(self) -> str:
+        """Render in the Prometheus text exposition format."""
+        name = f"{self.prefix}_stage_seconds"
+        lines = [
+            f"# HELP {name} Wall time spent in each parse stage.",
+            f"# TYPE {name} histogram",
+        ]
+        with self._lock:
+            histograms = {k: (list(v[0]), v[1], v[2]) for k, v in self._histograms.items()}
+            counters = dict(self._counters)
+        for stage in sorted(histograms):
+            buckets, total, count = histograms[stage]
+            cumulative = 0
+            for bound, hits in zip(self.buckets + (float("inf"),), buckets):
+                cumulative += hits
+                le = "+Inf" if bound == float("inf") else repr(bound)
+                lines.append(f'{name}_bucket{{stage="{stage}",le="{le}"}} {cumulative}')
+            lines.append(f'{name}_sum{{stage="{stage}"}} {total!r}')
+            lines.append(f'{name}_count{{stage="{stage}"}} {count}')
+        for counter in sorted(counters):
+            metric = f"{self.prefix}_{counter}_total"
+            lines.append(f"# TYPE {metric} counter")
+            lines.append(f"{metric} {counters[counter]}")
+        return "\n".join(lines) + "\n"
+
+    def write_textfile(self, path: str) -> None:
+        """Atomically write the Prometheus text to ``path`` (e.g. for the
+        node_exporter textfile collector)."""
+        directory = os.path.dirname(os.path.abspath(path))
+        fd, tmp = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(self.to_prometheus())
+            os.replace(tmp, path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+
+
+class _StageTimer:
+    __slots__ = ("metrics", "stage", "start")
+
+    def __init__(self, metrics, stage: str):
+        self.metrics = metrics
+        self.stage = stage
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+
+    def __exit__(self, *exc_info):
+        self.metrics.observe(self.stage, time.perf_counter() - self.start)
+
+
+_NULL = nullcontext()
+
+
+def stage(name: str):
+    """Context manager timing ``name`` into the active metrics, if any."""
+    metrics = _current.get()
+    return _NULL if metrics is None else _StageTimer(metrics, name)
+
+
+def timed(name: str, func, *args):
+    """Call ``func(*args)``, timing it as stage ``name`` when metrics are active."""
+    metrics = _current.get()
+    if metrics is None:
+        return func(*args)
+    start = time.perf_counter()
+    try:
+        return func(*args)
+    finally:
+        metrics.observe(name, time.perf_counter() - start)
+
+
+def increment(counter: str, amount: float = 1) -> None:
+    metrics = _current.get()
+    if metrics is not None:
+        metrics.increment(counter, amount)
+
+
+@contextmanager
+def recording(metrics):
+    """Make ``metrics`` the active recorder for the enclosed parses."""
+    if metrics is None:
+        yield
+        return
+    token = _current.set(metrics)
+    try:
+        yield
+    finally:
+        _current.reset(token)
@@ -0,0 +1,133 @@
+"""Lazy spaCy model provider.
+
+Nothing is imported or loaded until the first call to :func:`get_nlp`. The
+pipeline is then loaded exactly once per process and shared by every parse.
+Downloading a model is never done implicitly; call :func:`download_model`
+(or ``python -m spacy download``) as an explicit setup step.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import subprocess
+import sys
+import threading
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MODEL = "en_core_web_sm"
+MODEL_ENV_VAR = "RESUME_PARSER_SPACY_MODEL"
+
+_lock = threading.Lock()
+_nlp = None
+_loaded = False
+_model = None
+_injected = False
+
+
+def configure_model(model=None) -> None:
+    """Choose the pipeline used by the parser.
+
+    ``model`` may be a preloaded ``spacy.Language``, a package name, or a path
+    to a model directory. Passing ``None`` resets to the default, which is the
+    ``RESUME_PARSER_SPACY_MODEL`` environment variable or ``en_core_web_sm``.
+    A string is only loaded on the next :func:`get_nlp` call.
+    """
+    global _nlp, _loaded, _model, _injected
+    with _lock:
+        if model is None or isinstance(model, (str, os.PathLike)):
+            _model = model
+            _nlp = None
+            _loaded = False
+            _injected = False
+        else:
+            _model = None
+            _nlp = model
+            _loaded = True
+            _injected = True
+
+
+def is_injected() -> bool:
+    """Return True when the pipeline is a ``spacy.Language`` passed to
+    :func:`configure_model` rather than loaded from a name or path."""
+    return _injected
+
+
+def model_name() -> str:
+    """Return the name or path of the model that will be (or was) loaded."""
+    if _model is not None:
+        return os.fspath(_model)
+    return os.environ.get(MODEL_ENV_VAR, DEFAULT_MODEL)
+
+
+def model_id() -> str:
+    """Identify the configured pipeline without loading it (for cache keys).
+
+    An injected pipeline is identified by its name and version together with
+    its components and their configuration, so in-memory pipelines that share
+    the default ``meta`` do not share cache entries.
+    """
+    if _model is None and _nlp is not None:
+        meta = getattr(_nlp, "meta", {})
+        name = f"{meta.get('lang', '')}_{meta.get('name', '')}-{meta.get('version', '')}"
+        config = getattr(_nlp, "config", {}).get("components", {})
+        digest = hashlib.sha256(json.dumps(config, sort_keys=True, default=str).encode("utf-8"))
+        return f"{name}/{','.join(getattr(_nlp, 'pipe_names', []))}/{digest.hexdigest()[:16]}"
+    return model_name()
+
+
+def is_loaded() -> bool:
+    """Return True once a load attempt has been made or a pipeline injected."""
+    return _loaded
+
+
+def get_nlp():
+    """Return the shared spaCy pipeline, loading it on first use.
+
+    Returns ``None`` if spaCy or the model is not installed. A failed load is
+    remembered so later parses do not pay for repeated attempts.
+    """
+    global _nlp, _loaded
+    if _loaded:
+        return _nlp
+    with _lock:
+        if not _loaded:
+            name = model_name()
+            logger.info(f"Loading spaCy model: {name}")
+            try:
+                import spacy
+
+                _nlp = spacy.load(name)
+            except (ImportError, OSError, ValueError) as e:
+                logger.warning(
+                    f"Could not load spaCy model '{name}': {e}. "
+                    "Install it with `python -m spacy download en_core_web_sm`."
+                )
+                _nlp = None
+            _loaded = True
+    return _nlp
+
+
+def download_model(name: str = DEFAULT_MODEL) -> bool:
+    """Download a spaCy model package. Returns True on success."""
+    logger.info(f"Downloading spaCy model '{name}'...")
+    try:
+        subprocess.check_call([sys.executable, "-m", "spacy", "download", name])
+    except (OSError, subprocess.CalledProcessError):
+        logger.exception("Failed to download spaCy model")
+        return False
+    if _nlp is None:
+        configure_model(_model)
+    return True
+
+
+def ensure_spacy_model(name: str = DEFAULT_MODEL) -> None:
+    """Download ``name`` if it is not installed. Explicit opt-in, never run on import."""
+    try:
+        import spacy.util
+    except ImportError:
+        logger.error("spaCy is not installed")
+        return
+    if not spacy.util.is_package(name):
+        download_model(name)
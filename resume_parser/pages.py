@@ -0,0 +1,136 @@
+"""Page-by-page PDF text extraction.
+
+``PdfPages`` opens the PDF on first use and extracts each page's text only
+when it is asked for, so callers that need the header of a resume never pay
+for the rest of a long document.
+"""
+
+import logging
+from typing import TypeVar
+
+from .layout import LayoutLine, page_lines
+from .metrics import increment, stage
+from .revisions import RevisionStore, page_fingerprint
+from .sources import PdfSource, describe, open_pdf
+
+logger = logging.getLogger(__name__)
+
+_Pages = TypeVar("_Pages", bound="PdfPages")
+
+
+def _count_lines(text: str) -> int:
+    # Same notion of a line as ResumeDocument.lines.
+    return sum(1 for line in text.splitlines() if line.strip())
+
+
+class PdfPages:
+    """Lazily extracted page texts of one PDF.
+
+    Each page's text ends with a newline, so ``"".join`` of any prefix of the
+    pages is exactly the start of what ``extract_text_from_pdf`` returns.
+    Use as a context manager (or call :meth:`close`) to release the document.
+
+    With ``layout=True`` pages are read with ``get_text("dict")``: the text is
+    built from the page's ``LayoutLine`` objects (one per line, columns in
+    reading order) and :meth:`layout` returns them.
+
+    With a ``RevisionStore`` (see ``resume_parser.revisions``) as ``store``,
+    pages whose fingerprint is stored are taken from it instead of being
+    extracted, and newly extracted pages are added to it.
+    """
+
+    def __init__(self, source: PdfSource, layout: bool = False, store: RevisionStore | None = None):
+        self.source = source
+        self.layout_mode = layout
+        self.store = store
+        self._doc = None
+        self._texts: list[str] = []
+        self._layouts: list[list[LayoutLine]] = []
+
+    def __enter__(self: _Pages) -> _Pages:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _open(self):
+        if self._doc is None:
+            logger.info(f"Opening PDF with fitz: {describe(self.source)}")
+            with stage("pdf_open"):
+                self._doc = open_pdf(self.source)
+            logger.info(f"PDF has {self._doc.page_count} pages")
+        return self._doc
+
+    def __len__(self) -> int:
+        count: int = self._open().page_count
+        return count
+
+    def __getitem__(self, index: int) -> str:
+        doc = self._open()
+        while len(self._texts) <= index < doc.page_count:
+            number = len(self._texts)
+            with stage("pdf_page"):
+                page_text, lines = self._extract(doc[number], number)
+            if self.layout_mode:
+                self._layouts.append(lines or [])
+            self._texts.append(page_text + "\n")
+        return self._texts[index]
+
+    def _extract(self, page, number: int) -> tuple[str, list[LayoutLine] | None]:
+        key = None
+        if self.store is not None:
+            key = page_fingerprint(page, self.layout_mode)
+            stored = self.store.load_page(key, number)
+            if stored is not None:
+                increment("revision_page_hits")
+                return stored
+            increment("revision_page_misses")
+        lines = None
+        if self.layout_mode:
+            lines = page_lines(page, number)
+            page_text = "".join(line.text + "\n" for line in lines)
+        else:
+            page_text = page.get_text()
+        logger.debug(f"Extracted {len(page_text)} chars from page {number + 1}")
+        if self.store is not None and key is not None:
+            self.store.save_page(key, page_text, lines)
+        return page_text, lines
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self[index]
+
+    @property
+    def extracted(self) -> int:
+        """Number of pages whose text has been extracted so far."""
+        return len(self._texts)
+
+    def layout(self, pages: int | None = None) -> list[LayoutLine]:
+        """Layout lines of the first ``pages`` extracted pages (default: all
+        extracted so far), aligned with ``ResumeDocument.lines`` of their text."""
+        if not self.layout_mode:
+            raise ValueError("PdfPages was not opened with layout=True")
+        return [line for lines in self._layouts[:pages] for line in lines]
+
+    def text(self) -> str:
+        """Text of the whole document (joined once, not appended page by page)."""
+        return "".join(self)
+
+    def head(self, min_lines: int = 0, min_chars: int = 0) -> str:
+        """Text of the fewest leading pages holding ``min_lines`` non-empty lines
+        and ``min_chars`` characters (or of every page, if the PDF is shorter)."""
+        parts = []
+        lines = chars = 0
+        for index in range(len(self)):
+            if lines >= min_lines and chars >= min_chars:
+                break
+            page_text = self[index]
+            parts.append(page_text)
+            lines += _count_lines(page_text)
+            chars += len(page_text)
+        return "".join(parts)
+
+    def close(self) -> None:
+        if self._doc is not None:
+            self._doc.close()
+            self._doc = None
@@ -0,0 +1,384 @@
+"""Precompiled patterns and keyword matchers used by the extractor heuristics.
+
+Everything here is built once at import time. Keyword lists are compiled into
+a single trie-shaped regular expression, so "does this line contain any of
+these keywords" is one scan of the line instead of one ``in`` test per keyword.
+"""
+
+import re
+
+
+class KeywordMatcher:
+    """Find any of a fixed set of substrings in one pass over the text.
+
+    ``matcher.search(text)`` returns a match (truthy) exactly when
+    ``any(keyword in text for keyword in keywords)`` is true, else None.
+    """
+
+    def __init__(self, keywords, flags: int = 0):
+        self.keywords = tuple(keywords)
+        trie: dict = {}
+        for keyword in self.keywords:
+            node = trie
+            for char in keyword:
+                node = node.setdefault(char, {})
+            node[""] = {}
+        self.pattern = re.compile(_trie_to_regex(trie), flags)
+        # Bound directly to skip a Python-level call on the hot path.
+        self.search = self.pattern.search
+
+    def findall(self, text: str) -> list[str]:
+        """Return the non-overlapping keyword hits, longest match first at each position."""
+        return self.pattern.findall(text)
+
+    def __repr__(self) -> str:
+        return f"KeywordMatcher({len(self.keywords)} keywords)"
+
+
+def _trie_to_regex(node: dict) -> str:
+    terminal = "" in node
+    branches = [
+        re.escape(char) + _trie_to_regex(child) for char, child in sorted(node.items()) if char
+    ]
+    if not branches:
+        return ""
+    regex = branches[0] if len(branches) == 1 else f"(?:{'|'.join(branches)})"
+    if terminal:
+        regex = f"(?:{regex})?"
+    return regex
+
+
+WHITESPACE = re.compile("\\s+")
+EMAIL = re.compile("[\\w\\.-]+@[\\w\\.-]+\\.\\w+")
+PHONE = re.compile("[\\+]?[(]?[0-9]{3}[)]?[-\\s\\.]?[0-9]{3}[-\\s\\.]?[0-9]{4,6}")
+
+LINKEDIN_URL = re.compile("linkedin\\.com/in/\\s*([\\w-]+)")
+LINKEDIN_MARKER = re.compile("([\\w-]+)\\s*\\(linkedin\\)")
+LINKEDIN_MARKER_ANY_CASE = re.compile("\\(linkedin\\)", re.IGNORECASE)
+LINKEDIN_USERNAME = re.compile("^[\\w-]+$")
+
+ROLE_KEYWORDS = KeywordMatcher(
+    [
+        "engineer",
+        "developer",
+        "manager",
+        "director",
+        "consultant",
+        "founder",
+        "ceo",
+        "cto",
+        "coo",
+        "cfo",
+        "vp",
+        "president",
+        "lead",
+        "head",
+        "chief",
+        "analyst",
+        "designer",
+        "architect",
+        "specialist",
+        "advisor",
+        "partner",
+        "scientist",
+        "researcher",
+        "professor",
+        "coach",
+        "strategist",
+        "executive",
+        "expert",
+    ]
+)
+ROLE_SKIP = KeywordMatcher(
+    [
+        "summary",
+        "experience",
+        "education",
+        "skills",
+        "contact",
+        "languages",
+        "publications",
+        "certifications",
+        "page ",
+        "top skills",
+    ]
+)
+ROLE_SEPARATORS = re.compile("\\||\\/|\\u2022")
+
+NON_NAME_INDICATORS = KeywordMatcher(
+    [
+        "page",
+        "curriculum",
+        "resume",
+        "contact",
+        "mobile",
+        "email",
+        "linkedin",
+        "publications",
+        "certifications",
+        "skills",
+        "languages",
+        "honors",
+        "awards",
+        "greater",
+        "area",
+        "region",
+        "metro",
+        "north",
+        "south",
+        "east",
+        "west",
+        "central",
+        "bay",
+        "united states",
+        "kingdom",
+        "canada",
+        "australia",
+        "software engineer",
+        "software design",
+        "software infrastructure",
+        "software development",
+        "developer",
+        "manager",
+        "director",
+        "consultant",
+        "specialist",
+        "top skills",
+        "summary",
+    ]
+)
+NAME_HEADER_SKIP = KeywordMatcher(["phone", "resume", "curriculum", "contact"])
+NER_LINE_SKIP = KeywordMatcher(["summary", "experience", "education", "skills", "contact"])
+NOT_A_NAME = frozenset(["curriculum vitae", "resume", "software engineer", "contact", "email"])
+TITLE_CASE_NAME = re.compile("^[A-Z][a-z]+(\\s+[A-Z][a-z]+){1,2}$")
+
+TECH_BLACKLIST = frozenset(
+    [
+        "Spark",
+        "Python",
+        "Java",
+        "Docker",
+        "Kubernetes",
+        "React",
+        "Elastic",
+        "Spring",
+        "Swift",
+        "Kafka",
+        "Pandas",
+        "Ansible",
+        "Terraform",
+        "Unity",
+        "AWS",
+        "Azure",
+        "GCP",
+        "Linux",
+        "Node",
+        "Django",
+        "Flask",
+        "FastAPI",
+    ]
+)
+CITY_STATE = re.compile("([A-Z][a-z]+(?:\\s[A-Z][a-z]+)*),\\s([A-Z]{2})(?:\\s*\\(Remote\\))?")
+
+HEADER_PUNCTUATION = re.compile("[:\\-]+")
+SUMMARY_HEADERS = frozenset(["summary", "profile", "professional summary", "about me", "objective"])
+SUMMARY_STOP_HEADERS = frozenset(
+    [
+        "experience",
+        "employment",
+        "work history",
+        "skills",
+        "education",
+        "projects",
+        "certifications",
+        "publications",
+        "languages",
+        "interests",
+    ]
+)
+
+_MONTH = "(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\\.?"
+JOB_DATE_RANGE = re.compile(
+    f"{_MONTH}\\s+\\d{{4}}\\s*[-–]\\s*(?:Present|{_MONTH}\\s+\\d{{4}})", re.IGNORECASE
+)
+JOB_TENURE = re.compile(
+    "^(\\(?\\d+\\s+(?:yr|yrs|year|years|mo|mos|month|months).*)"
+    "|(^\\d{4}\\s*[-–]\\s*(?:Present|\\d{4}))",
+    re.IGNORECASE,
+)
+JOB_TITLES = [
+    "Engineering",
+    "Software",
+    "Senior",
+    "Lead",
+    "Staff",
+    "Principal",
+    "Director",
+    "Manager",
+    "VP",
+    "CEO",
+    "CTO",
+    "COO",
+    "CFO",
+    "Founder",
+    "Owner",
+    "Co-Founder",
+    "President",
+    "Advisor",
+    "Consultant",
+    "Head",
+    "Chief",
+]
+JOB_TITLE_SUFFIXES = [
+    "Manager",
+    "Engineer",
+    "Developer",
+    "Architect",
+    "Director",
+    "Officer",
+    "Lead",
+    "Specialist",
+]
+JOB_TITLE = re.compile(
+    f"^(?:{'|'.join(JOB_TITLES)})\\s*(?:{'|'.join(JOB_TITLE_SUFFIXES)})?$", re.IGNORECASE
+)
+
+IMPACT_WORDS = (
+    "increased",
+    "decreased",
+    "improved",
+    "reduced",
+    "saved",
+    "generated",
+    "delivered",
+    "led",
+    "managed",
+    "built",
+    "launched",
+    "achieved",
+    "optimized",
+    "streamlined",
+    "developed",
+    "co-developed",
+    "created",
+    "implemented",
+    "scaled",
+    "grew",
+)
+IMPACT_WORD_SET = frozenset(IMPACT_WORDS)
+IMPACT = KeywordMatcher(IMPACT_WORDS)
+CONTACT = KeywordMatcher(["@", "+", "www.", "linkedin.com", "/in/", "tel:", "phone:"])
+SECTION_BREAK = re.compile(
+    "\\|.*\\("
+    "|\\d{4}[\\u2013\\-](?:\\d{4}|Present)"
+    "|[\\u2013\\-]\\s*[A-Z]{2}$"
+    "|^(?:Education|Experience|Skills|Summary|Objective|Awards)"
+)
+BULLET_CONTINUATION_STARTERS = frozenset(
+    [
+        "that",
+        "which",
+        "and",
+        "but",
+        "or",
+        "with",
+        "by",
+        "for",
+        "from",
+        "to",
+        "in",
+        "of",
+        "at",
+        "as",
+        "on",
+        "while",
+        "where",
+        "when",
+        "who",
+        "whose",
+    ]
+)
+CONTINUATION_STARTERS = BULLET_CONTINUATION_STARTERS | {
+    "resulting",
+    "including",
+    "utilizing",
+    "leveraging",
+    "during",
+    "within",
+    "across",
+    "through",
+    "plus",
+    "also",
+    "additionally",
+    "furthermore",
+}
+FIRST_PERSON = re.compile(
+    "^(?:I\\s+(?:am|was|have|had|own|lead|managed|worked|built)|My\\s+)", re.IGNORECASE
+)
+STARTS_WITH_DATE = re.compile(
+    "^(?:jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)\\w*\\s+\\d{4}", re.IGNORECASE
+)
+LEADING_MARKER = re.compile("^[●•\\-\\*\\d]+\\.*\\s*")
+LEADING_NUMBER = re.compile("^[\\d%]+\\s")
+PAGE_FOOTER = re.compile("Page\\s+\\d+\\s+of\\s+\\d+", re.IGNORECASE)
+METRIC = re.compile(
+    "(\\d+(?:\\.\\d+)?\\s*(?:%|k|M|B|\\+|years?|yrs?|users?|customers?))", re.IGNORECASE
+)
+TENURE_PATTERNS = [
+    re.compile(
+        "\\d+\\s+(?:yr|yrs|year|years|mo|mos|month|months)(?:\\s+\\d+\\s+(?:mo|mos|month|months))?"
+    ),
+    re.compile("\\d{4}\\s*-\\s*\\d{4}"),
+    re.compile("[A-Z][a-z]+\\s*\\d{4}"),
+    re.compile("Present"),
+    re.compile("\\(.*?\\)"),
+]
+SENTENCE_END = re.compile("[.!?]\\s+[A-Z]")
+
+AWARDS_HEADERS = KeywordMatcher(
+    header.replace(" ", "").replace("-", "")
+    for header in [
+        "honors-awards",
+        "honors & awards",
+        "awards and honors",
+        "awards & honors",
+        "honors and awards",
+        "awards",
+        "honors",
+        "recognition",
+        "certifications",
+        "licenses & certifications",
+        "licenses and certifications",
+    ]
+)
+AWARDS_STOP_HEADERS = KeywordMatcher(
+    [
+        "experience",
+        "employment",
+        "education",
+        "skills",
+        "languages",
+        "publications",
+        "projects",
+        "interests",
+        "contact",
+        "summary",
+        "about",
+        "recommendations",
+    ]
+)
+AWARD_ENDINGS = KeywordMatcher(
+    [
+        "winner",
+        "of the year",
+        "award",
+        "recognition",
+        "honoree",
+        "nominee",
+        "prize",
+        "medal",
+        "fellow",
+        "scholar",
+        "grant",
+    ]
+)
@@ -0,0 +1,341 @@
+"""Typed, compact parse results and their encodings.
+
+``parse_resume(..., typed=True)`` (and ``parse_resumes``) return a
+:class:`ParsedResume` instead of nested dicts. It and its :class:`Achievement`,
+:class:`Award` and :class:`SectionSpan` items are ``__slots__`` dataclasses,
+several times smaller than the equivalent dicts, and they are read-only
+mappings with the same keys, so code written against the dicts keeps working
+(``result["achievements"][0]["title"]``, ``result == old_dict``).
+
+Encodings:
+
+- :meth:`ParsedResume.to_json` / :meth:`ParsedResume.from_json`: the dict
+  form, without whitespace;
+- :meth:`ParsedResume.to_bytes` / :meth:`ParsedResume.from_bytes`, and
+  :func:`encode_results` / :func:`decode_results` for many at once: a
+  length-prefixed binary format (standard library only);
+- :func:`to_columns`: one table per record type with a column per attribute,
+  strings stored Arrow-style as one UTF-8 buffer plus offsets in NumPy arrays,
+  convertible with :func:`to_arrow` (needs ``pyarrow``, e.g. to write Parquet).
+"""
+
+import json
+import struct
+from collections.abc import Mapping
+from dataclasses import dataclass, fields
+from typing import TYPE_CHECKING, Any, ClassVar
+
+if TYPE_CHECKING:
+    import numpy
+
+_FORMAT_VERSION = 1
+_U32 = struct.Struct("<I")
+_U64 = struct.Struct("<Q")
+
+
+class _Record(Mapping):
+    """Read-only mapping view of a dataclass: its attributes that are not None,
+    with tuples of records shown as lists."""
+
+    __slots__ = ()
+    # Set by @dataclass on every subclass.
+    __dataclass_fields__: ClassVar[dict[str, Any]]
+
+    def __getitem__(self, key: str):
+        value = getattr(self, key, None) if key in self._keys() else None
+        if value is None:
+            raise KeyError(key)
+        return list(value) if isinstance(value, tuple) else value
+
+    def __iter__(self):
+        return (key for key in self._keys() if getattr(self, key) is not None)
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __repr__(self) -> str:
+        items = ", ".join(f"{key}={getattr(self, key)!r}" for key in self)
+        return f"{type(self).__name__}({items})"
+
+    @classmethod
+    def _keys(cls) -> tuple[str, ...]:
+        return tuple(field.name for field in fields(cls))
+
+    def to_dict(self) -> dict:
+        """Plain dicts and lists, as returned without ``typed=True``."""
+        return {
+            key: [item.to_dict() for item in value] if isinstance(value, list) else value
+            for key, value in self.items()
+        }
+
+
+@dataclass(frozen=True, slots=True, eq=False, repr=False)
+class Achievement(_Record):
+    title: str
+    description: str
+    metric: str
+
+
+@dataclass(frozen=True, slots=True, eq=False, repr=False)
+class Award(_Record):
+    title: str
+    description: str
+    metric: str
+
+
+@dataclass(frozen=True, slots=True, eq=False, repr=False)
+class SectionSpan(_Record):
+    """A named section with its character range (see ``extract_sections``)."""
+
+    name: str
+    title: str
+    start: int
+    end: int
+
+
+@dataclass(frozen=True, slots=True, eq=False, repr=False)
+class ParsedResume(_Record):
+    """One parse result. Fields that were not extracted (see ``fields=``) are
+    None and are left out of the mapping view, like ``status`` for parses
+    without limits or a deadline."""
+
+    name: str | None = None
+    role: str | None = None
+    email: str | None = None
+    phone: str | None = None
+    linkedin: str | None = None
+    location: str | None = None
+    summary: str | None = None
+    achievements: tuple[Achievement, ...] | None = None
+    awards: tuple[Award, ...] | None = None
+    sections: tuple[SectionSpan, ...] | None = None
+    status: dict | None = None
+
+    @classmethod
+    def from_dict(cls, data: Mapping) -> "ParsedResume":
+        """Build from a ``parse_resume`` dict (items may already be records)."""
+        values = {}
+        for key, value in data.items():
+            item_type = _ITEM_TYPES.get(key)
+            if item_type is not None:
+                value = tuple(
+                    item if isinstance(item, item_type) else item_type(**item) for item in value
+                )
+            values[key] = value
+        return cls(**values)
+
+    def to_json(self) -> str:
+        return json.dumps(self.to_dict(), ensure_ascii=False, separators=(",", ":"))
+
+    @classmethod
+    def from_json(cls, text: str | bytes) -> "ParsedResume":
+        return cls.from_dict(json.loads(text))
+
+    def to_bytes(self) -> bytes:
+        """Binary encoding: a bit per present field, then each field's value."""
+        out = bytearray([_FORMAT_VERSION])
+        present = [getattr(self, key) is not None for key in _RESULT_KEYS]
+        out += _U32.pack(sum(1 << i for i, flag in enumerate(present) if flag))
+        for key, flag in zip(_RESULT_KEYS, present):
+            if not flag:
+                continue
+            value = getattr(self, key)
+            if key == "status":
+                _pack_str(out, json.dumps(value, separators=(",", ":")))
+            elif key == "sections":
+                out += _U32.pack(len(value))
+                for span in value:
+                    _pack_str(out, span.name)
+                    _pack_str(out, span.title)
+                    out += _U64.pack(span.start)
+                    out += _U64.pack(span.end)
+            elif key in _ITEM_TYPES:
+                out += _U32.pack(len(value))
+                for item in value:
+                    _pack_str(out, item.title)
+                    _pack_str(out, item.description)
+                    _pack_str(out, item.metric)
+            else:
+                _pack_str(out, value)
+        return bytes(out)
+
+    @classmethod
+    def from_bytes(cls, data: bytes | memoryview) -> "ParsedResume":
+        return _Reader(data).result()
+
+
+_RESULT_KEYS = tuple(field.name for field in fields(ParsedResume))
+# Items encoded as title, description and metric.
+_TEXT_ITEM_TYPES: dict[str, type[Achievement] | type[Award]] = {
+    "achievements": Achievement,
+    "awards": Award,
+}
+_ITEM_TYPES: dict[str, type[Achievement] | type[Award] | type[SectionSpan]] = {
+    **_TEXT_ITEM_TYPES,
+    "sections": SectionSpan,
+}
+
+
+def _pack_str(out: bytearray, value: str) -> None:
+    encoded = value.encode("utf-8")
+    out += _U32.pack(len(encoded))
+    out += encoded
+
+
+class _Reader:
+    """Decoder of the ``to_bytes`` format."""
+
+    def __init__(self, data: bytes | memoryview):
+        self.data = bytes(data)
+        self.offset = 0
+
+    def u32(self) -> int:
+        value: int
+        (value,) = _U32.unpack_from(self.data, self.offset)
+        self.offset += 4
+        return value
+
+    def u64(self) -> int:
+        value: int
+        (value,) = _U64.unpack_from(self.data, self.offset)
+        self.offset += 8
+        return value
+
+    def str(self) -> str:
+        size = self.u32()
+        value = self.data[self.offset : self.offset + size].decode("utf-8")
+        self.offset += size
+        return value
+
+    def result(self) -> ParsedResume:
+        version = self.data[self.offset]
+        if version != _FORMAT_VERSION:
+            raise ValueError(f"Unsupported result encoding version {version}")
+        self.offset += 1
+        present = self.u32()
+        values = {}
+        for i, key in enumerate(_RESULT_KEYS):
+            if not present & (1 << i):
+                continue
+            if key == "status":
+                values[key] = json.loads(self.str())
+            elif key == "sections":
+                values[key] = tuple(
+                    SectionSpan(self.str(), self.str(), self.u64(), self.u64())
+                    for _ in range(self.u32())
+                )
+            elif key in _TEXT_ITEM_TYPES:
+                item_type = _TEXT_ITEM_TYPES[key]
+                values[key] = tuple(
+                    item_type(self.str(), self.str(), self.str()) for _ in range(self.u32())
+                )
+            else:
+                values[key] = self.str()
+        return ParsedResume(**values)
+
+
+def encode_results(results) -> bytes:
+    """Encode many results (``ParsedResume`` or dicts) as one binary blob."""
+    out = bytearray(_U32.pack(0))
+    count = 0
+    for result in results:
+        if not isinstance(result, ParsedResume):
+            result = ParsedResume.from_dict(result)
+        encoded = result.to_bytes()
+        out += _U32.pack(len(encoded))
+        out += encoded
+        count += 1
+    _U32.pack_into(out, 0, count)
+    return bytes(out)
+
+
+def decode_results(data: bytes | memoryview) -> list[ParsedResume]:
+    """Decode the output of :func:`encode_results`."""
+    reader = _Reader(data)
+    results = []
+    for _ in range(reader.u32()):
+        reader.u32()  # The record's size, for readers that skip records.
+        results.append(reader.result())
+    return results
+
+
+@dataclass(frozen=True, slots=True)
+class StringColumn:
+    """Strings stored Arrow-style: one UTF-8 buffer and ``len + 1`` offsets."""
+
+    offsets: "numpy.ndarray"
+    data: bytes
+
+    @classmethod
+    def from_strings(cls, values) -> "StringColumn":
+        import numpy
+
+        encoded = [value.encode("utf-8") for value in values]
+        offsets = numpy.zeros(len(encoded) + 1, dtype=numpy.int64)
+        numpy.cumsum([len(value) for value in encoded], out=offsets[1:])
+        return cls(offsets, b"".join(encoded))
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def __getitem__(self, index: int) -> str:
+        start, end = self.offsets[index], self.offsets[index + 1]
+        return self.data[start:end].decode("utf-8")
+
+    def tolist(self) -> list[str]:
+        return [self[i] for i in range(len(self))]
+
+
+def to_columns(results) -> dict[str, dict[str, Any]]:
+    """Lay many results out as four tables of columns.
+
+    ``resumes`` has a ``StringColumn`` per string field (missing fields are
+    empty strings). ``achievements``, ``awards`` and ``sections`` have one row
+    per item, with the index of its resume in the ``resume`` column (NumPy
+    ``int64``), string attributes as ``StringColumn`` and section offsets as
+    ``int64`` arrays.
+    """
+    import numpy
+
+    results = [r if isinstance(r, ParsedResume) else ParsedResume.from_dict(r) for r in results]
+    tables: dict[str, dict[str, Any]] = {
+        "resumes": {
+            key: StringColumn.from_strings(getattr(result, key) or "" for result in results)
+            for key in _RESULT_KEYS
+            if key not in _ITEM_TYPES and key != "status"
+        }
+    }
+    for key, item_type in _ITEM_TYPES.items():
+        rows = [
+            (i, item) for i, result in enumerate(results) for item in getattr(result, key) or ()
+        ]
+        table: dict[str, Any] = {"resume": numpy.array([i for i, _ in rows], dtype=numpy.int64)}
+        for attribute in item_type._keys():
+            values = [getattr(item, attribute) for _, item in rows]
+            if attribute in ("start", "end"):
+                table[attribute] = numpy.array(values, dtype=numpy.int64)
+            else:
+                table[attribute] = StringColumn.from_strings(values)
+        tables[key] = table
+    return tables
+
+
+def to_arrow(columns: dict[str, dict]) -> dict:
+    """Convert the output of :func:`to_columns` to ``pyarrow.Table`` objects
+    without copying the string buffers. Requires ``pyarrow``."""
+    try:
+        import pyarrow
+    except ImportError as e:
+        raise ImportError("to_arrow needs pyarrow: pip install pyarrow") from e
+
+    def array(column):
+        if isinstance(column, StringColumn):
+            return pyarrow.LargeStringArray.from_buffers(
+                len(column), pyarrow.py_buffer(column.offsets), pyarrow.py_buffer(column.data)
+            )
+        return pyarrow.array(column)
+
+    return {
+        name: pyarrow.table({key: array(column) for key, column in table.items()})
+        for name, table in columns.items()
+    }
@@ -1,103 +1,305 @@
 import logging
 import re
-import subprocess
-import sys
+import time
+from collections.abc import Iterator, Sequence
+from contextlib import contextmanager
+from contextvars import ContextVar
+from itertools import islice
+from typing import cast
 
-import pymupdf as fitz
-import spacy
+from . import patterns
+from .docstore import pipeline_id
+from .document import BULLET_PATTERN, ResumeDocument, text_of
+from .facts import LineFacts, line_facts_cache
+from .layout import layout_name
+from .limits import Limits, first_lines, run_sandboxed, with_status
+from .metrics import increment, recording, stage, timed
+from .model import ensure_spacy_model, get_nlp  # noqa: F401
+from .pages import PdfPages
+from .results import ParsedResume
+from .revisions import RevisionStore
+from .sources import PdfSource, describe, is_path, load_source
+from .stores import Stores
 
 logger = logging.getLogger(__name__)
 
+FIELDS = (
+    "name",
+    "role",
+    "email",
+    "phone",
+    "linkedin",
+    "location",
+    "summary",
+    "achievements",
+    "awards",
+    "sections",
+)
+HEADER_FIELDS = ("name", "role", "email", "phone", "linkedin", "location")
+# "full" uses spaCy where it helps; "fast" never imports it and runs the
+# rule-based paths of every extractor.
+PROFILES = ("full", "fast")
+# Fields that must be extracted before the key field (the order of FIELDS
+# already respects this).
+_FIELD_DEPENDENCIES = {"role": ("name",)}
+# Regex-only fields, extracted first when parsing against a deadline.
+_REGEX_FIELDS: tuple[str, ...] = ("email", "phone", "linkedin")
+# Fields whose extractors use the spaCy doc of the first 2000 characters, and
+# those that use spaCy at all.
+_SPACY_DOC_FIELDS = frozenset(["name", "location"])
+_NLP_FIELDS = _SPACY_DOC_FIELDS | {"achievements"}
+# The header extractors never look past line 55 (role: 50 + 5 following lines)
+# and spaCy only sees the first 2000 characters.
+_HEADER_LINES = 55
+_HEADER_CHARS = 2000
+_MAX_ACHIEVEMENTS = 8
 
-def ensure_spacy_model():
+
+def __getattr__(name):
+    # Backwards compatibility: ``resume_parser.resume_parser.nlp`` used to be a
+    # module global loaded at import time. Resolve it lazily instead.
+    if name == "nlp":
+        return get_nlp()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+# Docs computed ahead of time by ``parse_resumes`` (text -> Doc). Every spaCy
+# call made while parsing goes through ``_nlp_line`` so it can be served from here.
+_precomputed_docs: ContextVar[dict | None] = ContextVar("precomputed_docs", default=None)
+
+
+# Docs computed by ``_nlp_line`` while parsing a document for a ``DocStore``.
+_new_docs: ContextVar[dict | None] = ContextVar("new_docs", default=None)
+
+
+# True while a "fast" profile parse runs.
+_rules_only: ContextVar[bool] = ContextVar("rules_only", default=False)
+
+
+# ``time.perf_counter()`` value by which a parse with a ``deadline`` should be
+# done, and the fields it extracted on the rules-only path after that.
+_deadline: ContextVar[float | None] = ContextVar("deadline", default=None)
+_degraded: ContextVar[set | None] = ContextVar("degraded", default=None)
+
+
+# ``RevisionStore`` of the current parse, for its pages and section results.
+_revision_store: ContextVar = ContextVar("revision_store", default=None)
+
+
+def _out_of_time(*fields: str) -> bool:
+    """Whether the deadline has passed; if so ``fields`` are recorded as degraded."""
+    deadline = _deadline.get()
+    if deadline is None or time.perf_counter() < deadline:
+        return False
+    degraded = _degraded.get()
+    if degraded is not None:
+        degraded.update(fields)
+    return True
+
+
+@contextmanager
+def _within(deadline: float | None):
+    """Track degraded fields until ``deadline`` (a ``perf_counter`` value)."""
+    tokens = (_deadline.set(deadline), _degraded.set(set()))
     try:
-        spacy.load("en_core_web_sm")
-    except OSError:
-        logger.info("Downloading spaCy model 'en_core_web_sm'...")
-        try:
-            subprocess.check_call([
-                sys.executable,
-                "-m",
-                "spacy",
-                "download",
-                "en_core_web_sm",
-            ])
-        except Exception as e:
-            logging.exception(f"Failed to download spaCy model: {e}")
-
-
-ensure_spacy_model()
-try:
-    nlp = spacy.load("en_core_web_sm")
-except Exception as e:
-    logging.exception(f"Could not load spaCy model: {e}")
-    nlp = None
-
-
-def extract_text_from_pdf(file_path: str) -> str:
-    logger.info(f"Opening PDF with fitz: {file_path}")
+        yield _degraded.get()
+    finally:
+        _deadline.reset(tokens[0])
+        _degraded.reset(tokens[1])
+
+
+def _get_nlp():
+    """Return the spaCy pipeline, or None when parsing with the fast profile."""
+    return None if _rules_only.get() else get_nlp()
+
+
+@contextmanager
+def _using_revisions(store):
+    token = _revision_store.set(store)
     try:
-        doc = fitz.open(file_path)
-        text = ""
-        page_count = doc.page_count
-        logger.info(f"PDF has {page_count} pages")
-        for i, page in enumerate(doc):
-            page_text = page.get_text()
-            logger.debug(f"Extracted {len(page_text)} chars from page {i + 1}")
-            text += (
-                page_text
-                + """
-"""
-            )
-        return text
-    except Exception as e:
-        logger.exception(f"Error reading PDF: {e}")
+        yield
+    finally:
+        _revision_store.reset(token)
+
+
+@contextmanager
+def _using_profile(profile: str):
+    if profile not in PROFILES:
+        raise ValueError(f"Unknown profile {profile!r}; expected one of {PROFILES}")
+    token = _rules_only.set(profile == "fast")
+    try:
+        yield
+    finally:
+        _rules_only.reset(token)
+
+
+def _nlp_line(nlp, text: str):
+    docs = _precomputed_docs.get()
+    if docs:
+        doc = docs.get(text)
+        if doc is not None:
+            return doc
+    increment("nlp_calls")
+    doc = nlp(text)
+    new_docs = _new_docs.get()
+    if new_docs is not None:
+        new_docs[text] = doc
+    return doc
+
+
+def _line_facts(nlp, text: str) -> LineFacts:
+    """Analyse a single line, through the shared memo of line analyses."""
+    return line_facts_cache().lookup(nlp, text, _nlp_line)
+
+
+def extract_text_from_pdf(file_path: PdfSource, revision_store=None) -> str:
+    """Extract the text of every page.
+
+    ``file_path`` may also be PDF bytes, a ``memoryview``, an ``mmap`` or a
+    binary file-like object; see ``resume_parser.sources``. With a
+    ``RevisionStore`` each page is fingerprinted and the text of pages seen
+    before is taken from the store (see ``resume_parser.revisions``).
+    """
+    try:
+        with PdfPages(file_path, store=revision_store) as pages:
+            return pages.text()
+    except Exception:
+        logger.exception("Error reading PDF")
         return ""
 
 
+def _read_document(
+    source: PdfSource, layout: bool = False, limits: Limits | None = None
+) -> ResumeDocument:
+    """Extract the text of every page, with the line layout in layout mode.
+
+    With ``limits`` only as many pages, characters and lines as they allow are
+    read, and ``truncated`` of the document names the limits that were hit.
+    """
+    store = _revision_store.get()
+    if not layout and limits is None:
+        return ResumeDocument(extract_text_from_pdf(source, store))
+    try:
+        with PdfPages(source, layout=layout, store=store) as pages:
+            if limits is None:
+                return ResumeDocument(pages.text(), pages.layout())
+            text, truncated = _limited_text(pages, limits)
+            lines = None
+            if layout:
+                kept = sum(1 for line in text.splitlines() if line.strip())
+                lines = pages.layout()[:kept]
+            document = ResumeDocument(text, lines)
+            document.truncated = truncated
+            return document
+    except Exception:
+        logger.exception("Error reading PDF")
+        return ResumeDocument("")
+
+
+def _limited_text(pages: PdfPages, limits: Limits) -> tuple[str, list[str]]:
+    """Text of the leading pages within ``limits``, cut at a line boundary, and
+    the names of the limits that cut it short."""
+    truncated = []
+    count = len(pages)
+    if limits.max_pages is not None and count > limits.max_pages:
+        count = limits.max_pages
+        truncated.append("max_pages")
+    parts = []
+    chars = 0
+    for index in range(count):
+        page_text = pages[index]
+        if limits.max_chars is not None and chars + len(page_text) > limits.max_chars:
+            parts.append(page_text[: page_text.rfind("\n", 0, limits.max_chars - chars) + 1])
+            truncated.append("max_chars")
+            break
+        parts.append(page_text)
+        chars += len(page_text)
+    text = "".join(parts)
+    if limits.max_lines is not None:
+        text, cut = first_lines(text, limits.max_lines)
+        if cut:
+            truncated.append("max_lines")
+    if truncated:
+        logger.warning(f"Text cut short by {', '.join(truncated)}")
+    return text, truncated
+
+
+def _store_pipeline(doc_store, plan: tuple[str, ...]):
+    """The pipeline to key ``doc_store`` entries by, or None if it is not used."""
+    if doc_store is None or not _NLP_FIELDS.intersection(plan):
+        return None
+    return _get_nlp()
+
+
+def _read_stored(
+    source: PdfSource, layout: bool, doc_store, nlp, limits: Limits | None = None
+) -> tuple[ResumeDocument, tuple[str, dict | None] | None]:
+    """Read a loaded source, taking its text from ``doc_store`` when stored there.
+
+    Returns the document and its store entry ``(key, docs)``, where ``docs``
+    maps texts to their stored spaCy docs, or is None if the file is not stored
+    yet. The entry is None when the PDF bytes are not available. Layout mode
+    and ``limits`` still read the PDF (for the font and position data, and for
+    which limits cut the text short).
+    """
+    if is_path(source):
+        logger.warning(f"Could not read {describe(source)} for the doc store")
+        return _read_document(source, layout, limits), None
+    config: dict = {}
+    if layout:
+        config["layout"] = True
+    if limits is not None and limits.config():
+        config["limits"] = limits.config()
+    key = doc_store.key_for(source, nlp, config or None)
+    stored = doc_store.load(key, nlp)
+    if stored is None:
+        increment("doc_store_misses")
+        return _read_document(source, layout, limits), (key, None)
+    increment("doc_store_hits")
+    text, docs = stored
+    if layout or limits is not None:
+        document = _read_document(source, layout, limits)
+    else:
+        document = ResumeDocument(text)
+    return document, (key, docs)
+
+
 def clean_text(text: str) -> str:
-    return re.sub("\\s+", " ", text).strip()
+    return patterns.WHITESPACE.sub(" ", text).strip()
 
 
-def extract_email(text: str) -> str:
-    email_pattern = "[\\w\\.-]+@[\\w\\.-]+\\.\\w+"
-    match = re.search(email_pattern, text)
+def extract_email(text: str | ResumeDocument) -> str:
+    match = patterns.EMAIL.search(text_of(text))
     return match.group(0) if match else ""
 
 
-def extract_phone(text: str) -> str:
-    phone_pattern = "[\\+]?[(]?[0-9]{3}[)]?[-\\s\\.]?[0-9]{3}[-\\s\\.]?[0-9]{4,6}"
-    match = re.search(phone_pattern, text)
+def extract_phone(text: str | ResumeDocument) -> str:
+    match = patterns.PHONE.search(text_of(text))
     return match.group(0) if match else ""
 
 
-def extract_linkedin(text: str) -> str:
+def extract_linkedin(text: str | ResumeDocument) -> str:
     """Extract LinkedIn URL with support for multiple formats and split lines."""
-    lines = [l.strip() for l in text.splitlines() if l.strip()]
-    text_block = " ".join(lines[:50])
-    text_block_lower = text_block.lower()
-    standard_pattern = "linkedin\\.com/in/\\s*([\\w-]+)"
-    match = re.search(standard_pattern, text_block_lower)
+    document = ResumeDocument.of(text)
+    lines = document.lines
+    text_block_lower = " ".join(document.lower[:50])
+    match = patterns.LINKEDIN_URL.search(text_block_lower)
     if match:
         return f"https://linkedin.com/in/{match.group(1)}"
-    marker_pattern = "([\\w-]+)\\s*\\(linkedin\\)"
-    match = re.search(marker_pattern, text_block_lower)
+    match = patterns.LINKEDIN_MARKER.search(text_block_lower)
     if match:
         return f"https://linkedin.com/in/{match.group(1)}"
-    for i, line in enumerate(lines[:30]):
-        clean_line = line.lower()
+    for i, clean_line in enumerate(document.lower[:30]):
         if "linkedin.com/in/" in clean_line:
             if clean_line.endswith("/in/") and i + 1 < len(lines):
                 username = lines[i + 1].split()[0]
-                username = re.sub(
-                    "\\(linkedin\\)", "", username, flags=re.IGNORECASE
-                ).strip()
-                if re.match("^[\\w-]+$", username):
+                username = patterns.LINKEDIN_MARKER_ANY_CASE.sub("", username).strip()
+                if patterns.LINKEDIN_USERNAME.match(username):
                     return f"https://linkedin.com/in/{username}"
     return ""
 
 
-def extract_role(text: str, name: str) -> str:
+def extract_role(text: str | ResumeDocument, name: str) -> str:
     """Extract role/title from Resume or LinkedIn PDF.
 
     Attempts two patterns:
@@ -106,271 +308,165 @@ def extract_role(text: str, name: str) -> str:
     """
     if not name:
         return ""
-    lines = [l.strip() for l in text.splitlines() if l.strip()]
+    document = ResumeDocument.of(text)
+    lines = document.lines
+    lower = document.lower
     name_lower = name.lower()
     name_words_count = len(name.split())
-    role_keywords = [
-        "engineer",
-        "developer",
-        "manager",
-        "director",
-        "consultant",
-        "founder",
-        "ceo",
-        "cto",
-        "coo",
-        "cfo",
-        "vp",
-        "president",
-        "lead",
-        "head",
-        "chief",
-        "analyst",
-        "designer",
-        "architect",
-        "specialist",
-        "advisor",
-        "partner",
-        "scientist",
-        "researcher",
-        "professor",
-        "coach",
-        "strategist",
-        "executive",
-        "expert",
-    ]
-    skip_patterns = [
-        "summary",
-        "experience",
-        "education",
-        "skills",
-        "contact",
-        "languages",
-        "publications",
-        "certifications",
-        "page ",
-        "top skills",
-    ]
+    role_keywords = patterns.ROLE_KEYWORDS
+    skip_patterns = patterns.ROLE_SKIP
     for i, line in enumerate(lines[:50]):
-        line_lower = line.lower()
-        line_words = line.split()
+        line_lower = lower[i]
         is_standalone_name = (
             name_lower in line_lower
-            and len(line_words) <= name_words_count + 1
-            and (not any(skip in line_lower for skip in skip_patterns))
+            and len(line.split()) <= name_words_count + 1
+            and (not skip_patterns.search(line_lower))
         )
         if is_standalone_name:
             role_parts = []
             for j in range(i + 1, min(i + 6, len(lines))):
                 candidate = lines[j]
-                candidate_lower = candidate.lower()
+                candidate_lower = lower[j]
                 if (
                     "area" in candidate_lower
                     or ("," in candidate and len(candidate.split(",")) == 2)
-                    or any(skip in candidate_lower for skip in skip_patterns)
+                    or skip_patterns.search(candidate_lower)
                 ):
                     break
-                if any(kw in candidate_lower for kw in role_keywords) or (
+                if role_keywords.search(candidate_lower) or (
                     candidate[0].isupper() and len(candidate.split()) < 12
                 ):
                     role_parts.append(candidate)
                 elif role_parts:
                     break
             if role_parts:
-                full_role = " ".join(role_parts)
-                return re.sub("\\s+", " ", full_role).strip()
-    for line in lines[:10]:
-        line_lower = line.lower()
+                return clean_text(" ".join(role_parts))
+    for line, line_lower in zip(lines[:10], lower[:10]):
         if "|" in line or " / " in line or " • " in line:
-            if any(kw in line_lower for kw in role_keywords):
-                parts = re.split("\\||\\/|\\u2022", line)
-                for part in parts:
+            if role_keywords.search(line_lower):
+                for part in patterns.ROLE_SEPARATORS.split(line):
                     part = part.strip()
-                    if any(kw in part.lower() for kw in role_keywords):
+                    if role_keywords.search(part.lower()):
                         return part
     return ""
 
 
-def extract_name(text: str, nlp_doc) -> str:
-    lines = [line.strip() for line in text.splitlines() if line.strip()]
-    if not lines:
-        return ""
-    non_name_indicators = [
-        "page",
-        "curriculum",
-        "resume",
-        "contact",
-        "mobile",
-        "email",
-        "linkedin",
-        "publications",
-        "certifications",
-        "skills",
-        "languages",
-        "honors",
-        "awards",
-        "greater",
-        "area",
-        "region",
-        "metro",
-        "north",
-        "south",
-        "east",
-        "west",
-        "central",
-        "bay",
-        "united states",
-        "kingdom",
-        "canada",
-        "australia",
-        "software engineer",
-        "software design",
-        "software infrastructure",
-        "software development",
-        "developer",
-        "manager",
-        "director",
-        "consultant",
-        "specialist",
-        "top skills",
-        "summary",
-    ]
-    for i, line in enumerate(lines[:50]):
-        if line.lower() == "summary" or line.lower().startswith("summary"):
+def _rule_based_name(document: ResumeDocument) -> str:
+    """Find the name from layout heuristics alone (no NLP)."""
+    non_name_indicators = patterns.NON_NAME_INDICATORS
+    lines = document.lines
+    lower = document.lower
+    for i, line_lower in enumerate(lower[:50]):
+        if line_lower.startswith("summary"):
             for j in range(i - 1, max(-1, i - 10), -1):
                 candidate = lines[j]
-                candidate_lower = candidate.lower()
                 if len(candidate.split()) < 2:
                     continue
                 if (
                     1 < len(candidate.split()) <= 4
-                    and (not any(char.isdigit() for char in candidate))
-                    and ("@" not in candidate)
-                    and (not any(w in candidate_lower for w in non_name_indicators))
+                    and (not document.has_digit[j])
+                    and (not document.has_at[j])
+                    and (not non_name_indicators.search(lower[j]))
                 ):
                     if candidate.istitle() or candidate.isupper():
                         return candidate.title()
     for i in range(min(5, len(lines))):
         line = lines[i]
         if (
-            "@" in line
-            or "phone" in line.lower()
-            or "resume" in line.lower()
-            or ("curriculum" in line.lower())
-            or ("contact" in line.lower())
-            or any(w in line.lower() for w in non_name_indicators)
+            document.has_at[i]
+            or patterns.NAME_HEADER_SKIP.search(lower[i])
+            or non_name_indicators.search(lower[i])
         ):
             continue
-        if re.match("^[A-Z][a-z]+(\\s+[A-Z][a-z]+){1,2}$", line):
+        if patterns.TITLE_CASE_NAME.match(line):
             return line.title()
-    if nlp_doc:
-        for i in range(min(15, len(lines))):
-            line = lines[i]
-            if any(
-                h in line.lower()
-                for h in ["summary", "experience", "education", "skills", "contact"]
-            ):
-                continue
-            doc = nlp(line)
-            for ent in doc.ents:
-                if ent.label_ == "PERSON" and len(ent.text.split()) >= 2:
-                    if ent.text.lower() not in [
-                        "curriculum vitae",
-                        "resume",
-                        "software engineer",
-                        "contact",
-                        "email",
-                    ] and (not any(w in ent.text.lower() for w in non_name_indicators)):
-                        return ent.text.title()
+    return ""
+
+
+def _direct_name(document: ResumeDocument) -> str:
+    """Find the name without NLP: from the font sizes in layout mode, else from
+    the line heuristics."""
+    if document.layout:
+        name = layout_name(document.layout)
+        if name:
+            return name
+    return _rule_based_name(document)
+
+
+def _name_ner_lines(document: ResumeDocument) -> list[str]:
+    """Return the header lines the NER fallback of ``extract_name`` looks at."""
+    return [
+        line
+        for line, line_lower in zip(document.lines[:15], document.lower[:15])
+        if not patterns.NER_LINE_SKIP.search(line_lower)
+    ]
+
+
+def extract_name(text: str | ResumeDocument, nlp_doc) -> str:
+    document = ResumeDocument.of(text)
+    lines = document.lines
+    if not lines:
+        return ""
+    non_name_indicators = patterns.NON_NAME_INDICATORS
+    name = _direct_name(document)
+    if name:
+        return name
+    nlp = _get_nlp() if nlp_doc else None
+    if nlp:
+        for line in _name_ner_lines(document):
+            if _out_of_time("name"):
+                break
+            for ent_text, label in _line_facts(nlp, line).ents:
+                if label == "PERSON" and len(ent_text.split()) >= 2:
+                    ent_lower = ent_text.lower()
+                    if ent_lower not in patterns.NOT_A_NAME and (
+                        not non_name_indicators.search(ent_lower)
+                    ):
+                        return ent_text.title()
     first_line = lines[0]
     if (
         1 < len(first_line.split()) < 5
-        and (not any(char.isdigit() for char in first_line))
-        and (not any(w in first_line.lower() for w in non_name_indicators))
+        and (not document.has_digit[0])
+        and (not non_name_indicators.search(document.lower[0]))
     ):
         return first_line.title()
     return ""
 
 
-def extract_location(text: str, nlp_doc) -> str:
+def extract_location(text: str | ResumeDocument, nlp_doc) -> str:
     """Extract location with pattern matching and tech blacklist fallback."""
-    tech_blacklist = {
-        "Spark",
-        "Python",
-        "Java",
-        "Docker",
-        "Kubernetes",
-        "React",
-        "Elastic",
-        "Spring",
-        "Swift",
-        "Kafka",
-        "Pandas",
-        "Ansible",
-        "Terraform",
-        "Unity",
-        "AWS",
-        "Azure",
-        "GCP",
-        "Linux",
-        "Node",
-        "Django",
-        "Flask",
-        "FastAPI",
-    }
-    lines = [line.strip() for line in text.splitlines() if line.strip()][:10]
-    location_pattern = (
-        "([A-Z][a-z]+(?:\\s[A-Z][a-z]+)*),\\s([A-Z]{2})(?:\\s*\\(Remote\\))?"
-    )
-    for line in lines:
-        match = re.search(location_pattern, line)
+    for line in ResumeDocument.of(text).lines[:10]:
+        match = patterns.CITY_STATE.search(line)
         if match:
             city, state = match.groups()
             return f"{city}, {state}"
     if nlp_doc:
         for ent in nlp_doc.ents:
             if ent.label_ == "GPE":
-                if ent.text not in tech_blacklist and len(ent.text) > 2:
+                if ent.text not in patterns.TECH_BLACKLIST and len(ent.text) > 2:
                     return ent.text
     return ""
 
 
-def extract_summary(text: str) -> str:
-    headers = ["summary", "profile", "professional summary", "about me", "objective"]
-    stop_headers = [
-        "experience",
-        "employment",
-        "work history",
-        "skills",
-        "education",
-        "projects",
-        "certifications",
-        "publications",
-        "languages",
-        "interests",
-    ]
-    lines = text.splitlines()
-    for i, line in enumerate(lines):
-        clean_header = line.strip().lower()
-        clean_header = re.sub("[:\\-]+", "", clean_header).strip()
-        if clean_header in headers:
-            summary = []
-            for j in range(i + 1, len(lines)):
-                content = lines[j].strip()
-                if not content:
-                    continue
-                clean_content = re.sub("[:\\-]+", "", content.lower()).strip()
-                if clean_content in stop_headers:
-                    break
-                if content.isupper() and len(content) < 30 and (" " not in content):
-                    break
-                if re.match("^[●•\\-\\*\\u2022\\u2023\\u2043\\u204c]", content):
-                    break
-                summary.append(content)
-                if len(summary) > 25:
-                    break
-            return " ".join(summary)
-    return ""
+def extract_summary(text: str | ResumeDocument) -> str:
+    document = ResumeDocument.of(text)
+    lines = document.lines
+    sections = document.sections
+    header = sections.first("summary")
+    if header < 0:
+        return ""
+    end = sections.first("summary_stop", header + 1)
+    summary = []
+    for j in range(header + 1, end if end >= 0 else len(lines)):
+        content = lines[j]
+        if document.is_upper[j] and len(content) < 30 and (" " not in content):
+            break
+        if document.is_bullet[j]:
+            break
+        summary.append(content)
+        if len(summary) > 25:
+            break
+    return " ".join(summary)
 
 
 def is_job_header_line(line: str) -> bool:
@@ -378,47 +474,11 @@ def is_job_header_line(line: str) -> bool:
     line = line.strip()
     if not line:
         return False
-    date_range_pattern = "(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\\.?\\s+\\d{4}\\s*[-–]\\s*(?:Present|(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\\.?\\s+\\d{4})"
-    if re.search(date_range_pattern, line, re.IGNORECASE):
+    if patterns.JOB_DATE_RANGE.search(line):
         return True
-    tenure_pattern = "^(\\(?\\d+\\s+(?:yr|yrs|year|years|mo|mos|month|months).*)|(^\\d{4}\\s*[-–]\\s*(?:Present|\\d{4}))"
-    if re.match(tenure_pattern, line, re.IGNORECASE):
+    if patterns.JOB_TENURE.match(line):
         return True
-    titles = [
-        "Engineering",
-        "Software",
-        "Senior",
-        "Lead",
-        "Staff",
-        "Principal",
-        "Director",
-        "Manager",
-        "VP",
-        "CEO",
-        "CTO",
-        "COO",
-        "CFO",
-        "Founder",
-        "Owner",
-        "Co-Founder",
-        "President",
-        "Advisor",
-        "Consultant",
-        "Head",
-        "Chief",
-    ]
-    title_suffixes = [
-        "Manager",
-        "Engineer",
-        "Developer",
-        "Architect",
-        "Director",
-        "Officer",
-        "Lead",
-        "Specialist",
-    ]
-    title_pattern = f"^(?:{'|'.join(titles)})\\s*(?:{'|'.join(title_suffixes)})?$"
-    if re.match(title_pattern, line, re.IGNORECASE):
+    if patterns.JOB_TITLE.match(line):
         return True
     if len(line) < 50 and (not line.startswith(("•", "-", "*"))) and ("." not in line):
         words = line.split()
@@ -427,76 +487,30 @@ def is_job_header_line(line: str) -> bool:
     return False
 
 
-def extract_achievements(text: str) -> list[dict[str, str]]:
-    achievements = []
-    raw_lines = text.splitlines()
-    impact_words = [
-        "increased",
-        "decreased",
-        "improved",
-        "reduced",
-        "saved",
-        "generated",
-        "delivered",
-        "led",
-        "managed",
-        "built",
-        "launched",
-        "achieved",
-        "optimized",
-        "streamlined",
-        "developed",
-        "co-developed",
-        "created",
-        "implemented",
-        "scaled",
-        "grew",
-    ]
-    contact_patterns = ["@", "+", "www.", "linkedin.com", "/in/", "tel:", "phone:"]
-    header_patterns = [
-        "\\|.*\\(",
-        "\\d{4}[\\u2013\\-](?:\\d{4}|Present)",
-        "[\\u2013\\-]\\s*[A-Z]{2}$",
-        "^(?:Education|Experience|Skills|Summary|Objective|Awards)",
-    ]
-    continuation_starters = {
-        "that",
-        "which",
-        "and",
-        "but",
-        "or",
-        "with",
-        "by",
-        "for",
-        "from",
-        "to",
-        "in",
-        "of",
-        "at",
-        "as",
-        "on",
-        "while",
-        "where",
-        "when",
-        "who",
-        "whose",
-    }
+def _merge_bullet_lines(document: ResumeDocument, indexes: range | None = None) -> list[str]:
+    """Join wrapped bullet and continuation lines (of ``indexes``, by default
+    all lines) into logical lines."""
+    contact_patterns = patterns.CONTACT
+    continuation_starters = patterns.BULLET_CONTINUATION_STARTERS
     merged_lines = []
     current_bullet = ""
-    for line in raw_lines:
-        line = line.strip().replace("\u200b", "")
-        if not line:
-            continue
-        is_bullet_start = bool(
-            re.match("^[●•\\-\\*\\u2022\\u2023\\u2043\\u204c]", line)
-        )
-        is_header = any(re.search(p, line) for p in header_patterns)
+    for i in range(len(document.lines)) if indexes is None else indexes:
+        line = document.lines[i]
+        if "\u200b" in line:
+            line = line.replace("\u200b", "")
+            if not line:
+                continue
+            line_lower = line.lower()
+            is_bullet_start = bool(BULLET_PATTERN.match(line))
+            is_upper = line.isupper()
+        else:
+            line_lower = document.lower[i]
+            is_bullet_start = document.is_bullet[i]
+            is_upper = document.is_upper[i]
+        is_header = patterns.SECTION_BREAK.search(line) is not None
         is_job_meta = is_job_header_line(line)
         is_likely_new_section = (
-            is_header
-            or (line.isupper() and len(line) < 50)
-            or "Present" in line
-            or is_job_meta
+            is_header or (is_upper and len(line) < 50) or "Present" in line or is_job_meta
         )
         if is_job_meta and current_bullet:
             merged_lines.append(current_bullet)
@@ -520,7 +534,7 @@ def extract_achievements(text: str) -> list[dict[str, str]]:
         elif current_bullet:
             if (
                 not is_likely_new_section
-                and (not any(p in line.lower() for p in contact_patterns))
+                and (not contact_patterns.search(line_lower))
                 and (len(line.split()) >= 1)
             ):
                 current_bullet = f"{current_bullet} {line}"
@@ -533,398 +547,883 @@ def extract_achievements(text: str) -> list[dict[str, str]]:
             merged_lines.append(line)
     if current_bullet:
         merged_lines.append(current_bullet)
-    continuation_starters.update({
-        "resulting",
-        "including",
-        "utilizing",
-        "leveraging",
-        "while",
-        "during",
-        "within",
-        "across",
-        "through",
-        "plus",
-        "also",
-        "additionally",
-        "furthermore",
-    })
-    for line in merged_lines:
-        line = re.sub("\\s+", " ", line).strip()
-        if any(pattern in line.lower() for pattern in contact_patterns):
+    return merged_lines
+
+
+def _achievement_blocks(document: ResumeDocument) -> list[range]:
+    """Line indexes of each experience section (of the whole text if it has
+    none). Achievements are mined from each independently."""
+    experience = document.sections.named("experience")
+    if not experience:
+        return [range(len(document.lines))]
+    return [section.lines for section in experience]
+
+
+def _achievement_candidates(
+    document: ResumeDocument, indexes: range | None = None
+) -> Iterator[tuple[str, str, str]]:
+    """Yield ``(line, description, metric)`` for each line (of ``indexes``, by
+    default all experience sections) passing the rule-based filters, in order.
+    Only these lines reach (spaCy) title generation."""
+    if indexes is None:
+        for block in _achievement_blocks(document):
+            yield from _achievement_candidates(document, block)
+        return
+    for line in _merge_bullet_lines(document, indexes):
+        line = clean_text(line)
+        # Cheapest rejects first: most lines carry no number at all.
+        if not any(char.isdigit() for char in line):
             continue
-        if re.match(
-            "^(?:I\\s+(?:am|was|have|had|own|lead|managed|worked|built)|My\\s+)",
-            line,
-            re.IGNORECASE,
-        ):
+        line_lower = line.lower()
+        if not (any(char in "%$+" for char in line) or patterns.IMPACT.search(line_lower)):
             continue
-        if re.match(
-            "^(?:jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)\\w*\\s+\\d{4}",
-            line,
-            re.IGNORECASE,
-        ):
+        if patterns.CONTACT.search(line_lower):
+            continue
+        if patterns.FIRST_PERSON.match(line):
             continue
-        has_number = any(char.isdigit() for char in line)
-        has_symbol = any(char in ["%", "$", "+"] for char in line)
-        has_impact = any(word in line.lower() for word in impact_words)
-        cleaned_start = re.sub("^[●•\\-\\*\\d]+\\.*\\s*", "", line)
-        if not cleaned_start:
+        if patterns.STARTS_WITH_DATE.match(line):
             continue
-        first_word = cleaned_start.split()[0].lower()
+        cleaned = patterns.LEADING_MARKER.sub("", line)
+        if not cleaned:
+            continue
+        first_word = cleaned.split()[0].lower()
         if (
-            first_word in continuation_starters
-            or cleaned_start[0].islower()
+            first_word in patterns.CONTINUATION_STARTERS
+            or cleaned[0].islower()
             or first_word.replace("%", "").isdigit()
         ):
             continue
-        if has_number and (has_symbol or has_impact):
-            cleaned = cleaned_start
-            if re.match("^[\\d%]+\\s", cleaned) or cleaned.startswith("%"):
-                continue
-            if re.search("Page\\s+\\d+\\s+of\\s+\\d+", cleaned, re.IGNORECASE):
-                continue
-            metric_match = re.search(
-                "(\\d+(?:\\.\\d+)?\\s*(?:%|k|M|B|\\+|years?|yrs?|users?|customers?))",
-                cleaned,
-                re.IGNORECASE,
-            )
-            metric = metric_match.group(1) if metric_match else "Key Result"
-            title = "Impact Highlight"
-            title_set = False
-            doc = nlp(cleaned) if nlp else None
-            if doc:
-                first_token = doc[0]
-                if (
-                    first_token.pos_ == "VERB"
-                    or first_token.text.lower() in impact_words
+        if patterns.LEADING_NUMBER.match(cleaned) or cleaned.startswith("%"):
+            continue
+        if patterns.PAGE_FOOTER.search(cleaned):
+            continue
+        description = _achievement_description(cleaned)
+        if description is None:
+            continue
+        metric_match = patterns.METRIC.search(cleaned)
+        yield cleaned, description, metric_match.group(1) if metric_match else "Key Result"
+
+
+def _achievement_description(cleaned: str) -> str | None:
+    """Trim an achievement line to its description; None if it is too short."""
+    description = patterns.PAGE_FOOTER.sub("", cleaned)
+    for pat in patterns.TENURE_PATTERNS:
+        match = pat.search(description)
+        if match and match.start() > 50:
+            description = description[: match.start()].strip()
+    if len(description) < 80:
+        return None
+    if len(description) > 600:
+        end_match = None
+        for match in patterns.SENTENCE_END.finditer(description[100:600]):
+            end_match = match
+        if end_match:
+            description = description[: 100 + end_match.start() + 1]
+        else:
+            last_space = description[:600].rfind(" ")
+            if last_space > 100:
+                description = description[:last_space] + "..."
+            else:
+                description = description[:600] + "..."
+    description = description.strip()
+    if not description.endswith((".", "!", "?", "...")):
+        description += "."
+    return description
+
+
+def _achievement_title(cleaned: str, nlp) -> str | None:
+    """Build a short title for an achievement line, using spaCy when available."""
+    impact_words = patterns.IMPACT_WORD_SET
+    title = "Impact Highlight"
+    title_set = False
+    facts = _line_facts(nlp, cleaned) if nlp else None
+    if facts:
+        first_token = facts.tokens[0]
+        if facts.first_pos == "VERB" or first_token.lower() in impact_words:
+            obj_phrase = []
+            for token in facts.tokens[1:6]:
+                if token.lower() in (
+                    ",",
+                    ".",
+                    "and",
+                    "with",
+                    "using",
+                    "by",
+                    "for",
+                    "of",
+                    "to",
+                    "in",
+                    "on",
+                    "at",
+                    "that",
+                    "which",
                 ):
-                    obj_phrase = []
-                    for token in doc[1:6]:
-                        if token.text.lower() in (
-                            ",",
-                            ".",
-                            "and",
-                            "with",
-                            "using",
-                            "by",
-                            "for",
-                            "of",
-                            "to",
-                            "in",
-                            "on",
-                            "at",
-                            "that",
-                            "which",
-                        ):
-                            break
-                        obj_phrase.append(token.text)
-                    if obj_phrase:
-                        title = f"{first_token.text} {' '.join(obj_phrase)}"
-                        title_set = True
-            if not title_set and nlp:
-                verb = ""
-                words_in_line = [
-                    w.strip(",.").replace("\u200b", "") for w in cleaned.split()
-                ]
-                if not words_in_line:
+                    break
+                obj_phrase.append(token)
+            if obj_phrase:
+                title = f"{first_token} {' '.join(obj_phrase)}"
+                title_set = True
+    if not title_set and facts is not None:
+        verb = ""
+        words_in_line = [w.strip(",.").replace("\u200b", "") for w in cleaned.split()]
+        if not words_in_line:
+            return None
+        first_word = words_in_line[0].lower()
+        if first_word in impact_words:
+            verb = words_in_line[0].capitalize()
+        else:
+            for token in facts.tokens:
+                if token.lower() in impact_words:
+                    verb = token.capitalize()
+                    break
+        if verb:
+            candidate_phrases = []
+            for chunk_text, root_pos in facts.noun_chunks:
+                if root_pos == "PRON":
                     continue
-                first_word = words_in_line[0].lower()
-                if first_word in impact_words:
-                    verb = words_in_line[0].capitalize()
-                else:
-                    for token in doc:
-                        if token.text.lower() in impact_words:
-                            verb = token.text.capitalize()
-                            break
-                if verb:
-                    candidate_phrases = []
-                    for chunk in doc.noun_chunks:
-                        if chunk.root.pos_ == "PRON":
-                            continue
-                        chunk_text = chunk.text.strip()
-                        chunk_text = re.sub(
-                            "^(the|a|an)\\s+", "", chunk_text, flags=re.IGNORECASE
-                        )
-                        phrase_words = [
-                            w.capitalize()
-                            for w in chunk_text.split()
-                            if w.lower() != verb.lower()
-                        ]
-                        if phrase_words:
-                            candidate_phrases.append(" ".join(phrase_words))
-                    if candidate_phrases:
-                        generic_terms = {
-                            "Activity",
-                            "Project",
-                            "Task",
-                            "Work",
-                            "Process",
-                            "Initiative",
-                            "Core",
-                            "Role",
-                            "Time",
-                            "System",
-                            "Systems",
-                            "Team",
-                            "Teams",
-                            "Platform",
-                            "Feature",
-                            "Company",
-                        }
-                        best_phrase = candidate_phrases[0]
-                        for phrase in candidate_phrases:
-                            if len(phrase.split()) == 1 and phrase in generic_terms:
-                                continue
-                            if (
-                                best_phrase in generic_terms
-                                and phrase not in generic_terms
-                            ):
-                                best_phrase = phrase
-                                break
-                            if (
-                                len(phrase.split()) > len(best_phrase.split())
-                                and best_phrase in generic_terms
-                            ):
-                                best_phrase = phrase
-                        title = f"{verb} {best_phrase}"
-                        title_set = True
-                    else:
-                        title = f"{verb} Initiative"
-                        title_set = True
-                if not title_set and (
-                    "co-developed" in cleaned.lower() or "developed" in cleaned.lower()
-                ):
-                    match = re.search(
-                        "(?:co-developed|developed)\\s+([A-Z][\\w\\-]+(?:\\s+(?:(?!using|with|for|by|to|through)[A-Za-z][\\w\\-]+))*)",
-                        cleaned,
-                        re.IGNORECASE,
-                    )
-                    if match:
-                        # Extract and clean the text first (f-strings can't contain backslashes)
-                        cleaned_text = match.group(1).replace("\u200b", "")
-                        title = f"Developed {cleaned_text}"
-                        title_set = True
-            filler_words = {
-                "Using",
-                "With",
-                "And",
-                "For",
-                "By",
-                "In",
-                "To",
-                "The",
-                "A",
-                "An",
-                "Of",
-                "Through",
-                "At",
-                "On",
-                "That",
-                "Which",
-            }
-            words = title.split()
-            while words and words[-1].capitalize() in filler_words:
-                words.pop()
-            if len(words) <= 2 and words[0] in [
-                "Led",
-                "Managed",
-                "Developed",
-                "Built",
-                "Created",
-            ]:
-                desc_words = [
-                    w.strip(",.").replace("\u200b", "") for w in cleaned.split()
+                chunk_text = chunk_text.strip()
+                chunk_text = re.sub("^(the|a|an)\\s+", "", chunk_text, flags=re.IGNORECASE)
+                phrase_words = [
+                    w.capitalize() for w in chunk_text.split() if w.lower() != verb.lower()
                 ]
-                if len(desc_words) > len(words) + 1:
-                    for i in range(len(words), min(len(desc_words), 6)):
-                        candidate = desc_words[i]
-                        if (
-                            candidate.capitalize() not in filler_words
-                            and len(candidate) > 2
-                        ):
-                            words.append(candidate.capitalize())
-                            if len(words) >= 4:
-                                break
-            if len(words) > 4:
-                words = words[:4]
-            title = " ".join(words).title()
-            title_words = title.split()
-            if len(title_words) >= 2 and title_words[0] == title_words[1]:
-                title = " ".join(title_words[1:])
-            if len(title_words) >= 4 and title_words[1] == title_words[2]:
-                title_words.pop(2)
-                title = " ".join(title_words)
-            if "(" in title and ")" not in title:
-                title = title.split("(")[0].strip()
+                if phrase_words:
+                    candidate_phrases.append(" ".join(phrase_words))
+            if candidate_phrases:
+                generic_terms = {
+                    "Activity",
+                    "Project",
+                    "Task",
+                    "Work",
+                    "Process",
+                    "Initiative",
+                    "Core",
+                    "Role",
+                    "Time",
+                    "System",
+                    "Systems",
+                    "Team",
+                    "Teams",
+                    "Platform",
+                    "Feature",
+                    "Company",
+                }
+                best_phrase = candidate_phrases[0]
+                for phrase in candidate_phrases:
+                    if len(phrase.split()) == 1 and phrase in generic_terms:
+                        continue
+                    if best_phrase in generic_terms and phrase not in generic_terms:
+                        best_phrase = phrase
+                        break
+                    if (
+                        len(phrase.split()) > len(best_phrase.split())
+                        and best_phrase in generic_terms
+                    ):
+                        best_phrase = phrase
+                title = f"{verb} {best_phrase}"
+                title_set = True
             else:
-                title = re.sub("\\([^)]*\\)", "", title).strip()
-            title = title.replace(
-                "Impact Highlight Impact Highlight", "Impact Highlight"
-            )
-            description = cleaned
-            description = re.sub(
-                "Page\\s+\\d+\\s+of\\s+\\d+", "", description, flags=re.IGNORECASE
+                title = f"{verb} Initiative"
+                title_set = True
+        if not title_set and ("co-developed" in cleaned.lower() or "developed" in cleaned.lower()):
+            match = re.search(
+                "(?:co-developed|developed)\\s+([A-Z][\\w\\-]+(?:\\s+(?:(?!using|with|for|by|to|through)[A-Za-z][\\w\\-]+))*)",
+                cleaned,
+                re.IGNORECASE,
             )
-            tenure_patterns = [
-                "\\d+\\s+(?:yr|yrs|year|years|mo|mos|month|months)(?:\\s+\\d+\\s+(?:mo|mos|month|months))?",
-                "\\d{4}\\s*-\\s*\\d{4}",
-                "[A-Z][a-z]+\\s*\\d{4}",
-                "Present",
-                "\\(.*?\\)",
-            ]
-            for pat in tenure_patterns:
-                match = re.search(pat, description)
-                if match and match.start() > 50:
-                    description = description[: match.start()].strip()
-            if len(description) < 80:
+            if match:
+                # Extract and clean the text first (f-strings can't contain backslashes)
+                cleaned_text = match.group(1).replace("\u200b", "")
+                title = f"Developed {cleaned_text}"
+                title_set = True
+    filler_words = {
+        "Using",
+        "With",
+        "And",
+        "For",
+        "By",
+        "In",
+        "To",
+        "The",
+        "A",
+        "An",
+        "Of",
+        "Through",
+        "At",
+        "On",
+        "That",
+        "Which",
+    }
+    words = title.split()
+    while words and words[-1].capitalize() in filler_words:
+        words.pop()
+    if len(words) <= 2 and words[0] in [
+        "Led",
+        "Managed",
+        "Developed",
+        "Built",
+        "Created",
+    ]:
+        desc_words = [w.strip(",.").replace("\u200b", "") for w in cleaned.split()]
+        if len(desc_words) > len(words) + 1:
+            for i in range(len(words), min(len(desc_words), 6)):
+                candidate = desc_words[i]
+                if candidate.capitalize() not in filler_words and len(candidate) > 2:
+                    words.append(candidate.capitalize())
+                    if len(words) >= 4:
+                        break
+    if len(words) > 4:
+        words = words[:4]
+    title = " ".join(words).title()
+    title_words = title.split()
+    if len(title_words) >= 2 and title_words[0] == title_words[1]:
+        title = " ".join(title_words[1:])
+    if len(title_words) >= 4 and title_words[1] == title_words[2]:
+        title_words.pop(2)
+        title = " ".join(title_words)
+    if "(" in title and ")" not in title:
+        title = title.split("(")[0].strip()
+    else:
+        title = re.sub("\\([^)]*\\)", "", title).strip()
+    title = title.replace("Impact Highlight Impact Highlight", "Impact Highlight")
+    return title
+
+
+def extract_achievements(text: str | ResumeDocument) -> list[dict[str, str]]:
+    return list(_iter_achievements(ResumeDocument.of(text)))
+
+
+def _iter_achievements(document: ResumeDocument) -> Iterator[dict[str, str]]:
+    """Yield each achievement as soon as its title is built."""
+    nlp = _get_nlp()
+    store = _revision_store.get()
+    count = 0
+    for indexes in _achievement_blocks(document):
+        key = None
+        if store is not None:
+            key = _block_key(document, indexes, nlp)
+            stored = _stored_items(store.load_section(key), _MAX_ACHIEVEMENTS - count)
+            increment("revision_section_hits" if stored is not None else "revision_section_misses")
+            if stored is not None:
+                yield from stored
+                count += len(stored)
+                if count >= _MAX_ACHIEVEMENTS:
+                    return
                 continue
-            if len(description) > 600:
-                end_match = None
-                for match in re.finditer("[.!?]\\s+[A-Z]", description[100:600]):
-                    end_match = match
-                if end_match:
-                    description = description[: 100 + end_match.start() + 1]
-                else:
-                    last_space = description[:600].rfind(" ")
-                    if last_space > 100:
-                        description = description[:last_space] + "..."
-                    else:
-                        description = description[:600] + "..."
-            description = description.strip()
-            if not description.endswith((".", "!", "?", "...")):
-                description += "."
-            achievements.append({
-                "title": title.strip(),
-                "description": description,
-                "metric": metric,
-            })
-            if len(achievements) >= 8:
-                break
-    return achievements
+        items = []
+        # Candidates are filtered lazily, so titles (the spaCy part) are only
+        # built for lines that will be kept, and nothing past the last one is
+        # examined.
+        for cleaned, description, metric in _achievement_candidates(document, indexes):
+            if nlp and _out_of_time("achievements"):
+                # Past the deadline the remaining titles come from the rules.
+                nlp = key = None
+            title = _achievement_title(cleaned, nlp)
+            if title is None:
+                continue
+            items.append({"title": title.strip(), "description": description, "metric": metric})
+            yield items[-1]
+            count += 1
+            if count >= _MAX_ACHIEVEMENTS:
+                if key is not None:
+                    store.save_section(key, {"items": items, "complete": False})
+                return
+        if key is not None:
+            store.save_section(key, {"items": items, "complete": True})
+
+
+def _block_key(document: ResumeDocument, indexes: range, nlp) -> str:
+    """``RevisionStore`` key of the achievements of a block of lines."""
+    pipeline = pipeline_id(nlp) if nlp else "rules"
+    lines = document.lines[indexes.start : indexes.stop]
+    return RevisionStore.section_key("achievements", lines, {"pipeline": pipeline})
 
 
-def extract_awards_and_honors(text: str) -> list[dict[str, str]]:
+def _stored_items(entry: dict | None, wanted: int) -> list[dict[str, str]] | None:
+    """The first ``wanted`` achievements of a stored block, or None if the
+    entry does not hold that many (a block cut short by the limit on
+    achievements may have more)."""
+    if entry is None or not (entry["complete"] or len(entry["items"]) >= wanted):
+        return None
+    items: list[dict[str, str]] = entry["items"][:wanted]
+    return items
+
+
+def extract_awards_and_honors(text: str | ResumeDocument) -> list[dict[str, str]]:
     """Extract awards and honors from LinkedIn PDF text."""
     awards = []
-    lines = text.splitlines()
-    awards_headers = [
-        "honors-awards",
-        "honors & awards",
-        "awards and honors",
-        "awards & honors",
-        "honors and awards",
-        "awards",
-        "honors",
-        "recognition",
-        "certifications",
-        "licenses & certifications",
-        "licenses and certifications",
-    ]
-    stop_headers = [
-        "experience",
-        "employment",
-        "education",
-        "skills",
-        "languages",
-        "publications",
-        "projects",
-        "interests",
-        "contact",
-        "summary",
-        "about",
-        "recommendations",
-    ]
-    start_idx = -1
-    end_idx = len(lines)
-    for i, line in enumerate(lines):
-        clean = line.strip().lower().replace(" ", "").replace("-", "")
-        for header in awards_headers:
-            header_clean = header.replace(" ", "").replace("-", "")
-            if header_clean in clean and len(line.strip()) < 35:
-                start_idx = i + 1
-                break
-        if start_idx > -1:
-            break
-    if start_idx == -1:
+    document = ResumeDocument.of(text)
+    lines = document.lines
+    sections = document.sections
+    header = sections.first("awards")
+    if header < 0:
         return []
-    for i in range(start_idx, len(lines)):
-        clean_line = lines[i].strip().lower()
-        if not clean_line:
-            continue
-        for header in stop_headers:
-            if header in clean_line and len(lines[i].strip()) < 25:
-                end_idx = i
-                break
-        if end_idx != len(lines):
-            break
-    award_lines = [l.strip() for l in lines[start_idx:end_idx] if l.strip()]
-    award_endings = [
-        "winner",
-        "of the year",
-        "award",
-        "recognition",
-        "honoree",
-        "nominee",
-        "prize",
-        "medal",
-        "fellow",
-        "scholar",
-        "grant",
-    ]
+    start_idx = header + 1
+    end_idx = sections.first("awards_stop", start_idx)
+    if end_idx < 0:
+        end_idx = len(lines)
+    award_lines = lines[start_idx:end_idx]
+    store = _revision_store.get()
+    key = None
+    if store is not None:
+        key = RevisionStore.section_key("awards", award_lines)
+        stored: list[dict[str, str]] | None = store.load_section(key)
+        increment("revision_section_hits" if stored is not None else "revision_section_misses")
+        if stored is not None:
+            return stored
     current_award = []
     for line in award_lines:
         current_award.append(line)
         merged = " ".join(current_award)
-        if any(ending in merged.lower() for ending in award_endings):
+        if patterns.AWARD_ENDINGS.search(merged.lower()):
             title = merged.replace("- ", "– ").strip()
-            title = re.sub("\\s+", " ", title)
-            awards.append({
-                "title": title,
-                "description": f"Recognized for excellence: {title}",
-                "metric": "🏆 Award",
-            })
+            title = clean_text(title)
+            awards.append(
+                {
+                    "title": title,
+                    "description": f"Recognized for excellence: {title}",
+                    "metric": "🏆 Award",
+                }
+            )
             current_award = []
     if current_award:
         merged = " ".join(current_award)
         if len(merged) > 10:
-            title = re.sub("\\s+", " ", merged.strip())
-            awards.append({
-                "title": title,
-                "description": f"Recognized for excellence: {title}",
-                "metric": "🏆 Award",
-            })
+            title = clean_text(merged)
+            awards.append(
+                {
+                    "title": title,
+                    "description": f"Recognized for excellence: {title}",
+                    "metric": "🏆 Award",
+                }
+            )
+    if key is not None:
+        store.save_section(key, awards)
     return awards
 
 
-def parse_resume(file_path: str) -> dict[str, str | list[dict[str, str]]]:
-    logger.info(f"Starting parse_resume for: {file_path}")
-    raw_text = extract_text_from_pdf(file_path)
+def extract_sections(text: str | ResumeDocument) -> list[dict[str, str | int]]:
+    """Return the named sections (``summary``, ``experience``, ``education``,
+    ``skills``, ``awards``, ...) in document order, each with its header line
+    as ``title`` and its ``start``/``end`` character offsets into the text."""
+    return [section.as_dict() for section in ResumeDocument.of(text).sections.sections]
+
+
+def parse_resume(
+    file_path: PdfSource,
+    stores: Stores | None = None,
+    metrics=None,
+    fields=None,
+    layout: bool = False,
+    profile: str = "full",
+    limits: Limits | None = None,
+    deadline: float | None = None,
+    typed: bool = False,
+) -> dict | ParsedResume:
+    """Parse a resume PDF given as a path, bytes, memoryview, mmap or binary file.
+
+    ``stores`` (see ``resume_parser.stores``) holds the on-disk stores to use.
+    With a ``ResultCache`` as ``stores.cache`` the result is looked up by the
+    hash of the PDF bytes first; a hit skips PDF extraction and spaCy entirely.
+    ``metrics`` (e.g. a ``ParseMetrics``) records the time spent in each stage.
+
+    ``fields`` limits the result to those keys of ``FIELDS``. Only their
+    extractors and what they depend on run (``role`` needs ``name``); spaCy is
+    not used unless ``name``, ``location`` or ``achievements`` is requested,
+    and when every requested field is in ``HEADER_FIELDS`` only the leading
+    pages are read (see ``parse_resume_header``).
+
+    ``layout=True`` reads the PDF with font and position data (see
+    ``resume_parser.layout``): the name is taken from the largest text on the
+    first page, headers are also recognised by their style and side-by-side
+    columns are read one after the other. It costs more PDF extraction time
+    and may give different (usually better) values on multi-column layouts.
+
+    ``profile="fast"`` never imports spaCy: names come from the layout and line
+    rules only, locations from the ``City, ST`` pattern, and achievements get
+    the generic title ``"Impact Highlight"``. See
+    ``benchmarks/compare_profiles.py`` for how far its results differ from the
+    default ``"full"`` profile.
+
+    With a ``DocStore`` (see ``resume_parser.docstore``) as ``stores.docs``
+    the extracted text and the spaCy docs of the parse are saved, and a later
+    parse of the same PDF with the same pipeline loads them instead of
+    extracting and analysing again. It is only used when a requested field
+    needs spaCy.
+
+    ``limits`` (a ``resume_parser.limits.Limits``) caps the pages, characters
+    and lines read and, in a separate process, the time and memory of the
+    parse. The result then has a ``status`` entry saying whether it is
+    complete, ``truncated`` by a limit, ``empty`` or ``aborted``.
+
+    ``deadline`` is a time budget in seconds. The regex fields (email, phone,
+    LinkedIn) are extracted first, and once the budget is spent the spaCy
+    steps are skipped: the header doc and the NER fallback for the name (the
+    rule-based name and location extractors are used instead) and the spaCy
+    achievement titles (the remaining achievements get the generic
+    ``"Impact Highlight"`` title). The ``status`` entry then lists the
+    ``complete`` fields and the ``degraded`` ones. Results with degraded
+    fields are not cached.
+
+    ``typed=True`` returns a ``resume_parser.results.ParsedResume``, a compact
+    read-only mapping equal to the dict, with binary and JSON encoders.
+
+    With a ``RevisionStore`` (see ``resume_parser.revisions``) as
+    ``stores.revisions`` the text of each page, the achievements of each
+    experience section and the awards are saved, and a parse of an edited
+    version of the PDF reuses those of its pages and sections that did not
+    change.
+    """
+    stores = stores or Stores()
+    cache = stores.cache
+    until = None if deadline is None else time.perf_counter() + deadline
+    with recording(metrics), _using_profile(profile), stage("parse"):
+        increment("parses")
+        logger.info(f"Starting parse_resume for: {describe(file_path)}")
+        nlp = _store_pipeline(stores.docs, _plan(fields))
+        file_path = load_source(file_path, read_path=cache is not None or nlp is not None)
+        config = _cache_config(fields, layout, profile, limits, deadline is not None)
+        key, data = _cache_lookup(cache, file_path, config)
+        if data is None:
+            options = (fields, layout, profile, stores, limits, until)
+            if limits is not None and limits.sandboxed:
+                data = run_sandboxed(_parse_loaded, (file_path, *options), limits)
+            else:
+                data = _parse_loaded(file_path, *options)
+            if cache is not None and key and _cacheable(data):
+                cache.put(key, data)
+        return ParsedResume.from_dict(data) if typed else data
+
+
+def _parse_loaded(
+    source: PdfSource,
+    fields,
+    layout: bool = False,
+    profile: str = "full",
+    stores: Stores | None = None,
+    limits: Limits | None = None,
+    until: float | None = None,
+) -> dict:
+    """Parse one loaded source: what ``parse_resume`` does after the cache lookup.
+
+    ``until`` is the ``perf_counter()`` value of the deadline, if any.
+    """
+    stores = stores or Stores()
+    doc_store = stores.docs
+    with _using_profile(profile), _using_revisions(stores.revisions), _within(until) as degraded:
+        plan = _plan(fields)
+        nlp = _store_pipeline(doc_store, plan)
+        truncated = []
+        if nlp is not None:
+            document, entry = _read_stored(source, layout, doc_store, nlp, limits)
+            data = _parse_texts([document], fields, doc_store, [entry])[0]
+            truncated = document.truncated
+        # Limits on the text are applied to the whole-document read.
+        elif set(plan) <= set(HEADER_FIELDS) and (limits is None or not limits.config()):
+            data = _select(_parse_header(source, plan, layout), fields)
+        else:
+            document = _read_document(source, layout, limits)
+            data = _select(_parse_text(document, plan), fields)
+            truncated = document.truncated
+    if limits is None and until is None:
+        return data
+    return with_status(data, truncated, None if until is None else degraded)
+
+
+def _cacheable(data: dict | None) -> bool:
+    """Whether a result may be cached (not empty, stopped by a limit or degraded
+    by a deadline)."""
+    status = data.get("status", {}) if data else {}
+    return (
+        bool(data)
+        and status.get("state") not in ("empty", "aborted")
+        and not status.get("degraded")
+    )
+
+
+def parse_resume_header(
+    file_path: PdfSource,
+    layout: bool = False,
+    profile: str = "full",
+    deadline: float | None = None,
+) -> dict[str, str]:
+    """Extract only ``HEADER_FIELDS``, reading as few pages as possible.
+
+    Only the leading pages the header extractors look at are read. Email and
+    phone, which may appear anywhere, pull further pages one at a time only
+    while they are still missing. The values are the same as the
+    corresponding fields of ``parse_resume``.
+    """
+    data = parse_resume(
+        file_path, fields=HEADER_FIELDS, layout=layout, profile=profile, deadline=deadline
+    )
+    return cast(dict, data)
+
+
+def parse_resumes(
+    file_paths,
+    batch_size: int = 32,
+    stores: Stores | None = None,
+    metrics=None,
+    fields=None,
+    layout: bool = False,
+    profile: str = "full",
+    limits: Limits | None = None,
+    typed: bool = False,
+) -> list[dict] | list[ParsedResume]:
+    """Parse many resumes, sending their spaCy work through ``nlp.pipe`` together.
+
+    Files are processed ``batch_size`` at a time. For each batch every text the
+    extractors would pass to spaCy (header docs, name candidate lines and
+    achievement lines) is collected, deduplicated and piped in one go. Results
+    are returned in input order and match ``parse_resume`` on each file.
+    Files found in the cache of ``stores`` are not parsed again. ``stores``,
+    ``metrics``, ``fields``, ``layout``, ``profile``, ``limits`` and ``typed``
+    are as for ``parse_resume``, with one ``parse_batch`` observation per
+    batch. With a ``timeout`` or ``max_memory`` limit each file
+    is parsed in its own process, without batching its spaCy work.
+    """
+    stores = stores or Stores()
+    with recording(metrics), _using_profile(profile), _using_revisions(stores.revisions):
+        results = _parse_resumes(
+            list(file_paths), batch_size, stores.cache, fields, layout, profile, stores.docs, limits
+        )
+    return [ParsedResume.from_dict(data) for data in results] if typed else results
+
+
+def _parse_resumes(
+    file_paths: list,
+    batch_size: int,
+    cache,
+    fields,
+    layout=False,
+    profile="full",
+    doc_store=None,
+    limits=None,
+) -> list:
+    results = []
+    for start in range(0, len(file_paths), batch_size):
+        with stage("parse_batch"):
+            batch = file_paths[start : start + batch_size]
+            results.extend(_parse_batch(batch, cache, fields, layout, profile, doc_store, limits))
+    return results
+
+
+def _parse_batch(
+    file_paths: list, cache, fields, layout=False, profile="full", doc_store=None, limits=None
+) -> list:
+    increment("parses", len(file_paths))
+    config = _cache_config(fields, layout, profile, limits)
+    nlp = _store_pipeline(doc_store, _plan(fields))
+    sandboxed = limits is not None and limits.sandboxed
+    batch: list[dict | None] = []
+    keys: list[str | None] = []
+    results: list[dict] = []
+    documents: list[ResumeDocument] = []
+    entries: list[tuple[str, dict | None] | None] = []
+    for file_path in file_paths:
+        logger.info(f"Starting parse_resume for: {describe(file_path)}")
+        file_path = load_source(file_path, read_path=cache is not None or nlp is not None)
+        key, cached = _cache_lookup(cache, file_path, config)
+        batch.append(cached)
+        if cached is None:
+            keys.append(key)
+            if sandboxed:
+                stores = Stores(docs=doc_store, revisions=_revision_store.get())
+                options = (fields, layout, profile, stores, limits)
+                results.append(run_sandboxed(_parse_loaded, (file_path, *options), limits))
+            elif nlp is None:
+                documents.append(_read_document(file_path, layout, limits))
+                entries.append(None)
+            else:
+                document, entry = _read_stored(file_path, layout, doc_store, nlp, limits)
+                documents.append(document)
+                entries.append(entry)
+    if not sandboxed:
+        results = _parse_texts(documents, fields, doc_store, entries, limits)
+    parsed = iter(results)
+    miss_keys = iter(keys)
+    for i, cached in enumerate(batch):
+        if cached is None:
+            data = next(parsed)
+            key = next(miss_keys)
+            if key and _cacheable(data):
+                cache.put(key, data)
+            batch[i] = data
+    return batch
+
+
+def _cache_config(
+    fields,
+    layout: bool = False,
+    profile: str = "full",
+    limits: Limits | None = None,
+    deadline: bool = False,
+) -> dict | None:
+    # Full parses keep the keys they always had.
+    config: dict = {}
+    if fields is not None:
+        config["fields"] = list(_plan(fields, resolve=False))
+    if layout:
+        config["layout"] = True
+    if profile != "full":
+        config["profile"] = profile
+    if limits is not None:
+        config["limits"] = limits.config()
+    if deadline:
+        config["deadline"] = True
+    if profile != "fast" and _NLP_FIELDS.intersection(_plan(fields)) and get_nlp() is None:
+        # Rule-only results must not be served once the model is installed.
+        config["nlp"] = False
+    return config or None
+
+
+def _cache_lookup(
+    cache, source: PdfSource, config: dict | None = None
+) -> tuple[str | None, dict | None]:
+    """Return ``(key, cached_result)`` for a loaded source; both None without a cache."""
+    if cache is None:
+        return None, None
+    if is_path(source):
+        logger.warning(f"Could not read {describe(source)} for the result cache")
+        return None, None
+    key = cache.key_for(source, config)
+    cached = cache.get(key)
+    if cached is not None:
+        logger.info(f"Result cache hit for: {describe(source)}")
+    return key, cached
+
+
+def _plan(fields=None, resolve: bool = True) -> tuple[str, ...]:
+    """Return the fields to extract, in ``FIELDS`` order.
+
+    With ``resolve`` the dependencies of the requested fields are included.
+    """
+    if fields is None:
+        return FIELDS
+    requested = {fields} if isinstance(fields, str) else set(fields)
+    unknown = requested.difference(FIELDS)
+    if unknown:
+        raise ValueError(f"Unknown fields {sorted(unknown)}; expected some of {FIELDS}")
+    pending = list(requested) if resolve else []
+    while pending:
+        for dependency in _FIELD_DEPENDENCIES.get(pending.pop(), ()):
+            if dependency not in requested:
+                requested.add(dependency)
+                pending.append(dependency)
+    return tuple(field for field in FIELDS if field in requested)
+
+
+def _select(data: dict, fields) -> dict:
+    """Drop fields that were only extracted as dependencies."""
+    if fields is None or not data:
+        return data
+    return {field: data[field] for field in _plan(fields, resolve=False)}
+
+
+def _nlp_inputs(document: ResumeDocument, plan: tuple[str, ...] = FIELDS) -> list[str]:
+    """Return every text a parse of ``document`` may send to spaCy."""
+    if not document:
+        return []
+    inputs = []
+    if _SPACY_DOC_FIELDS.intersection(plan):
+        inputs.append(document.text[:_HEADER_CHARS])
+    if "name" in plan and document.lines and not _direct_name(document):
+        inputs.extend(_name_ner_lines(document))
+    if "achievements" in plan:
+        inputs.extend(_title_inputs(document))
+    return inputs
+
+
+def _title_inputs(document: ResumeDocument) -> list[str]:
+    """Achievement lines whose titles may be built with spaCy, leaving out the
+    blocks whose achievements are in the ``RevisionStore``."""
+    store = _revision_store.get()
+    if store is None:
+        candidates = _achievement_candidates(document)
+        return [cleaned for cleaned, _, _ in islice(candidates, _MAX_ACHIEVEMENTS)]
+    nlp = _get_nlp()
+    lines = []
+    remaining = _MAX_ACHIEVEMENTS
+    for indexes in _achievement_blocks(document):
+        if remaining <= 0:
+            break
+        stored = _stored_items(store.load_section(_block_key(document, indexes, nlp)), remaining)
+        if stored is None:
+            candidates = _achievement_candidates(document, indexes)
+            fresh = [cleaned for cleaned, _, _ in islice(candidates, remaining)]
+            lines.extend(fresh)
+            remaining -= len(fresh)
+        else:
+            remaining -= len(stored)
+    return lines
+
+
+def _parse_texts(
+    texts: Sequence[str | ResumeDocument], fields=None, doc_store=None, entries=None, limits=None
+) -> list[dict[str, str | list[dict[str, str]]]]:
+    """Parse documents, piping their spaCy inputs through ``nlp.pipe`` together.
+
+    ``entries`` holds the ``doc_store`` entry of each document (see
+    ``_read_stored``), or None for documents not kept in the store. With
+    ``limits`` each result has its ``status`` entry.
+    """
+    plan = _plan(fields)
+    documents = [ResumeDocument.of(text) for text in texts]
+    entries = entries or [None] * len(documents)
+    nlp = _get_nlp() if _NLP_FIELDS.intersection(plan) else None
+    docs = {}
+    inputs: list[list[str]] = [[] for _ in documents]
+    if nlp:
+        memo = line_facts_cache()
+        for entry in entries:
+            if entry and entry[1]:
+                docs.update(entry[1])
+        inputs = [_nlp_inputs(document, plan) for document in documents]
+        # Documents going into the store need every doc, memoized or not.
+        storing = set()
+        for entry, texts_ in zip(entries, inputs):
+            if entry and entry[1] is None:
+                storing.update(texts_)
+        unique = [
+            text
+            for text in dict.fromkeys(t for texts_ in inputs for t in texts_)
+            if text not in docs and (text in storing or not memo.contains(nlp, text))
+        ]
+        increment("nlp_piped_texts", len(unique))
+        with stage("spacy_pipe"):
+            docs.update(zip(unique, nlp.pipe(unique)))
+        logger.info(f"Piped {len(unique)} texts through spaCy for {len(texts)} resumes")
+    token = _precomputed_docs.set(docs)
+    try:
+        results = [
+            _select(_parse_stored(document, plan, doc_store, entry, texts_, docs), fields)
+            for document, entry, texts_ in zip(documents, entries, inputs)
+        ]
+    finally:
+        _precomputed_docs.reset(token)
+    if limits is not None:
+        results = [with_status(data, doc.truncated) for data, doc in zip(results, documents)]
+    return results
+
+
+def _parse_stored(
+    document: ResumeDocument, plan, doc_store, entry, inputs: list[str], docs: dict
+) -> dict:
+    """Parse one document and save its text and spaCy docs to ``doc_store``
+    unless the stored entry already held every doc the parse used."""
+    if entry is None:
+        return _parse_text(document, plan)
+    key, stored = entry
+    token = _new_docs.set({})
+    try:
+        data = _parse_text(document, plan)
+        new_docs = _new_docs.get() or {}
+    finally:
+        _new_docs.reset(token)
+    used = dict(stored or {})
+    used.update((text, docs[text]) for text in inputs if text in docs)
+    used.update(new_docs)
+    if document.text and (stored is None or len(used) > len(stored)):
+        doc_store.save(key, document.text, used.values())
+    return data
+
+
+def _parse_text(
+    document: ResumeDocument, plan: tuple[str, ...] = FIELDS
+) -> dict[str, str | list[dict[str, str]]]:
+    raw_text = document.text
     if not raw_text:
         logger.warning("PDF extraction returned no text")
         return {}
     text_len = len(raw_text)
     logger.info(f"Successfully extracted {text_len} characters of text from PDF")
-    nlp_doc = nlp(raw_text[:2000]) if nlp else None
-    if not nlp_doc:
+    data = _extract_fields(document, plan)
+    _log_fields(data)
+    return data
+
+
+def _parse_header(source: PdfSource, plan: tuple[str, ...], layout: bool = False) -> dict[str, str]:
+    """Run the header extractors in ``plan`` on as few leading pages as possible."""
+    try:
+        with PdfPages(source, layout=layout, store=_revision_store.get()) as pages:
+            head = pages.head(_HEADER_LINES, _HEADER_CHARS)
+            if not head:
+                logger.warning("PDF extraction returned no text")
+                return {}
+            document = ResumeDocument(head, pages.layout() if layout else None)
+            data = _extract_fields(document, plan)
+            head_pages = pages.extracted
+            for key, extract in (("email", extract_email), ("phone", extract_phone)):
+                if key not in data:
+                    continue
+                for index in range(head_pages, len(pages)):
+                    if data[key]:
+                        break
+                    data[key] = extract(pages[index])
+            logger.info(f"Read {pages.extracted} of {len(pages)} pages for header fields")
+    except Exception:
+        logger.exception("Error reading PDF")
+        return {}
+    _log_fields(data)
+    return data
+
+
+def _extract_fields(document: ResumeDocument, plan: tuple[str, ...]) -> dict:
+    order: Sequence[str] = plan
+    if _deadline.get() is not None:
+        # The regex fields first, so they are complete whatever the budget.
+        order = sorted(plan, key=lambda field: field not in _REGEX_FIELDS)
+    nlp_doc = None
+    header_doc_pending = bool(_SPACY_DOC_FIELDS.intersection(plan))
+    data: dict = {}
+    for field in order:
+        if header_doc_pending and field in _SPACY_DOC_FIELDS:
+            nlp_doc = _header_doc(document, plan)
+            header_doc_pending = False
+        data[field] = timed(f"extract_{field}", _EXTRACTORS[field], document, data, nlp_doc)
+    return {field: data[field] for field in plan}
+
+
+def _header_doc(document: ResumeDocument, plan: tuple[str, ...]):
+    """The spaCy doc of the first 2000 characters, or None without spaCy or time."""
+    nlp = _get_nlp()
+    if nlp and _out_of_time():
+        # Skipped: the name and location then come from the rules, which only
+        # changes them where the rules alone find nothing.
+        if "name" in plan and not _direct_name(document):
+            _out_of_time("name")
+        if "location" in plan and not any(
+            patterns.CITY_STATE.search(line) for line in document.lines[:10]
+        ):
+            _out_of_time("location")
+        return None
+    nlp_doc = None
+    if nlp:
+        nlp_doc = timed("spacy_doc", _nlp_line, nlp, document.text[:_HEADER_CHARS])
+    if not nlp_doc and not _rules_only.get():
         logger.warning("spaCy NLP model was not available during parsing")
-    name = extract_name(raw_text, nlp_doc)
-    linkedin_url = extract_linkedin(raw_text)
-    role = extract_role(raw_text, name)
-    data = {
-        "name": name,
-        "role": role,
-        "email": extract_email(raw_text),
-        "phone": extract_phone(raw_text),
-        "linkedin": linkedin_url,
-        "location": extract_location(raw_text, nlp_doc),
-        "summary": extract_summary(raw_text),
-        "achievements": extract_achievements(raw_text),
-        "awards": extract_awards_and_honors(raw_text),
-    }
+    return nlp_doc
+
+
+# How each field is extracted from (document, fields extracted so far, header doc).
+_EXTRACTORS = {
+    "name": lambda document, data, nlp_doc: extract_name(document, nlp_doc),
+    "role": lambda document, data, nlp_doc: extract_role(document, data["name"]),
+    "email": lambda document, data, nlp_doc: extract_email(document),
+    "phone": lambda document, data, nlp_doc: extract_phone(document),
+    "linkedin": lambda document, data, nlp_doc: extract_linkedin(document),
+    "location": lambda document, data, nlp_doc: extract_location(document, nlp_doc),
+    "summary": lambda document, data, nlp_doc: extract_summary(document),
+    "achievements": lambda document, data, nlp_doc: extract_achievements(document),
+    "awards": lambda document, data, nlp_doc: extract_awards_and_honors(document),
+    "sections": lambda document, data, nlp_doc: extract_sections(document),
+}
+
+
+def _log_fields(data: dict) -> None:
     for key, value in data.items():
         if isinstance(value, list):
             logger.info(f"Extracted {len(value)} items for key: {key}")
         else:
             status = "Found" if value else "Not Found"
             logger.info(f"Extraction for {key}: {status}")
-    return data
@@ -0,0 +1,94 @@
+"""On-disk store of per-page and per-section parse results, for revised PDFs.
+
+Candidates often upload an edited version of a resume they uploaded before.
+The new file has a different hash, so ``ResultCache`` and ``DocStore`` miss,
+although most of its pages and sections are unchanged. A
+:class:`RevisionStore` keeps intermediate results under keys derived from the
+content they came from, so a re-parse only recomputes what was edited:
+
+- page text (with its layout lines in layout mode), keyed by a fingerprint of
+  the page's content stream, form XObjects, fonts and geometry, which is much
+  cheaper to compute than the text itself;
+- the achievements of each experience section (including the spaCy-built
+  titles), keyed by the section's lines and the pipeline;
+- the awards built from the award lines, keyed by those lines.
+
+Pages are only reused when their PDF objects are identical. Section results
+are keyed by text, so they are reused even when an editor re-encoded every
+page, as long as the section reads the same.
+"""
+
+import hashlib
+import json
+
+from . import __version__
+from .cache import BlobStore
+from .layout import LayoutLine
+
+
+def page_fingerprint(page, layout: bool = False) -> str:
+    """Hash what determines the text of a PyMuPDF ``page``: its content
+    stream, the form XObjects it draws, its fonts (with their ``ToUnicode``
+    maps), its size and rotation, and the PyMuPDF and parser versions."""
+    import pymupdf as fitz
+
+    doc = page.parent
+    digest = hashlib.sha256()
+    config = [__version__, fitz.VersionBind, layout, tuple(page.rect), page.rotation]
+    digest.update(json.dumps(config).encode("utf-8"))
+    digest.update(page.read_contents())
+    for xref, *_ in page.get_xobjects():
+        digest.update(doc.xref_stream(xref) or b"")
+    for xref, *font in page.get_fonts():
+        digest.update(repr(font[:5]).encode("utf-8"))
+        kind, value = doc.xref_get_key(xref, "ToUnicode")
+        if kind == "xref":
+            digest.update(doc.xref_stream(int(value.split()[0])) or b"")
+    return digest.hexdigest()
+
+
+class RevisionStore(BlobStore):
+    """LRU store of page texts and section results in a ``BlobStore``."""
+
+    def load_page(self, key: str, number: int = 0) -> tuple[str, list[LayoutLine] | None] | None:
+        """Return ``(text, layout lines or None)`` of a page, now page ``number``
+        of its document, or None if not stored."""
+        blob = self._get_blob(f"page:{key}")
+        if blob is None:
+            return None
+        entry = json.loads(blob)
+        lines = entry.get("layout")
+        if lines is not None:
+            lines = [
+                LayoutLine(text, size, bold, x0, y0, x1, y1, number)
+                for text, size, bold, x0, y0, x1, y1 in lines
+            ]
+        return entry["text"], lines
+
+    def save_page(self, key: str, text: str, lines: list[LayoutLine] | None = None) -> None:
+        entry: dict[str, object] = {"text": text}
+        if lines is not None:
+            entry["layout"] = [
+                [line.text, line.size, line.bold, line.x0, line.y0, line.x1, line.y1]
+                for line in lines
+            ]
+        self._put_blob(f"page:{key}", json.dumps(entry, ensure_ascii=False).encode("utf-8"))
+
+    @staticmethod
+    def section_key(kind: str, lines: list[str], config: dict | None = None) -> str:
+        """Key of the ``kind`` results (e.g. ``"achievements"``) of a section
+        with these ``lines``, under the parser version and ``config``."""
+        digest = hashlib.sha256()
+        fingerprint = {"kind": kind, "version": __version__, **(config or {})}
+        digest.update(json.dumps(fingerprint, sort_keys=True).encode("utf-8"))
+        for line in lines:
+            digest.update(b"\0")
+            digest.update(line.encode("utf-8"))
+        return f"section:{digest.hexdigest()}"
+
+    def load_section(self, key: str):
+        blob = self._get_blob(key)
+        return None if blob is None else json.loads(blob)
+
+    def save_section(self, key: str, value) -> None:
+        self._put_blob(key, json.dumps(value, ensure_ascii=False).encode("utf-8"))
@@ -0,0 +1,194 @@
+"""Section segmentation of resume text, computed in one pass over its lines.
+
+``SectionIndex`` walks the lines of a ``ResumeDocument`` once and records
+
+- the named sections (Summary, Experience, Education, Skills, Honors-Awards,
+  Certifications, ...) as line and character ranges, so extractors can look
+  at their own section only, and
+- the lines matched by the summary and awards extractors' own header and stop
+  rules, which are looser than the section headers (``"Graduated with
+  Honors"`` starts the awards list) and are kept as they are so those fields
+  do not change.
+
+For documents read in layout mode, short lines set in the same emphasised
+style (font size and weight) as a recognised header also start a section,
+named ``"other"``.
+"""
+
+import bisect
+import re
+from dataclasses import dataclass
+
+from . import patterns
+from .layout import body_size, is_emphasised
+
+_HEADER_SEPARATORS = re.compile("[\\s:&/\\-–]+")
+_MAX_HEADER_LENGTH = 40
+_SUMMARY_HEADER_LENGTH = max(map(len, patterns.SUMMARY_HEADERS | patterns.SUMMARY_STOP_HEADERS))
+
+# Canonical section name for each known header, compared after lowercasing and
+# collapsing separators (":", "&", "-", "/") to single spaces.
+SECTION_HEADERS = {
+    "summary": [
+        *patterns.SUMMARY_HEADERS,
+        "career summary",
+        "executive summary",
+        "professional profile",
+        "about",
+    ],
+    "experience": [
+        "experience",
+        "work experience",
+        "professional experience",
+        "relevant experience",
+        "employment",
+        "employment history",
+        "work history",
+        "career history",
+    ],
+    "education": ["education", "academic background", "education and training"],
+    "skills": ["skills", "top skills", "technical skills", "key skills", "core competencies"],
+    "awards": [
+        "awards",
+        "honors",
+        "honours",
+        "honors awards",
+        "awards honors",
+        "honors and awards",
+        "awards and honors",
+        "recognition",
+    ],
+    "certifications": [
+        "certifications",
+        "certificates",
+        "licenses certifications",
+        "licenses and certifications",
+    ],
+    "projects": ["projects", "selected projects"],
+    "publications": ["publications", "selected publications"],
+    "languages": ["languages"],
+    "interests": ["interests"],
+    "volunteering": ["volunteering", "volunteer experience"],
+    "contact": ["contact", "contact information"],
+    "references": ["references"],
+}
+_SECTION_OF = {header: name for name, headers in SECTION_HEADERS.items() for header in headers}
+
+
+@dataclass(frozen=True)
+class Section:
+    """One named section: its header line and the lines up to the next header.
+
+    ``header`` and ``end`` index ``ResumeDocument.lines`` (``end`` is
+    exclusive); ``start`` and ``stop`` are the matching character offsets into
+    ``ResumeDocument.text``, from the header line to the next section's header.
+    """
+
+    name: str
+    title: str
+    header: int
+    end: int
+    start: int
+    stop: int
+
+    @property
+    def lines(self) -> range:
+        """Indexes of the section's content lines (without the header)."""
+        return range(self.header + 1, self.end)
+
+    def as_dict(self) -> dict:
+        return {"name": self.name, "title": self.title, "start": self.start, "end": self.stop}
+
+
+def section_name(line_lower: str) -> str | None:
+    """Return the canonical section a (lowercased) line is the header of."""
+    if len(line_lower) >= _MAX_HEADER_LENGTH:
+        return None
+    return _SECTION_OF.get(_HEADER_SEPARATORS.sub(" ", line_lower).strip())
+
+
+class SectionIndex:
+    """Section boundaries and extractor header lines of one document."""
+
+    # Line markers recorded for the summary and awards extractors.
+    MARKS = ("summary", "summary_stop", "awards", "awards_stop")
+
+    def __init__(self, document):
+        self.sections: list[Section] = []
+        self._marks: dict[str, list[int]] = {mark: [] for mark in self.MARKS}
+        strip_punctuation = patterns.HEADER_PUNCTUATION.sub
+        summary, summary_stop = self._marks["summary"], self._marks["summary_stop"]
+        awards, awards_stop = self._marks["awards"], self._marks["awards_stop"]
+        headers = []
+        for i, (line, line_lower) in enumerate(zip(document.lines, document.lower)):
+            name = section_name(line_lower)
+            if name:
+                headers.append((i, name))
+            # Both summary header sets hold short words; without ":" or "-" to
+            # strip, a longer line cannot match.
+            if len(line) <= _SUMMARY_HEADER_LENGTH or ":" in line or "-" in line:
+                clean_header = strip_punctuation("", line_lower).strip()
+                if clean_header in patterns.SUMMARY_HEADERS:
+                    summary.append(i)
+                if clean_header in patterns.SUMMARY_STOP_HEADERS:
+                    summary_stop.append(i)
+            if len(line) < 35:
+                if patterns.AWARDS_HEADERS.search(line_lower.replace(" ", "").replace("-", "")):
+                    awards.append(i)
+                if len(line) < 25 and patterns.AWARDS_STOP_HEADERS.search(line_lower):
+                    awards_stop.append(i)
+        if headers and document.layout:
+            headers = _styled_headers(document, headers)
+        if headers:
+            offsets = _line_offsets(document, [i for i, _ in headers])
+            bounds = [*offsets, len(document.text)]
+            ends = [i for i, _ in headers[1:]] + [len(document.lines)]
+            for k, ((i, name), end) in enumerate(zip(headers, ends)):
+                self.sections.append(
+                    Section(name, document.lines[i], i, end, bounds[k], bounds[k + 1])
+                )
+
+    def first(self, mark: str, start: int = 0) -> int:
+        """Index of the first line at or after ``start`` carrying ``mark``, or -1."""
+        marked = self._marks[mark]
+        k = bisect.bisect_left(marked, start)
+        return marked[k] if k < len(marked) else -1
+
+    def named(self, name: str) -> list[Section]:
+        """Sections called ``name``, in document order."""
+        return [section for section in self.sections if section.name == name]
+
+
+def _styled_headers(document, headers: list[tuple[int, str]]) -> list[tuple[int, str]]:
+    """Add the short lines set in the same emphasised style as a known header."""
+    layout = document.layout
+    body = body_size(layout)
+    styles = {layout[i].style for i, _ in headers if is_emphasised(layout[i], body)}
+    if not styles:
+        return headers
+    known = dict(headers)
+    for i, line in enumerate(layout):
+        if (
+            i not in known
+            and line.style in styles
+            and len(line.text) < _MAX_HEADER_LENGTH
+            and not document.has_digit[i]
+            and not document.has_at[i]
+        ):
+            known[i] = "other"
+    return sorted(known.items())
+
+
+def _line_offsets(document, indexes: list[int]) -> list[int]:
+    """Character offsets into ``document.text`` of the given ``lines`` indexes."""
+    wanted = {document.line_indexes[i]: i for i in indexes}
+    found = {}
+    offset = 0
+    for raw_index, raw_line in enumerate(document.text.splitlines(keepends=True)):
+        i = wanted.get(raw_index)
+        if i is not None:
+            found[i] = offset + len(raw_line) - len(raw_line.lstrip())
+            if len(found) == len(wanted):
+                break
+        offset += len(raw_line)
+    return [found[i] for i in indexes]
@@ -0,0 +1,474 @@
+"""Local HTTP parsing service: ``resume-parser-server``.
+
+A small asyncio HTTP/1.1 server (standard library only) in front of a pool of
+worker processes that keep the spaCy model loaded. Uploads that arrive close
+together are parsed together: a batch is started as soon as a worker is free,
+and it takes the uploads already queued plus those arriving within
+``max_wait`` seconds (up to ``max_batch``), so their spaCy work goes through
+``nlp.pipe`` at once (see ``parse_resumes``).
+
+Endpoints:
+
+- ``POST /parse``: the PDF as the request body (``application/pdf``) or as the
+  file of a ``multipart/form-data`` form. Returns the ``parse_resume`` result
+  as JSON; ``422`` when no text could be extracted, ``413`` above
+  ``max_upload`` bytes and ``503`` when ``max_queue`` uploads are waiting.
+- ``GET /health``: whether the worker pool is up.
+- ``GET /queue``: uploads waiting and being parsed.
+- ``GET /latency``: percentiles of the time from upload to response over the
+  last ``window`` requests, and the mean batch size.
+"""
+
+import argparse
+import asyncio
+import collections
+import email.parser
+import email.policy
+import gc
+import json
+import logging
+import math
+import multiprocessing
+import os
+import time
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field
+from typing import TypeVar
+
+from .bulk import _init_worker, _parse_chunk, _worker_initargs
+from .model import get_nlp
+from .resume_parser import FIELDS, PROFILES, _plan
+from .stores import Stores
+
+logger = logging.getLogger(__name__)
+
+_Server = TypeVar("_Server", bound="ParseServer")
+
+_REASONS = {
+    200: "OK",
+    400: "Bad Request",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    411: "Length Required",
+    413: "Payload Too Large",
+    422: "Unprocessable Entity",
+    503: "Service Unavailable",
+    504: "Gateway Timeout",
+}
+
+
+class _HttpError(Exception):
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+@dataclass
+class _Upload:
+    pdf: bytes
+    future: "asyncio.Future[tuple[dict, str | None]]"
+    received: float = field(default_factory=time.perf_counter)
+
+
+def _ready() -> int:
+    return os.getpid()
+
+
+def _parse_uploads(pdfs: list[bytes], fields, layout, profile, stores) -> list[tuple]:
+    """Parse a batch in a worker; ``(data, error)`` per PDF."""
+    return [(r.data, r.error) for r in _parse_chunk(pdfs, stores, fields, layout, profile)]
+
+
+def _percentile(values: list[float], share: float) -> float:
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(share * len(ordered)) - 1)]
+
+
+class ParseServer:
+    """HTTP front end with a warm worker pool and micro-batching.
+
+    ``workers`` processes (default: CPUs) parse one batch each at a time.
+    ``max_batch`` and ``max_wait`` (seconds) bound how many uploads a batch
+    takes and how long it waits for more; ``max_batch=1`` parses every upload
+    alone. ``fields``, ``layout``, ``profile`` and ``stores`` are passed to every
+    parse. ``timeout`` bounds each request's wait for its result (``504``).
+
+    Use ``async with ParseServer(...) as server`` (or :meth:`start` and
+    :meth:`close`); :attr:`port` is the bound port when ``port=0``.
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 8000,
+        workers: int | None = None,
+        max_batch: int = 8,
+        max_wait: float = 0.01,
+        max_queue: int = 256,
+        max_upload: int = 20 * 1024 * 1024,
+        timeout: float | None = 60.0,
+        fields=None,
+        layout: bool = False,
+        profile: str = "full",
+        stores: Stores | None = None,
+        preload: bool = True,
+        window: int = 1000,
+    ):
+        if profile not in PROFILES:
+            raise ValueError(f"Unknown profile {profile!r}; expected one of {PROFILES}")
+        if max_batch < 1 or max_wait < 0:
+            raise ValueError("max_batch must be at least 1 and max_wait not negative")
+        _plan(fields)
+        self.host = host
+        self.port = port
+        self.workers = workers or os.cpu_count() or 1
+        self.max_batch = max_batch
+        self.max_wait = max_wait
+        self.max_queue = max_queue
+        self.max_upload = max_upload
+        self.timeout = timeout
+        self.options = (fields, layout, profile, stores)
+        self.preload = preload
+        self.requests = 0
+        self.batches = 0
+        self.errors = 0
+        self.rejected = 0
+        self.in_flight = 0
+        self._latencies: collections.deque = collections.deque(maxlen=window)
+        self._batch_sizes: collections.deque = collections.deque(maxlen=window)
+        self._executor: ProcessPoolExecutor | None = None
+        self._frozen = False
+        self._broken = False
+        self._queue: asyncio.Queue[_Upload] | None = None
+        self._server: asyncio.Server | None = None
+        self._batcher: asyncio.Task | None = None
+        self._started = 0.0
+
+    async def __aenter__(self: _Server) -> _Server:
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    async def start(self) -> None:
+        """Start and warm up the worker pool, then listen."""
+        load = self.options[2] != "fast"
+        initializer: Callable[..., None] | None = None
+        initargs: tuple = ()
+        if self.preload and "fork" in multiprocessing.get_all_start_methods():
+            if load:
+                get_nlp()
+            # As in parse_resumes_parallel: workers share the preloaded model.
+            gc.freeze()
+            self._frozen = True
+            context = multiprocessing.get_context("fork")
+        else:
+            context = None
+            initializer, initargs = _init_worker, _worker_initargs(context, load)
+        executor = ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=context,
+            initializer=initializer,
+            initargs=initargs,
+        )
+        self._executor = executor
+        warmup = [executor.submit(_ready) for _ in range(self.workers)]
+        await asyncio.gather(*(asyncio.wrap_future(future) for future in warmup))
+        self._queue = asyncio.Queue()
+        self._batcher = asyncio.create_task(self._batch_loop())
+        server = await asyncio.start_server(self._handle, self.host, self.port)
+        self._server = server
+        self.port = server.sockets[0].getsockname()[1]
+        self._started = time.monotonic()
+        logger.info(f"Serving on http://{self.host}:{self.port} with {self.workers} workers")
+
+    async def serve_forever(self) -> None:
+        if self._server is None:
+            await self.start()
+        assert self._server is not None
+        try:
+            await self._server.serve_forever()
+        finally:
+            await self.close()
+
+    async def close(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+        if self._batcher is not None:
+            self._batcher.cancel()
+            await asyncio.gather(self._batcher, return_exceptions=True)
+            self._batcher = None
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+        if self._frozen:
+            gc.unfreeze()
+            self._frozen = False
+
+    def health(self) -> dict:
+        return {
+            "status": "broken" if self._broken else "ok",
+            "workers": self.workers,
+            "profile": self.options[2],
+            "uptime": time.monotonic() - self._started,
+        }
+
+    def queue_stats(self) -> dict:
+        return {
+            "queued": self._queue.qsize() if self._queue else 0,
+            "in_flight": self.in_flight,
+            "max_queue": self.max_queue,
+            "max_batch": self.max_batch,
+        }
+
+    def latency_stats(self) -> dict:
+        """Milliseconds from upload to response over the recent requests."""
+        latencies = list(self._latencies)
+        stats = {
+            "requests": self.requests,
+            "errors": self.errors,
+            "rejected": self.rejected,
+            "batches": self.batches,
+            "window": len(latencies),
+            "mean_batch_size": (
+                sum(self._batch_sizes) / len(self._batch_sizes) if self._batch_sizes else 0.0
+            ),
+        }
+        for name, share in (("p50", 0.5), ("p90", 0.9), ("p99", 0.99), ("max", 1.0)):
+            stats[f"{name}_ms"] = _percentile(latencies, share) * 1000 if latencies else 0.0
+        return stats
+
+    async def parse(self, pdf: bytes) -> dict:
+        """Queue one PDF for the next batch and wait for its result.
+
+        On a timeout the upload is cancelled, so a batch that has not started
+        yet leaves it out.
+        """
+        queue = self._queue
+        assert queue is not None, "start() the server first"
+        if queue.qsize() >= self.max_queue:
+            self.rejected += 1
+            raise _HttpError(503, f"{queue.qsize()} uploads already queued")
+        upload = _Upload(pdf, asyncio.get_running_loop().create_future())
+        queue.put_nowait(upload)
+        try:
+            data, error = await asyncio.wait_for(asyncio.shield(upload.future), self.timeout)
+        except asyncio.TimeoutError:
+            upload.future.cancel()
+            raise _HttpError(504, f"No result within {self.timeout}s") from None
+        finally:
+            self._latencies.append(time.perf_counter() - upload.received)
+        if error is not None:
+            raise _HttpError(422, error)
+        return data
+
+    async def _batch_loop(self) -> None:
+        queue = self._queue
+        assert queue is not None
+        loop = asyncio.get_running_loop()
+        free = asyncio.Semaphore(self.workers)
+        while True:
+            await free.acquire()
+            batch: list[_Upload] = []
+            until = 0.0
+            while len(batch) < self.max_batch:
+                if not batch:
+                    upload = await queue.get()
+                    until = loop.time() + self.max_wait
+                elif not queue.empty():
+                    upload = queue.get_nowait()
+                else:
+                    wait = until - loop.time()
+                    if wait <= 0:
+                        break
+                    try:
+                        upload = await asyncio.wait_for(queue.get(), wait)
+                    except asyncio.TimeoutError:
+                        break
+                # Uploads whose request timed out (504) while queued are not parsed.
+                if not upload.future.done():
+                    batch.append(upload)
+            # Requests can also time out while the batch waits for more uploads.
+            batch = [upload for upload in batch if not upload.future.done()]
+            if not batch:
+                free.release()
+                continue
+            task = asyncio.create_task(self._run_batch(batch))
+            task.add_done_callback(lambda _: free.release())
+
+    async def _run_batch(self, batch: list[_Upload]) -> None:
+        self.batches += 1
+        self.in_flight += len(batch)
+        self._batch_sizes.append(len(batch))
+        loop = asyncio.get_running_loop()
+        try:
+            pdfs = [upload.pdf for upload in batch]
+            results = await loop.run_in_executor(
+                self._executor, _parse_uploads, pdfs, *self.options
+            )
+        except BrokenProcessPool as e:
+            self._broken = True
+            results = [(None, f"Worker pool broken: {e}")] * len(batch)
+        except Exception as e:
+            logger.exception("Batch failed")
+            results = [(None, f"{type(e).__name__}: {e}")] * len(batch)
+        finally:
+            self.in_flight -= len(batch)
+        for upload, result in zip(batch, results):
+            if not upload.future.done():
+                upload.future.set_result(result)
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line.strip():
+                    break
+                keep_alive = await self._respond(request_line, reader, writer)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, asyncio.LimitOverrunError):
+            pass
+        finally:
+            writer.close()
+
+    async def _respond(self, request_line: bytes, reader, writer) -> bool:
+        """Answer one request; returns whether the connection stays open."""
+        keep_alive = False
+        try:
+            try:
+                method, target, version = request_line.decode("latin-1").split()
+            except ValueError:
+                raise _HttpError(400, "Malformed request line") from None
+            headers = {}
+            while (line := await reader.readline()).strip():
+                name, _, value = line.decode("latin-1").partition(":")
+                headers[name.strip().lower()] = value.strip()
+            keep_alive = version == "HTTP/1.1" and headers.get("connection") != "close"
+            if headers.get("transfer-encoding", "identity") != "identity":
+                keep_alive = False
+                raise _HttpError(411, "Send the upload with a Content-Length")
+            length = int(headers.get("content-length") or 0)
+            if length > self.max_upload:
+                keep_alive = False
+                raise _HttpError(413, f"Uploads are limited to {self.max_upload} bytes")
+            body = await reader.readexactly(length) if length else b""
+            status, payload = 200, await self._route(method, target.split("?")[0], headers, body)
+        except _HttpError as e:
+            status, payload = e.status, {"error": str(e)}
+        except ValueError as e:
+            status, payload, keep_alive = 400, {"error": str(e)}, False
+        if status >= 400 and status != 503:
+            self.errors += 1
+        content = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        head = [
+            f"HTTP/1.1 {status} {_REASONS[status]}",
+            "Content-Type: application/json; charset=utf-8",
+            f"Content-Length: {len(content)}",
+            f"Connection: {'keep-alive' if keep_alive else 'close'}",
+        ]
+        if status == 503:
+            head.append("Retry-After: 1")
+        writer.write(("\r\n".join(head) + "\r\n\r\n").encode("latin-1") + content)
+        return keep_alive
+
+    async def _route(self, method: str, path: str, headers: dict, body: bytes) -> dict:
+        routes: dict[str, tuple[str, Callable[[], dict] | None]] = {
+            "/health": ("GET", self.health),
+            "/queue": ("GET", self.queue_stats),
+            "/latency": ("GET", self.latency_stats),
+            "/parse": ("POST", None),
+        }
+        if path not in routes:
+            raise _HttpError(404, f"No endpoint {path}")
+        allowed, handler = routes[path]
+        if method != allowed:
+            raise _HttpError(405, f"Use {allowed} for {path}")
+        if handler is not None:
+            if path == "/health" and self._broken:
+                raise _HttpError(503, "Worker pool broken")
+            return handler()
+        self.requests += 1
+        pdf = _upload_bytes(headers.get("content-type", ""), body)
+        if not pdf:
+            raise _HttpError(400, "Empty upload")
+        return await self.parse(pdf)
+
+
+def _upload_bytes(content_type: str, body: bytes) -> bytes:
+    """The PDF of a request body: the body itself, or the first file of a form."""
+    if not content_type.startswith("multipart/form-data"):
+        return body
+    message = email.parser.BytesParser(policy=email.policy.HTTP).parsebytes(
+        f"Content-Type: {content_type}\r\n\r\n".encode("latin-1") + body
+    )
+    for part in message.iter_parts():
+        if part.get_filename() or part.get_param("name", header="content-disposition") == "file":
+            payload = part.get_payload(decode=True)
+            return payload if isinstance(payload, bytes) else b""
+    raise _HttpError(400, "The form has no file")
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="resume-parser-server", description="Serve resume parsing over HTTP."
+    )
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument(
+        "-w", "--workers", type=int, default=None, help="worker processes (default: CPUs)"
+    )
+    parser.add_argument("--max-batch", type=int, default=8, help="uploads parsed together")
+    parser.add_argument(
+        "--max-wait-ms",
+        type=float,
+        default=10.0,
+        help="how long a batch waits for more uploads (default: 10)",
+    )
+    parser.add_argument("--max-queue", type=int, default=256, help="uploads waiting at most")
+    parser.add_argument(
+        "--max-upload-mb", type=float, default=20.0, help="largest accepted upload in MiB"
+    )
+    parser.add_argument("--timeout", type=float, default=60.0, help="seconds per request")
+    parser.add_argument(
+        "--fields",
+        type=lambda value: value.split(","),
+        help=f"comma-separated fields to extract (default: all of {','.join(FIELDS)})",
+    )
+    parser.add_argument("--layout", action="store_true", help="use font sizes and positions")
+    parser.add_argument("--profile", choices=PROFILES, default="full")
+    parser.add_argument("-v", "--verbose", action="store_true", help="log progress")
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = build_parser().parse_args(argv)
+    logging.basicConfig(level=logging.INFO if args.verbose else logging.WARNING)
+    server = ParseServer(
+        host=args.host,
+        port=args.port,
+        workers=args.workers,
+        max_batch=args.max_batch,
+        max_wait=args.max_wait_ms / 1000,
+        max_queue=args.max_queue,
+        max_upload=int(args.max_upload_mb * 1024 * 1024),
+        timeout=args.timeout,
+        fields=args.fields,
+        layout=args.layout,
+        profile=args.profile,
+    )
+    try:
+        asyncio.run(server.serve_forever())
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,91 @@
+"""Accepted PDF inputs and how they are handed to PyMuPDF.
+
+A PDF can be given as a path, as ``bytes``/``bytearray``/``memoryview``, as an
+``mmap.mmap`` or as a binary file-like object. In-memory inputs are passed to
+``fitz.open(stream=...)`` as a ``memoryview`` so the buffer is not copied.
+"""
+
+import io
+import mmap
+import os
+from typing import BinaryIO
+
+import pymupdf as fitz
+
+PdfSource = str | os.PathLike | bytes | bytearray | memoryview | mmap.mmap | BinaryIO
+
+
+def is_path(source: PdfSource) -> bool:
+    return isinstance(source, (str, os.PathLike))
+
+
+def as_buffer(source: PdfSource) -> memoryview | None:
+    """Return a zero-copy byte view of an in-memory source, or None for a path.
+
+    File-like objects are read once from their current position (a
+    ``BytesIO`` exposes that part of its buffer directly), so callers should
+    convert a stream with this before using it twice.
+    """
+    if is_path(source):
+        return None
+    return _buffer(source)
+
+
+def _buffer(source: PdfSource) -> memoryview:
+    if isinstance(source, memoryview):
+        return source if source.format == "B" and source.ndim == 1 else source.cast("B")
+    if isinstance(source, (bytes, bytearray, mmap.mmap)):
+        return memoryview(source)
+    if isinstance(source, io.BytesIO):
+        return source.getbuffer()[source.tell() :]
+    if hasattr(source, "read"):
+        return memoryview(source.read())
+    raise TypeError(f"Unsupported PDF source: {type(source).__name__}")
+
+
+def load_source(source: PdfSource, read_path: bool = False) -> PdfSource:
+    """Normalize ``source`` so it can be used more than once.
+
+    Streams become buffers. Paths stay paths unless ``read_path`` is set, in
+    which case the file is read into memory (falling back to the path, so the
+    usual extraction error is reported, if it cannot be read).
+    """
+    if isinstance(source, (str, os.PathLike)):
+        if not read_path:
+            return source
+        try:
+            with open(source, "rb") as f:
+                return memoryview(f.read())
+        except OSError:
+            return source
+    return _buffer(source)
+
+
+def picklable(source: PdfSource) -> str | bytes:
+    """``source`` as a path string or ``bytes``, to hand to another process.
+
+    Buffers and open files cannot be pickled, so they are copied (streams
+    from their current position).
+    """
+    if isinstance(source, (str, os.PathLike)):
+        return os.fspath(source)
+    if isinstance(source, bytes):
+        return source
+    return bytes(_buffer(source))
+
+
+def describe(source: PdfSource) -> str:
+    """Short description of a source for log messages."""
+    if isinstance(source, (str, os.PathLike)):
+        return os.fspath(source)
+    if isinstance(source, (bytes, bytearray, memoryview, mmap.mmap)):
+        return f"<{len(source)} byte buffer>"
+    return f"<{type(source).__name__}>"
+
+
+def open_pdf(source: PdfSource) -> "fitz.Document":
+    """Open ``source`` with PyMuPDF without copying in-memory buffers."""
+    buffer = as_buffer(source)
+    if buffer is None:
+        return fitz.open(source)
+    return fitz.open(stream=buffer, filetype="pdf")
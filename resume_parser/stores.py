@@ -0,0 +1,28 @@
+"""The on-disk stores a parse can use, passed together as ``stores=``.
+
+Each store is optional and independent of the others:
+
+- ``cache``: a ``ResultCache`` of whole results (see ``resume_parser.cache``);
+- ``docs``: a ``DocStore`` of extracted text and spaCy docs (see
+  ``resume_parser.docstore``);
+- ``revisions``: a ``RevisionStore`` of page texts and section results, for
+  edited re-uploads (see ``resume_parser.revisions``).
+"""
+
+from dataclasses import dataclass
+
+from .cache import ResultCache
+from .docstore import DocStore
+from .revisions import RevisionStore
+
+
+@dataclass(frozen=True)
+class Stores:
+    """The stores used by ``parse_resume`` and the other parse functions.
+
+    Picklable, so it can be handed to worker processes.
+    """
+
+    cache: ResultCache | None = None
+    docs: DocStore | None = None
+    revisions: RevisionStore | None = None
@@ -0,0 +1,128 @@
+"""Field-by-field parsing for interfaces that show results as they arrive.
+
+:func:`iter_resume_fields` yields each field as soon as it is known instead of
+returning them all at the end. The header fields come from the leading pages
+alone (as in ``parse_resume_header``), so the regex fields are available after
+reading the first page, before spaCy has run at all. The rest of the document
+is read afterwards, and achievements are yielded one by one while the
+remaining titles are still being built.
+"""
+
+import contextvars
+import logging
+from collections.abc import Iterator
+from dataclasses import dataclass
+from typing import Any
+
+from .document import ResumeDocument
+from .metrics import timed
+from .pages import PdfPages
+from .resume_parser import (
+    _EXTRACTORS,
+    _HEADER_CHARS,
+    _HEADER_LINES,
+    _REGEX_FIELDS,
+    _SPACY_DOC_FIELDS,
+    PROFILES,
+    _header_doc,
+    _iter_achievements,
+    _plan,
+    _using_profile,
+)
+from .sources import PdfSource, describe, load_source
+
+logger = logging.getLogger(__name__)
+
+# Header fields that need only the leading pages, in the order they are yielded.
+_HEAD_FIELDS = (*_REGEX_FIELDS, "name", "role", "location")
+
+
+@dataclass(frozen=True)
+class FieldUpdate:
+    """One step of a streamed parse.
+
+    ``value`` is the final value of ``field``, or, when ``item`` is true, one
+    more item of a list field (``achievements``). Every field ends with exactly
+    one update with ``item=False`` holding its complete value.
+    """
+
+    field: str
+    value: Any
+    item: bool = False
+
+
+def iter_resume_fields(
+    file_path: PdfSource, fields=None, layout: bool = False, profile: str = "full"
+) -> Iterator[FieldUpdate]:
+    """Parse a resume, yielding each field as soon as it is known.
+
+    Fields come in the order email, phone, linkedin, name, role, location
+    (email and phone later if they are not on the leading pages), then
+    summary, each achievement followed by the full list, awards and sections.
+    The final values are those of ``parse_resume`` with the same ``fields``,
+    ``layout`` and ``profile``; an unreadable PDF yields nothing.
+    """
+    _plan(fields)
+    if profile not in PROFILES:
+        raise ValueError(f"Unknown profile {profile!r}; expected one of {PROFILES}")
+    updates = _field_updates(load_source(file_path), fields, layout, profile)
+    return _in_own_context(updates)
+
+
+def _in_own_context(updates: Iterator[FieldUpdate]) -> Iterator[FieldUpdate]:
+    # The parse's profile setting must not leak into the consumer's code
+    # between updates.
+    context = contextvars.copy_context()
+    while True:
+        try:
+            update = context.run(next, updates)
+        except StopIteration:
+            return
+        yield update
+
+
+def _field_updates(source: PdfSource, fields, layout: bool, profile: str) -> Iterator[FieldUpdate]:
+    plan = _plan(fields)
+    requested = set(_plan(fields, resolve=False))
+    with _using_profile(profile), PdfPages(source, layout=layout) as pages:
+        try:
+            head = pages.head(_HEADER_LINES, _HEADER_CHARS)
+        except Exception:
+            logger.exception("Error reading PDF")
+            return
+        if not head:
+            logger.warning(f"PDF extraction returned no text: {describe(source)}")
+            return
+        document = ResumeDocument(head, pages.layout() if layout else None)
+        data: dict = {}
+        nlp_doc = None
+        header_doc_pending = bool(_SPACY_DOC_FIELDS.intersection(plan))
+        for field in _HEAD_FIELDS:
+            if field not in plan:
+                continue
+            if header_doc_pending and field in _SPACY_DOC_FIELDS:
+                nlp_doc = _header_doc(document, plan)
+                header_doc_pending = False
+            value = timed(f"extract_{field}", _EXTRACTORS[field], document, data, nlp_doc)
+            # Email and phone may still turn up further down.
+            if value or field not in ("email", "phone"):
+                data[field] = value
+                if field in requested:
+                    yield FieldUpdate(field, value)
+        rest = [field for field in plan if field not in data]
+        if rest and pages.extracted < len(pages):
+            try:
+                document = ResumeDocument(pages.text(), pages.layout() if layout else None)
+            except Exception:
+                logger.exception("Error reading PDF")
+                return
+        for field in rest:
+            if field == "achievements":
+                items = []
+                for achievement in _iter_achievements(document):
+                    items.append(achievement)
+                    yield FieldUpdate(field, achievement, item=True)
+                yield FieldUpdate(field, items)
+            else:
+                value = timed(f"extract_{field}", _EXTRACTORS[field], document, data, nlp_doc)
+                yield FieldUpdate(field, value)
@@ -0,0 +1,56 @@
+"""Shared fixtures for resume_parser tests."""
+
+from pathlib import Path
+
+import pytest
+
+from resume_parser import configure_model
+
+SAMPLE_PDF = Path(__file__).resolve().parent.parent / "sample_resume.pdf"
+
+
+@pytest.fixture
+def sample_pdf():
+    return str(SAMPLE_PDF)
+
+
+VERBS = {"led", "reduced", "implemented", "developed", "improved", "mentored", "integrated"}
+
+
+def _toy_tagger(doc):
+    # Enough POS/dependency annotation for the extractors (incl. noun_chunks).
+    for token in doc:
+        token.pos_ = "VERB" if token.lower_ in VERBS else "NOUN" if token.is_alpha else "PUNCT"
+        token.head = token
+        token.dep_ = "ROOT"
+    return doc
+
+
+@pytest.fixture
+def blank_nlp():
+    """A small offline pipeline standing in for en_core_web_sm."""
+    spacy = pytest.importorskip("spacy")
+    from spacy.language import Language
+
+    if "toy_tagger" not in Language.factories:
+        Language.component("toy_tagger", func=_toy_tagger)
+    nlp = spacy.blank("en")
+    nlp.add_pipe("toy_tagger")
+    ruler = nlp.add_pipe("entity_ruler")
+    ruler.add_patterns(
+        [
+            {"label": "PERSON", "pattern": "Sarah Johnson"},
+            {"label": "GPE", "pattern": "San Francisco"},
+        ]
+    )
+    configure_model(nlp)
+    yield nlp
+    configure_model(None)
+
+
+@pytest.fixture
+def no_nlp():
+    """Run the rule-based paths only."""
+    configure_model("resume-parser-missing-model")
+    yield
+    configure_model(None)
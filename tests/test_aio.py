@@ -0,0 +1,98 @@
+"""Tests for the asyncio API."""
+
+import asyncio
+import threading
+
+import pytest
+
+from resume_parser import AsyncResumeParser, aio, aparse_resume, aparse_resumes, parse_resume
+
+
+@pytest.fixture
+def slow_parse(monkeypatch):
+    """Replace the blocking parse with one that records overlap and can be held."""
+    state = {"running": 0, "peak": 0, "calls": [], "gate": threading.Event()}
+    lock = threading.Lock()
+
+    def fake_parse(source, stores=None, metrics=None, profile="full"):
+        with lock:
+            state["calls"].append(source)
+            state["running"] += 1
+            state["peak"] = max(state["peak"], state["running"])
+        state["gate"].wait(5)
+        with lock:
+            state["running"] -= 1
+        if source == "bad":
+            raise ValueError("bad pdf")
+        return {"source": source}
+
+    monkeypatch.setattr(aio, "parse_resume", fake_parse)
+    return state
+
+
+class TestAsyncApi:
+    def test_matches_sync_parse(self, sample_pdf, no_nlp):
+        expected = parse_resume(sample_pdf)
+        assert asyncio.run(aparse_resume(sample_pdf)) == expected
+        assert asyncio.run(aparse_resumes([sample_pdf, sample_pdf])) == [expected] * 2
+
+    def test_concurrency_is_bounded(self, slow_parse):
+        slow_parse["gate"].set()
+
+        async def main():
+            async with AsyncResumeParser(max_concurrency=2) as parser:
+                return await asyncio.gather(*(parser.parse(str(i)) for i in range(6)))
+
+        assert [r["source"] for r in asyncio.run(main())] == [str(i) for i in range(6)]
+        assert slow_parse["peak"] <= 2
+
+    def test_backpressure_timeout_and_cancellation(self, slow_parse):
+        async def main():
+            parser = AsyncResumeParser(max_concurrency=1, max_pending=1)
+            running = asyncio.ensure_future(parser.parse("a"))
+            queued = asyncio.ensure_future(parser.parse("b"))
+            await asyncio.sleep(0.05)
+            assert (parser.in_flight, parser.pending) == (1, 1)
+            with pytest.raises(asyncio.QueueFull):
+                await parser.parse("c")
+            queued.cancel()
+            with pytest.raises(asyncio.TimeoutError):
+                await parser.parse("d", timeout=0.05)
+            slow_parse["gate"].set()
+            assert (await running)["source"] == "a"
+            assert (await parser.parse("e"))["source"] == "e"
+            parser.close()
+
+        asyncio.run(main())
+        assert slow_parse["calls"] == ["a", "e"]
+
+    def test_parse_many_pulls_lazily(self, slow_parse):
+        slow_parse["gate"].set()
+        pulled = []
+
+        async def sources():
+            for name in ["a", "bad", "c"]:
+                pulled.append(name)
+                yield name
+
+        async def main():
+            parser = AsyncResumeParser(max_concurrency=1)
+            results = await parser.parse_many(sources(), return_exceptions=True)
+            assert isinstance(results[1], ValueError)
+            assert [results[0]["source"], results[2]["source"]] == ["a", "c"]
+            with pytest.raises(ValueError):
+                await parser.parse_many(["bad", "x", "y"])
+            parser.close()
+
+        asyncio.run(main())
+        assert pulled == ["a", "bad", "c"]
+
+    def test_process_executor_with_bytes(self, sample_pdf, no_nlp):
+        with open(sample_pdf, "rb") as f:
+            data = memoryview(f.read())
+
+        async def main():
+            async with AsyncResumeParser("process", max_concurrency=1) as parser:
+                return await parser.parse(data, timeout=60)
+
+        assert asyncio.run(main()) == parse_resume(sample_pdf)
@@ -0,0 +1,70 @@
+"""Tests for the multi-process runner and CLI."""
+
+import io
+import json
+import multiprocessing
+
+import pytest
+
+from resume_parser import parse_resume, parse_resumes_parallel
+from resume_parser.bulk import _worker_initargs, iter_resumes_parallel
+from resume_parser.cli import main
+
+
+class TestParallel:
+    def test_order_and_failure_isolation(self, tmp_path, sample_pdf, no_nlp):
+        missing = str(tmp_path / "missing.pdf")
+        paths = [sample_pdf, missing, sample_pdf, sample_pdf]
+        report = parse_resumes_parallel(paths, workers=2, chunksize=1)
+        assert [r.path for r in report.results] == paths
+        assert [r.ok for r in report.results] == [True, False, True, True]
+        assert report.results[0].data == parse_resume(sample_pdf)
+        assert report.files_per_second > 0
+
+    def test_in_process(self, sample_pdf, no_nlp):
+        report = parse_resumes_parallel([sample_pdf], workers=1)
+        assert report.workers == 1
+        assert report.results[0].data["name"] == "Sarah Johnson"
+
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_in_memory_sources(self, sample_pdf, no_nlp, workers):
+        with open(sample_pdf, "rb") as f:
+            data = f.read()
+        sources = [data, memoryview(data), io.BytesIO(data)]
+        report = parse_resumes_parallel(sources, workers=workers, chunksize=1)
+        assert [r.data for r in report.results] == [parse_resume(sample_pdf)] * 3
+        assert report.results[0].path == f"<{len(data)} byte buffer>"
+
+
+class TestCli:
+    def test_writes_json_lines(self, tmp_path, sample_pdf, no_nlp, capsys):
+        output = tmp_path / "out.jsonl"
+        assert main([sample_pdf, "-w", "1", "-o", str(output)]) == 0
+        records = [json.loads(line) for line in output.read_text().splitlines()]
+        assert records[0]["path"] == sample_pdf
+        assert records[0]["result"]["email"] == "sarah.johnson@email.com"
+        assert "files/s" in capsys.readouterr().err
+
+
+class TestStreaming:
+    def test_input_is_consumed_lazily(self, sample_pdf, no_nlp):
+        pulled = []
+
+        def paths():
+            for i in range(40):
+                pulled.append(i)
+                yield sample_pdf
+
+        results = iter_resumes_parallel(paths(), workers=2, chunksize=1)
+        assert next(results).ok
+        assert len(pulled) < 10
+        assert sum(1 for _ in results) == 39
+
+
+class TestInjectedPipeline:
+    def test_refused_by_spawned_workers(self, blank_nlp):
+        with pytest.raises(ValueError, match="configure_model"):
+            _worker_initargs(multiprocessing.get_context("spawn"))
+
+    def test_inherited_by_forked_workers(self, blank_nlp):
+        assert _worker_initargs(multiprocessing.get_context("fork")) == (None, False)
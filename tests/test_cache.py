@@ -0,0 +1,65 @@
+"""Tests for the content-addressed result cache."""
+
+from resume_parser import (
+    ResultCache,
+    Stores,
+    configure_model,
+    parse_resume,
+    parse_resumes,
+    parse_resumes_parallel,
+)
+from resume_parser import resume_parser as rp
+
+
+class TestResultCache:
+    def test_hit_skips_extraction(self, tmp_path, sample_pdf, no_nlp, monkeypatch):
+        cache = ResultCache(tmp_path / "cache.sqlite")
+        first = parse_resume(sample_pdf, stores=Stores(cache=cache))
+        monkeypatch.setattr(rp, "extract_text_from_pdf", lambda path: "")
+        assert parse_resume(sample_pdf, stores=Stores(cache=cache)) == first
+        assert parse_resumes([sample_pdf], stores=Stores(cache=cache)) == [first]
+        assert cache.stats()["entries"] == 1
+        assert (cache.hits, cache.misses) == (2, 1)
+
+    def test_key_depends_on_bytes_and_config(self):
+        assert ResultCache.key_for(b"a") == ResultCache.key_for(b"a")
+        assert ResultCache.key_for(b"a") != ResultCache.key_for(b"b")
+        assert ResultCache.key_for(b"a") != ResultCache.key_for(b"a", {"fields": ["email"]})
+
+    def test_key_depends_on_injected_pipeline(self, blank_nlp):
+        import spacy
+
+        key = ResultCache.key_for(b"a")
+        other = spacy.blank("en")
+        configure_model(other)
+        assert ResultCache.key_for(b"a") != key
+
+    def test_rule_only_results_are_not_served_once_the_model_loads(
+        self, tmp_path, sample_pdf, blank_nlp, monkeypatch
+    ):
+        import spacy
+
+        expected = parse_resume(sample_pdf)
+        cache = ResultCache(tmp_path / "cache.sqlite")
+        configure_model("resume-parser-late-model")
+        assert parse_resume(sample_pdf, stores=Stores(cache=cache)) != expected
+        # The same model name now loads.
+        monkeypatch.setattr(spacy, "load", lambda name: blank_nlp)
+        configure_model("resume-parser-late-model")
+        assert parse_resume(sample_pdf, stores=Stores(cache=cache)) == expected
+        assert (cache.hits, cache.misses) == (0, 2)
+
+    def test_lru_eviction(self, tmp_path):
+        cache = ResultCache(tmp_path / "cache.sqlite", max_bytes=40)
+        cache.put("a", {"v": "x" * 10})
+        cache.put("b", {"v": "y" * 10})
+        cache.get("a")
+        cache.put("c", {"v": "z" * 10})
+        assert cache.get("a") is not None
+        assert cache.get("b") is None
+        assert cache.get("c") is not None
+
+    def test_shared_by_worker_processes(self, tmp_path, sample_pdf, no_nlp):
+        cache = ResultCache(tmp_path / "cache.sqlite")
+        parse_resumes_parallel([sample_pdf] * 4, workers=2, chunksize=2, stores=Stores(cache=cache))
+        assert cache.stats()["entries"] == 1
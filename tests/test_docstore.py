@@ -0,0 +1,67 @@
+"""Tests for the on-disk store of spaCy docs."""
+
+from resume_parser import (
+    DocStore,
+    ParseMetrics,
+    Stores,
+    line_facts_cache,
+    parse_resume,
+    parse_resumes,
+    parse_resumes_parallel,
+)
+from resume_parser import resume_parser as rp
+
+
+def _nlp_work(metrics):
+    counters = metrics.snapshot()["counters"]
+    return counters.get("nlp_calls", 0) + counters.get("nlp_piped_texts", 0)
+
+
+class TestDocStore:
+    def test_round_trip(self, tmp_path, blank_nlp):
+        store = DocStore(tmp_path / "docs.sqlite")
+        docs = [blank_nlp("Sarah Johnson"), blank_nlp("Led a team in San Francisco")]
+        store.save("k", "full text", docs)
+        text, loaded = store.load("k", blank_nlp)
+        assert text == "full text"
+        assert [ent.label_ for ent in loaded["Sarah Johnson"].ents] == ["PERSON"]
+        assert loaded["Led a team in San Francisco"][0].pos_ == "VERB"
+        assert store.load("missing", blank_nlp) is None
+
+    def test_reparse_skips_extraction_and_spacy(self, tmp_path, sample_pdf, blank_nlp, monkeypatch):
+        store = DocStore(tmp_path / "docs.sqlite")
+        first = parse_resume(sample_pdf, stores=Stores(docs=store))
+        assert first == parse_resume(sample_pdf)
+        line_facts_cache().clear()
+        monkeypatch.setattr(rp, "extract_text_from_pdf", lambda path: "")
+        metrics = ParseMetrics()
+        assert parse_resume(sample_pdf, stores=Stores(docs=store), metrics=metrics) == first
+        assert parse_resumes([sample_pdf], stores=Stores(docs=store), metrics=metrics) == [first]
+        assert _nlp_work(metrics) == 0
+        assert metrics.snapshot()["counters"]["doc_store_hits"] == 2
+        report = parse_resumes_parallel([sample_pdf], workers=1, stores=Stores(docs=store))
+        assert report.results[0].data == first
+
+    def test_new_docs_are_added(self, tmp_path, sample_pdf, blank_nlp):
+        store = DocStore(tmp_path / "docs.sqlite")
+        parse_resume(sample_pdf, stores=Stores(docs=store), fields=["location"])
+        line_facts_cache().clear()
+        full = parse_resume(sample_pdf, stores=Stores(docs=store))
+        line_facts_cache().clear()
+        metrics = ParseMetrics()
+        assert parse_resume(sample_pdf, stores=Stores(docs=store), metrics=metrics) == full
+        assert _nlp_work(metrics) == 0
+        assert store.stats()["entries"] == 1
+
+    def test_key_depends_on_pipeline(self, blank_nlp):
+        key = DocStore.key_for(b"pdf", blank_nlp)
+        assert key == DocStore.key_for(b"pdf", blank_nlp)
+        assert key != DocStore.key_for(b"pdf", blank_nlp, {"layout": True})
+        blank_nlp.meta["version"] = "9.9.9"
+        assert key != DocStore.key_for(b"pdf", blank_nlp)
+
+    def test_not_used_without_spacy_fields(self, tmp_path, sample_pdf, blank_nlp):
+        store = DocStore(tmp_path / "docs.sqlite")
+        parse_resume(sample_pdf, stores=Stores(docs=store), fields=["email"])
+        parse_resume(sample_pdf, stores=Stores(docs=store), profile="fast")
+        assert store.stats()["entries"] == 0
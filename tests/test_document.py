@@ -0,0 +1,23 @@
+"""Tests for ResumeDocument."""
+
+from resume_parser import ResumeDocument, extract_summary
+
+
+class TestResumeDocument:
+    def test_lines_and_features(self):
+        document = ResumeDocument("  Jane Doe \n\nSUMMARY\n• Grew sales 20%\njane@x.io\n")
+        assert document.lines == ["Jane Doe", "SUMMARY", "• Grew sales 20%", "jane@x.io"]
+        assert document.lower[1] == "summary"
+        assert document.line_indexes == [0, 2, 3, 4]
+        assert document.is_bullet == [False, False, True, False]
+        assert document.is_upper == [False, True, False, False]
+        assert document.has_digit == [False, False, True, False]
+        assert document.has_at == [False, False, False, True]
+
+    def test_of_reuses_document(self):
+        document = ResumeDocument("text")
+        assert ResumeDocument.of(document) is document
+
+    def test_extractors_accept_text_or_document(self):
+        text = "Summary\nBuilds things.\nExperience\n"
+        assert extract_summary(text) == extract_summary(ResumeDocument(text)) == "Builds things."
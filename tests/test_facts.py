@@ -0,0 +1,82 @@
+"""Tests for the memo of per-line spaCy analyses."""
+
+import threading
+
+from resume_parser import LineFactsCache, ParseMetrics, extract_name, line_facts_cache, parse_resume
+
+
+class TestLineFactsCache:
+    def test_facts_from_doc(self, blank_nlp):
+        cache = LineFactsCache()
+        facts = cache.lookup(blank_nlp, "Sarah Johnson led teams", lambda nlp, text: nlp(text))
+        assert facts.tokens == ("Sarah", "Johnson", "led", "teams")
+        assert facts.first_pos == "NOUN"
+        assert facts.ents == (("Sarah Johnson", "PERSON"),)
+        assert all(pos for _, pos in facts.noun_chunks)
+
+    def test_lru_and_stats(self, blank_nlp):
+        calls = []
+        cache = LineFactsCache(maxsize=2)
+
+        def analyse(nlp, text):
+            calls.append(text)
+            return nlp(text)
+
+        for text in ["a", "b", "a", "c", "a", "b"]:
+            cache.lookup(blank_nlp, text, analyse)
+        # "a" was used more recently than "b" when "c" came in.
+        assert calls == ["a", "b", "c", "b"]
+        assert cache.stats() == {
+            "entries": 2,
+            "maxsize": 2,
+            "hits": 2,
+            "misses": 4,
+            "hit_rate": 2 / 6,
+        }
+        cache.resize(1)
+        assert len(cache) == 1
+        cache.resize(0)
+        cache.lookup(blank_nlp, "a", analyse)
+        assert len(cache) == 0
+
+    def test_new_pipeline_clears(self, blank_nlp):
+        cache = LineFactsCache()
+        cache.lookup(blank_nlp, "a", lambda nlp, text: nlp(text))
+        assert cache.contains(blank_nlp, "a")
+        assert not cache.contains(object(), "a")
+        assert len(cache) == 0
+
+    def test_threads(self, blank_nlp):
+        cache = LineFactsCache(maxsize=8)
+        analyse = lambda nlp, text: nlp(text)
+
+        def work():
+            for i in range(200):
+                cache.lookup(blank_nlp, f"line {i % 16}", analyse)
+
+        threads = [threading.Thread(target=work) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        stats = cache.stats()
+        assert stats["hits"] + stats["misses"] == 800
+        assert stats["entries"] == 8
+
+
+class TestMemoizedParsing:
+    def test_repeated_lines_skip_spacy(self, sample_pdf, blank_nlp):
+        first, second = ParseMetrics(), ParseMetrics()
+        expected = parse_resume(sample_pdf, metrics=first)
+        assert parse_resume(sample_pdf, metrics=second) == expected
+        assert first.snapshot()["counters"]["line_facts_misses"] > 0
+        counters = second.snapshot()["counters"]
+        assert "line_facts_misses" not in counters
+        # Only the header doc still goes to spaCy.
+        assert counters["nlp_calls"] == 1
+        assert line_facts_cache().stats()["hits"] >= counters["line_facts_hits"]
+
+    def test_name_from_cached_entities(self, blank_nlp):
+        text = "Contact\nResume of Sarah Johnson, 2024\n"
+        assert extract_name(text, blank_nlp(text)) == "Sarah Johnson"
+        assert extract_name(text, blank_nlp(text)) == "Sarah Johnson"
@@ -0,0 +1,69 @@
+"""Tests for streaming, resumable ingestion."""
+
+import json
+import shutil
+
+import pytest
+
+from resume_parser.cli import main
+from resume_parser.ingest import Checkpoint, ingest, iter_pdf_paths
+
+
+@pytest.fixture
+def corpus(tmp_path, sample_pdf):
+    folder = tmp_path / "corpus"
+    (folder / "sub").mkdir(parents=True)
+    paths = []
+    for name in ["a.pdf", "b.pdf", "sub/c.pdf", "sub/d.PDF"]:
+        shutil.copy(sample_pdf, folder / name)
+        paths.append(str(folder / name))
+    (folder / "notes.txt").write_text("not a pdf")
+    return folder, paths
+
+
+def read_jsonl(path):
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+
+class TestPaths:
+    def test_directory_glob_and_manifest(self, corpus, tmp_path):
+        folder, paths = corpus
+        manifest = tmp_path / "manifest.txt"
+        manifest.write_text(f"# comment\n{paths[1]}\n\n")
+        assert list(iter_pdf_paths([folder])) == paths
+        assert list(iter_pdf_paths([f"{folder}/**/*.pdf"])) == paths[:3]
+        assert list(iter_pdf_paths([paths[0]], manifest=str(manifest))) == paths[:2]
+
+
+class TestIngest:
+    def test_resume_after_crash(self, corpus, tmp_path, no_nlp):
+        _, paths = corpus
+        output = tmp_path / "out.jsonl"
+        checkpoint = tmp_path / "out.checkpoint"
+        first = ingest(paths[:2], str(output), str(checkpoint), workers=1)
+        assert (first.parsed, first.skipped) == (2, 0)
+        # A crash after writing a record but before checkpointing it, and
+        # during the next checkpoint write.
+        with open(output, "a") as f:
+            f.write('{"path": "half written')
+        with open(checkpoint, "a") as f:
+            f.write('{"path": "')
+        second = ingest(paths, str(output), str(checkpoint), workers=1)
+        assert (second.parsed, second.skipped, second.failed) == (2, 2, 0)
+        records = read_jsonl(output)
+        assert [r["path"] for r in records] == paths
+        assert records[3]["result"]["name"] == "Sarah Johnson"
+        assert Checkpoint(str(checkpoint)).load() == (set(paths), output.stat().st_size)
+
+    def test_cli_checkpoint_and_failures(self, corpus, tmp_path, no_nlp, capsys):
+        folder, _paths = corpus
+        output = tmp_path / "out.jsonl"
+        argv = [str(folder), str(tmp_path / "missing.pdf"), "-w", "1", "-o", str(output)]
+        assert main(argv + ["--checkpoint", str(tmp_path / "ckpt")]) == 1
+        assert [r["error"] is None for r in read_jsonl(output)] == [True] * 4 + [False]
+        assert main(argv + ["--checkpoint", str(tmp_path / "ckpt")]) == 0
+        assert "5 already done" in capsys.readouterr().err
+        assert len(read_jsonl(output)) == 5
+        assert main(argv + ["--checkpoint", str(tmp_path / "ckpt"), "--retry-failed"]) == 1
+        assert "1 failed, 4 already done" in capsys.readouterr().err
+        assert [r["error"] is None for r in read_jsonl(output)] == [True] * 4 + [False] * 2
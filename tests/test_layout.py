@@ -0,0 +1,76 @@
+"""Tests for layout mode (font sizes, weights and columns)."""
+
+import pymupdf as fitz
+import pytest
+
+from resume_parser import extract_text_from_pdf, parse_resume, parse_resume_header
+from resume_parser.pages import PdfPages
+
+SIDEBAR = ["Contact", "jane@example.com", "Skills", "Python", "Kubernetes"]
+MAIN = [
+    ("JANE O'NEIL", 20, "hebo"),
+    ("Staff Engineer", 10, "helv"),
+    ("Experience", 12, "hebo"),
+    (
+        "• Reduced cloud spend by 35% through rightsizing of compute fleets in all regions",
+        9,
+        "helv",
+    ),
+    ("Volunteer Work", 12, "hebo"),
+    ("• Raised $20,000 for the local food bank by organising 12 charity runs each year", 9, "helv"),
+    ("Education", 12, "hebo"),
+    ("State University", 10, "helv"),
+]
+
+
+@pytest.fixture
+def two_column_pdf(tmp_path):
+    """Sidebar and main column written line by line in alternation, so the
+    content stream interleaves the two columns."""
+    doc = fitz.open()
+    page = doc.new_page()
+    for i, (text, size, font) in enumerate(MAIN):
+        if i < len(SIDEBAR):
+            page.insert_text((36, 60 + 40 * i), SIDEBAR[i], fontsize=9)
+        page.insert_text((200, 60 + 40 * i), text, fontsize=size, fontname=font)
+    path = tmp_path / "two-column.pdf"
+    doc.save(path)
+    return str(path)
+
+
+class TestLayout:
+    def test_columns_and_styles(self, two_column_pdf):
+        assert extract_text_from_pdf(two_column_pdf).splitlines()[:2] == ["Contact", "JANE O'NEIL"]
+        with PdfPages(two_column_pdf, layout=True) as pages:
+            text = pages.text()
+            lines = pages.layout()
+        assert text.splitlines()[: len(SIDEBAR) + 1] == SIDEBAR + ["JANE O'NEIL"]
+        assert [line.text for line in lines] == [line for line in text.splitlines() if line]
+        name = lines[len(SIDEBAR)]
+        assert (name.size, name.bold, name.page) == (20, True, 0)
+        assert name.x0 >= 200 > lines[0].x1
+
+    def test_name_from_font_size(self, two_column_pdf, no_nlp):
+        # Without font sizes the rules settle for the headline.
+        assert parse_resume(two_column_pdf, fields=["name"])["name"] == "Staff Engineer"
+        assert parse_resume(two_column_pdf, fields=["name"], layout=True) == {"name": "Jane O'Neil"}
+        assert parse_resume_header(two_column_pdf, layout=True)["name"] == "Jane O'Neil"
+
+    def test_styled_headers_end_sections(self, two_column_pdf, no_nlp):
+        plain = parse_resume(two_column_pdf)
+        layout = parse_resume(two_column_pdf, layout=True)
+        # "Volunteer Work" is not a known header, but it is set like one.
+        assert ["Raised" in a["description"] for a in plain["achievements"]] == [False, True]
+        assert ["Raised" in a["description"] for a in layout["achievements"]] == [False]
+        assert [s["name"] for s in layout["sections"]] == [
+            "contact",
+            "skills",
+            "experience",
+            "other",
+            "education",
+        ]
+        assert layout["sections"][3]["title"] == "Volunteer Work"
+
+    def test_layout_requires_layout_mode(self, two_column_pdf):
+        with PdfPages(two_column_pdf) as pages, pytest.raises(ValueError):
+            pages.layout()
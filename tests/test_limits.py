@@ -0,0 +1,101 @@
+"""Tests for resource limits and the parse sandbox."""
+
+import time
+
+import pymupdf as fitz
+import pytest
+
+from resume_parser import (
+    Limits,
+    ResultCache,
+    Stores,
+    parse_resume,
+    parse_resumes,
+    parse_resumes_parallel,
+)
+from resume_parser import resume_parser as rp
+from resume_parser.limits import first_lines
+
+
+@pytest.fixture
+def long_pdf(tmp_path):
+    """A 20-page CV of 40 achievement lines per page."""
+    doc = fitz.open()
+    for number in range(20):
+        page = doc.new_page()
+        lines = [f"Project {number}-{i}: reduced costs by {i}%" for i in range(40)]
+        if number == 0:
+            lines = ["Jane Doe", "jane@example.com", "Experience", *lines]
+        page.insert_text((36, 36), "\n".join(lines), fontsize=7)
+    path = tmp_path / "long.pdf"
+    doc.save(path)
+    return str(path)
+
+
+def _slow_parse(document, plan):
+    time.sleep(30)
+
+
+def _greedy_parse(document, plan):
+    return {"blob": bytearray(1 << 30)}
+
+
+class TestTextLimits:
+    def test_first_lines(self):
+        assert first_lines("a\n\nb\nc\n", 2) == ("a\n\nb\n", True)
+        assert first_lines("a\nb\n", 2) == ("a\nb\n", False)
+
+    def test_unlimited_has_no_status(self, sample_pdf, no_nlp):
+        assert "status" not in parse_resume(sample_pdf)
+        assert parse_resume(sample_pdf, limits=Limits())["status"] == {
+            "state": "ok",
+            "reasons": [],
+        }
+
+    def test_caps(self, long_pdf, no_nlp, monkeypatch):
+        seen = []
+        parse_text = rp._parse_text
+
+        def recording_parse(document, plan):
+            seen.append(document)
+            return parse_text(document, plan)
+
+        monkeypatch.setattr(rp, "_parse_text", recording_parse)
+        data = parse_resume(long_pdf, limits=Limits(max_pages=2))
+        assert data["status"] == {"state": "truncated", "reasons": ["max_pages"]}
+        assert len(seen[-1]) == 83
+        data = parse_resume(long_pdf, limits=Limits(max_chars=1000, max_lines=10))
+        assert data["status"]["reasons"] == ["max_chars", "max_lines"]
+        assert len(seen[-1]) == 10
+        assert data["email"] == "jane@example.com"
+        data = parse_resumes([long_pdf], limits=Limits(max_chars=5))[0]
+        assert data == {"status": {"state": "empty", "reasons": ["max_chars"]}}
+
+    def test_invalid(self):
+        with pytest.raises(ValueError):
+            Limits(max_pages=0)
+
+
+class TestSandbox:
+    def test_same_result(self, sample_pdf, no_nlp):
+        limited = parse_resume(sample_pdf, limits=Limits(timeout=30))
+        assert limited == {**parse_resume(sample_pdf), "status": {"state": "ok", "reasons": []}}
+
+    def test_timeout(self, tmp_path, sample_pdf, no_nlp, monkeypatch):
+        monkeypatch.setattr(rp, "_parse_text", _slow_parse)
+        cache = ResultCache(tmp_path / "cache.sqlite")
+        start = time.perf_counter()
+        data = parse_resume(sample_pdf, stores=Stores(cache=cache), limits=Limits(timeout=0.5))
+        assert time.perf_counter() - start < 10
+        assert data == {"status": {"state": "aborted", "reasons": ["timeout"]}}
+        assert cache.stats()["entries"] == 0
+
+    def test_memory(self, sample_pdf, no_nlp, monkeypatch):
+        monkeypatch.setattr(rp, "_parse_text", _greedy_parse)
+        data = parse_resume(sample_pdf, limits=Limits(max_memory=64 << 20))
+        assert data["status"] == {"state": "aborted", "reasons": ["max_memory"]}
+
+    def test_bulk_reports_aborted_files(self, sample_pdf, no_nlp, monkeypatch):
+        monkeypatch.setattr(rp, "_parse_text", _slow_parse)
+        report = parse_resumes_parallel([sample_pdf], workers=1, limits=Limits(timeout=0.5))
+        assert report.results[0].error == "Aborted: timeout"
@@ -0,0 +1,44 @@
+"""Tests for per-stage timing instrumentation."""
+
+from resume_parser import ParseMetrics, parse_resume, parse_resumes
+
+
+class TestParseMetrics:
+    def test_stages_and_nlp_calls(self, sample_pdf, blank_nlp):
+        metrics = ParseMetrics()
+        data = parse_resume(sample_pdf, metrics=metrics)
+        assert data == parse_resume(sample_pdf)
+        snapshot = metrics.snapshot()
+        stages = snapshot["stages"]
+        for name in ["parse", "pdf_open", "pdf_page", "spacy_doc", "extract_name", "extract_email"]:
+            assert stages[name]["count"] == 1, name
+        assert stages["parse"]["sum"] >= stages["extract_achievements"]["sum"]
+        assert snapshot["counters"]["parses"] == 1
+        assert snapshot["counters"]["nlp_calls"] >= 1
+
+    def test_batch_pipes_instead_of_calling(self, sample_pdf, blank_nlp):
+        metrics = ParseMetrics()
+        parse_resumes([sample_pdf, sample_pdf], metrics=metrics)
+        counters = metrics.snapshot()["counters"]
+        assert counters["parses"] == 2
+        assert counters["nlp_piped_texts"] > 0
+        assert "nlp_calls" not in counters
+
+    def test_prometheus_text(self, tmp_path):
+        metrics = ParseMetrics(buckets=(0.01, 0.1))
+        metrics.observe("pdf_open", 0.005)
+        metrics.observe("pdf_open", 0.05)
+        metrics.increment("parses")
+        text = metrics.to_prometheus()
+        assert 'resume_parser_stage_seconds_bucket{stage="pdf_open",le="0.01"} 1' in text
+        assert 'resume_parser_stage_seconds_bucket{stage="pdf_open",le="+Inf"} 2' in text
+        assert 'resume_parser_stage_seconds_count{stage="pdf_open"} 2' in text
+        assert "resume_parser_parses_total 1" in text
+        metrics.write_textfile(str(tmp_path / "parser.prom"))
+        assert (tmp_path / "parser.prom").read_text() == text
+
+    def test_off_by_default(self, sample_pdf, no_nlp):
+        metrics = ParseMetrics()
+        parse_resume(sample_pdf, metrics=metrics)
+        parse_resume(sample_pdf)
+        assert metrics.snapshot()["counters"]["parses"] == 1
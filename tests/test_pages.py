@@ -0,0 +1,46 @@
+"""Tests for lazy page extraction and header-only parsing."""
+
+import pymupdf as fitz
+import pytest
+
+from resume_parser import extract_text_from_pdf, parse_resume, parse_resume_header
+from resume_parser.pages import PdfPages
+from resume_parser.resume_parser import HEADER_FIELDS
+
+
+@pytest.fixture
+def long_pdf(tmp_path):
+    """A 30-page CV whose phone number only appears on the last page."""
+    doc = fitz.open()
+    header = "Jane Doe\nStaff Engineer\nBoston, MA\njane@example.com\nSummary\nBuilder.\n"
+    for number in range(30):
+        page = doc.new_page()
+        lines = [f"Project {number}-{i} shipped" for i in range(40)]
+        if number == 0:
+            lines = header.splitlines() + lines
+        if number == 29:
+            lines.append("Phone: 617-555-0100")
+        page.insert_text((36, 36), "\n".join(lines), fontsize=7)
+    path = tmp_path / "long.pdf"
+    doc.save(path)
+    return str(path)
+
+
+class TestPdfPages:
+    def test_pages_are_extracted_on_demand(self, long_pdf):
+        with PdfPages(long_pdf) as pages:
+            assert len(pages) == 30
+            assert pages.extracted == 0
+            head = pages.head(min_lines=55, min_chars=2000)
+            assert pages.extracted == 3  # about 800 characters per page
+            assert extract_text_from_pdf(long_pdf).startswith(head)
+            assert pages.text() == extract_text_from_pdf(long_pdf)
+
+    def test_header_matches_full_parse(self, sample_pdf, long_pdf, no_nlp):
+        for path in (sample_pdf, long_pdf):
+            full = parse_resume(path)
+            assert parse_resume_header(path) == {key: full[key] for key in HEADER_FIELDS}
+        assert parse_resume_header(long_pdf)["phone"] == "617-555-0100"
+
+    def test_unreadable_pdf(self, tmp_path, no_nlp):
+        assert parse_resume_header(str(tmp_path / "missing.pdf")) == {}
@@ -0,0 +1,20 @@
+"""Tests for the precompiled matchers."""
+
+import pytest
+
+from resume_parser.patterns import NON_NAME_INDICATORS, KeywordMatcher
+
+
+class TestKeywordMatcher:
+    @pytest.mark.parametrize(
+        "text",
+        ["", "john smith", "greater seattle area", "top skill", "software engineering", "a+b"],
+    )
+    def test_matches_any_substring(self, text):
+        expected = any(kw in text for kw in NON_NAME_INDICATORS.keywords)
+        assert bool(NON_NAME_INDICATORS.search(text)) == expected
+
+    def test_prefix_keywords_and_escaping(self):
+        matcher = KeywordMatcher(["led", "lead", "c++", "a.b"])
+        assert matcher.findall("we lead c++ and a.b") == ["lead", "c++", "a.b"]
+        assert not matcher.search("axb c+")
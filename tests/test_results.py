@@ -0,0 +1,78 @@
+"""Tests for typed results and their encodings."""
+
+import json
+
+import pytest
+
+from resume_parser import (
+    Achievement,
+    ParsedResume,
+    decode_results,
+    encode_results,
+    parse_resume,
+    parse_resumes,
+    to_arrow,
+    to_columns,
+)
+
+RESULT = {
+    "name": "Sarah Johnson",
+    "email": "sarah@example.com",
+    "summary": "Engineer — “quoted” ünïcode",
+    "achievements": [
+        {"title": "Reduced Latency", "description": "Reduced latency by 40%", "metric": "40%"}
+    ],
+    "awards": [],
+    "sections": [{"name": "experience", "title": "EXPERIENCE", "start": 10, "end": 200}],
+    "status": {"state": "ok", "reasons": []},
+}
+
+
+class TestParsedResume:
+    def test_dict_view(self):
+        result = ParsedResume.from_dict(RESULT)
+        assert result == RESULT
+        assert result.to_dict() == RESULT
+        assert dict(result) == json.loads(json.dumps(RESULT)) == RESULT
+        assert "role" not in result and result.get("role") is None
+        assert result["achievements"][0]["title"] == "Reduced Latency"
+        achievement = Achievement("Reduced Latency", "Reduced latency by 40%", "40%")
+        assert result.achievements[0] == achievement
+        assert not hasattr(result, "__dict__")
+        with pytest.raises(AttributeError):
+            result.name = "x"
+
+    def test_round_trips(self):
+        result = ParsedResume.from_dict(RESULT)
+        assert ParsedResume.from_json(result.to_json()) == RESULT
+        assert ParsedResume.from_bytes(result.to_bytes()) == RESULT
+        empty = ParsedResume()
+        assert ParsedResume.from_bytes(empty.to_bytes()) == {}
+        assert decode_results(encode_results([RESULT, empty, result])) == [RESULT, {}, RESULT]
+        with pytest.raises(ValueError, match="version"):
+            ParsedResume.from_bytes(b"\x09" + result.to_bytes()[1:])
+
+    def test_columns(self):
+        tables = to_columns([RESULT, ParsedResume(name="Ann Lee")])
+        assert tables["resumes"]["name"].tolist() == ["Sarah Johnson", "Ann Lee"]
+        assert tables["resumes"]["summary"][0] == RESULT["summary"]
+        assert tables["resumes"]["email"][1] == ""
+        achievements = tables["achievements"]
+        assert achievements["resume"].tolist() == [0]
+        assert achievements["metric"].tolist() == ["40%"]
+        assert len(tables["awards"]["title"]) == 0
+        assert tables["sections"]["end"].tolist() == [200]
+
+    def test_to_arrow(self):
+        pyarrow = pytest.importorskip("pyarrow")
+        tables = to_arrow(to_columns([RESULT]))
+        assert isinstance(tables["resumes"], pyarrow.Table)
+        assert tables["achievements"].column("title").to_pylist() == ["Reduced Latency"]
+
+
+def test_parse_typed(sample_pdf, blank_nlp):
+    data = parse_resume(sample_pdf)
+    typed = parse_resume(sample_pdf, typed=True)
+    assert isinstance(typed, ParsedResume) and typed == data
+    assert parse_resumes([sample_pdf], typed=True) == [data]
+    assert ParsedResume.from_bytes(typed.to_bytes()) == data
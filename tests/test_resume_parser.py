@@ -1,7 +1,13 @@
 """Unit tests for resume_parser."""
 
+import subprocess
+import sys
+
 import pytest
+
 from resume_parser import *
+from resume_parser import model
+from resume_parser import resume_parser as rp
 
 
 class TestBasic:
@@ -9,6 +15,179 @@ class TestBasic:
 
     def test_import(self):
         """Test that module imports successfully."""
-        assert True
+        assert callable(parse_resume)
+
+    def test_import_does_not_load_spacy(self):
+        """Importing the package must not import spaCy or load a model."""
+        code = "import sys, resume_parser; print('spacy' in sys.modules)"
+        out = subprocess.check_output([sys.executable, "-c", code], text=True)
+        assert out.strip() == "False"
+
+
+class TestModel:
+    """Lazy model provider."""
+
+    def test_injected_pipeline_is_used(self, blank_nlp):
+        assert get_nlp() is blank_nlp
+        assert model.is_loaded()
+
+    def test_missing_model_loads_once(self, no_nlp):
+        assert get_nlp() is None
+        assert model.is_loaded()
+        assert get_nlp() is None
+
+
+class TestParse:
+    """End-to-end parsing of the bundled sample resume."""
+
+    def test_parse_without_nlp(self, sample_pdf, no_nlp):
+        result = parse_resume(sample_pdf)
+        assert result["name"] == "Sarah Johnson"
+        assert result["email"] == "sarah.johnson@email.com"
+        assert result["linkedin"] == "https://linkedin.com/in/sarahjohnson"
+        assert result["location"] == "San Francisco, CA"
+        assert result["achievements"]
+
+    def test_parse_with_nlp(self, sample_pdf, blank_nlp):
+        result = parse_resume(sample_pdf)
+        assert result["name"] == "Sarah Johnson"
+        assert result["role"].startswith("Senior Software Engineer")
+
+
+class TestBatch:
+    """parse_resumes pipes NLP work for a batch through nlp.pipe."""
+
+    def test_matches_parse_resume(self, sample_pdf, blank_nlp, monkeypatch):
+        expected = parse_resume(sample_pdf)
+        calls = []
+        monkeypatch.setattr(type(blank_nlp), "__call__", lambda self, text: calls.append(text))
+        results = parse_resumes([sample_pdf, sample_pdf, sample_pdf], batch_size=2)
+        assert results == [expected] * 3
+        assert calls == []
+
+    def test_missing_file_gives_empty_result(self, tmp_path, sample_pdf, no_nlp):
+        results = parse_resumes([str(tmp_path / "missing.pdf"), sample_pdf])
+        assert results[0] == {}
+        assert results[1]["name"] == "Sarah Johnson"
+
+
+class TestFields:
+    """parse_resume(fields=...) runs only the extractors it needs."""
+
+    def test_contact_fields_skip_spacy(self, sample_pdf, blank_nlp, monkeypatch):
+        expected = parse_resume(sample_pdf)
+        monkeypatch.setattr(rp, "get_nlp", lambda: pytest.fail("spaCy was used"))
+        result = parse_resume(sample_pdf, fields=["email", "phone", "linkedin"])
+        assert result == {key: expected[key] for key in ["email", "phone", "linkedin"]}
+        assert parse_resumes([sample_pdf], fields=["summary", "awards"]) == [
+            {"summary": expected["summary"], "awards": expected["awards"]}
+        ]
+
+    def test_dependencies_are_extracted_but_not_returned(self, sample_pdf, blank_nlp):
+        expected = parse_resume(sample_pdf)
+        assert parse_resume(sample_pdf, fields=["role"]) == {"role": expected["role"]}
+        assert parse_resume(sample_pdf, fields="achievements") == {
+            "achievements": expected["achievements"]
+        }
+
+    def test_unknown_field(self, sample_pdf):
+        with pytest.raises(ValueError, match="salary"):
+            parse_resume(sample_pdf, fields=["email", "salary"])
+
+    def test_cached_per_field_set(self, tmp_path, sample_pdf, no_nlp):
+        cache = ResultCache(tmp_path / "cache.sqlite")
+        assert parse_resume(sample_pdf, stores=Stores(cache=cache), fields=["email"]) == {
+            "email": "sarah.johnson@email.com"
+        }
+        assert parse_resume(sample_pdf, stores=Stores(cache=cache))["name"] == "Sarah Johnson"
+        assert cache.stats()["entries"] == 2
+
+
+class TestAchievements:
+    """Rule-based filters run before spaCy builds any title."""
+
+    def test_spacy_only_sees_kept_lines(self, blank_nlp, monkeypatch):
+        kept = [
+            f"• Reduced cloud spend by {n}% through rightsizing of compute fleets "
+            "across all regions"
+            for n in range(10, 20)
+        ]
+        rejected = ["• Reduced latency by 40%", "• Led 3 teams"]
+        text = "Experience\n" + "\n".join(rejected + kept) + "\n"
+        calls = []
+        nlp_line = rp._nlp_line
+        monkeypatch.setattr(rp, "_nlp_line", lambda nlp, t: calls.append(t) or nlp_line(nlp, t))
+        achievements = extract_achievements(text)
+        assert [a["metric"] for a in achievements] == [f"{n}%" for n in range(10, 18)]
+        assert calls == [line[2:] for line in kept[:8]]
+
+
+class TestProfiles:
+    """profile="fast" runs the rule-based paths without spaCy."""
+
+    def test_fast_never_imports_spacy(self, sample_pdf):
+        code = (
+            "import sys, resume_parser as rp; "
+            f"data = rp.parse_resume({sample_pdf!r}, profile='fast'); "
+            f"rp.parse_resumes([{sample_pdf!r}], profile='fast'); "
+            "print(data['name'], 'spacy' in sys.modules)"
+        )
+        out = subprocess.check_output([sys.executable, "-c", code], text=True)
+        assert out.strip() == "Sarah Johnson False"
+
+    def test_fast_matches_rules_only(self, sample_pdf, blank_nlp, monkeypatch):
+        full = parse_resume(sample_pdf)
+        monkeypatch.setattr(rp, "get_nlp", lambda: pytest.fail("spaCy was used"))
+        fast = parse_resume(sample_pdf, profile="fast")
+        assert parse_resumes([sample_pdf], profile="fast") == [fast]
+        for key in HEADER_FIELDS:
+            assert fast[key] == full[key]
+        monkeypatch.undo()
+        model.configure_model("resume-parser-missing-model")
+        assert fast == parse_resume(sample_pdf)
+
+    def test_unknown_profile(self, sample_pdf):
+        with pytest.raises(ValueError, match="turbo"):
+            parse_resume(sample_pdf, profile="turbo")
+
+    def test_cached_per_profile(self, tmp_path, sample_pdf, no_nlp):
+        cache = ResultCache(tmp_path / "cache.sqlite")
+        parse_resume(sample_pdf, stores=Stores(cache=cache))
+        parse_resume(sample_pdf, stores=Stores(cache=cache), profile="fast")
+        assert cache.stats()["entries"] == 2
+
+
+class TestDeadline:
+    def test_within_budget(self, sample_pdf, blank_nlp):
+        data = parse_resume(sample_pdf, deadline=60)
+        status = data.pop("status")
+        assert data == parse_resume(sample_pdf)
+        assert status["state"] == "ok"
+        assert status["complete"] == list(FIELDS)
+        assert status["degraded"] == []
+
+    def test_spent_budget_skips_spacy(self, tmp_path, sample_pdf, blank_nlp, monkeypatch):
+        line_facts_cache().clear()
+        monkeypatch.setattr(rp, "_direct_name", lambda document: "")
+        monkeypatch.setattr(rp, "_nlp_line", lambda nlp, text: pytest.fail("spaCy was used"))
+        cache = ResultCache(tmp_path / "cache.sqlite")
+        data = parse_resume(sample_pdf, stores=Stores(cache=cache), deadline=0)
+        assert data["status"]["state"] == "degraded"
+        assert data["status"]["reasons"] == ["deadline"]
+        assert data["status"]["degraded"] == ["name", "achievements"]
+        assert {"email", "phone", "linkedin"} <= set(data["status"]["complete"])
+        assert data["email"] and data["achievements"]
+        assert cache.stats()["entries"] == 0
 
-    # Add your tests here
+    def test_regex_fields_first(self, sample_pdf, no_nlp, monkeypatch):
+        order = []
+        extractors = dict(rp._EXTRACTORS)
+        for field, extract in extractors.items():
+            monkeypatch.setitem(
+                rp._EXTRACTORS,
+                field,
+                lambda *args, field=field, extract=extract: order.append(field) or extract(*args),
+            )
+        data = parse_resume(sample_pdf, fields=["name", "email", "phone"], deadline=1)
+        assert order == ["email", "phone", "name"]
+        assert list(data) == ["name", "email", "phone", "status"]
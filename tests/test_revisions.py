@@ -0,0 +1,110 @@
+"""Tests for incremental re-parsing of revised PDFs."""
+
+import pymupdf as fitz
+import pytest
+
+from resume_parser import (
+    ParseMetrics,
+    RevisionStore,
+    Stores,
+    line_facts_cache,
+    parse_resume,
+    parse_resumes,
+    parse_resumes_parallel,
+)
+from resume_parser.pages import PdfPages
+
+HEADER = ["Sarah Johnson", "Senior Engineer", "San Francisco, CA", "sarah@example.com"]
+EXPERIENCE = [
+    "EXPERIENCE",
+    "- Led a team of 6 engineers to rebuild the billing pipeline, which cut invoice errors by 40%",
+    "- Reduced cloud spend by $120K a year by moving batch jobs to spot instances and caching",
+]
+AWARDS = ["AWARDS", "Engineering Excellence Award 2021", "Hackathon Winner 2019"]
+
+
+def _pdf(path, *pages):
+    doc = fitz.open()
+    for lines in pages:
+        doc.new_page().insert_text((36, 48), "\n".join(lines), fontsize=9)
+    doc.save(path)
+    return str(path)
+
+
+@pytest.fixture
+def revisions(tmp_path):
+    """A resume, a version with a new award on page 2 and one with a new header line."""
+    first = _pdf(tmp_path / "v1.pdf", HEADER + EXPERIENCE, AWARDS)
+    awards = _pdf(tmp_path / "v2.pdf", HEADER + EXPERIENCE, AWARDS + ["Patent Award 2023"])
+    header = _pdf(tmp_path / "v3.pdf", HEADER + ["Open to relocation"] + EXPERIENCE, AWARDS)
+    return first, awards, header
+
+
+def _counters(metrics):
+    return metrics.snapshot()["counters"]
+
+
+class TestRevisionStore:
+    def test_unchanged_pages_are_not_extracted(self, tmp_path, revisions):
+        store = RevisionStore(tmp_path / "revisions.sqlite")
+        first, awards, _ = revisions
+        with PdfPages(first, store=store) as pages:
+            text = pages.text()
+        metrics = ParseMetrics()
+        result = parse_resume(awards, stores=Stores(revisions=store), metrics=metrics)
+        assert result == parse_resume(awards)
+        counters = _counters(metrics)
+        assert counters["revision_page_hits"] == counters["revision_page_misses"] == 1
+        with PdfPages(first, store=store) as pages:
+            assert pages.text() == text
+
+    def test_layout_pages(self, tmp_path, revisions):
+        store = RevisionStore(tmp_path / "revisions.sqlite")
+        first, awards, _ = revisions
+        with PdfPages(first, layout=True) as pages:
+            pages.text()
+            layout = pages.layout()
+        for _ in range(2):
+            with PdfPages(first, layout=True, store=store) as pages:
+                pages.text()
+                assert pages.layout() == layout
+        assert parse_resume(awards, layout=True, stores=Stores(revisions=store)) == parse_resume(
+            awards, layout=True
+        )
+
+    def test_unchanged_sections_skip_spacy(self, tmp_path, revisions, blank_nlp):
+        store = RevisionStore(tmp_path / "revisions.sqlite")
+        first, awards, header = revisions
+        assert parse_resume(first, stores=Stores(revisions=store)) == parse_resume(first)
+        for revised in (awards, header):
+            line_facts_cache().clear()
+            metrics = ParseMetrics()
+            result = parse_resume(revised, stores=Stores(revisions=store), metrics=metrics)
+            line_facts_cache().clear()
+            assert result == parse_resume(revised)
+            assert result["achievements"]
+            counters = _counters(metrics)
+            assert counters["revision_section_hits"] >= 1
+            # Only the header doc is analysed; the achievement titles are stored.
+            assert counters["nlp_calls"] == 1
+        line_facts_cache().clear()
+        metrics = ParseMetrics()
+        batch = parse_resumes([awards, header], stores=Stores(revisions=store), metrics=metrics)
+        assert batch == [parse_resume(awards), parse_resume(header)]
+        assert _counters(metrics)["nlp_piped_texts"] == 2
+
+    def test_used_by_bulk_parsing(self, tmp_path, revisions, no_nlp):
+        store = RevisionStore(tmp_path / "revisions.sqlite")
+        first, awards, _ = revisions
+        report = parse_resumes_parallel([first], workers=1, stores=Stores(revisions=store))
+        assert report.results[0].data == parse_resume(first)
+        metrics = ParseMetrics()
+        parse_resume(awards, stores=Stores(revisions=store), metrics=metrics)
+        assert _counters(metrics)["revision_page_hits"] == 1
+
+    def test_section_key(self):
+        key = RevisionStore.section_key("awards", ["A", "B"])
+        assert key == RevisionStore.section_key("awards", ["A", "B"])
+        assert key != RevisionStore.section_key("awards", ["AB"])
+        assert key != RevisionStore.section_key("achievements", ["A", "B"])
+        assert key != RevisionStore.section_key("awards", ["A", "B"], {"pipeline": "x"})
@@ -0,0 +1,56 @@
+"""Tests for the section index."""
+
+from resume_parser import (
+    ResumeDocument,
+    extract_achievements,
+    extract_awards_and_honors,
+    extract_sections,
+    extract_summary,
+)
+from resume_parser.sections import section_name
+
+TEXT = """Jane Doe
+  PROFESSIONAL SUMMARY:
+Grew revenue 40% as a founder and led a team of 12 engineers to success in three markets.
+Work Experience
+Acme | Staff Engineer | 2019 - 2024
+• Reduced cloud spend by 35% through rightsizing of compute fleets across all of our regions
+Honors & Awards
+Engineer of the Year
+Education
+State University
+"""
+
+
+class TestSections:
+    def test_section_name(self):
+        assert section_name("honors-awards") == "awards"
+        assert section_name("licenses & certifications") == "certifications"
+        assert section_name("work experience:") == "experience"
+        assert section_name("volunteer experience") == "volunteering"
+        assert section_name("experience with large teams and budgets of $10m") is None
+
+    def test_ranges(self):
+        sections = extract_sections(TEXT)
+        assert [s["name"] for s in sections] == ["summary", "experience", "awards", "education"]
+        assert sections[0]["title"] == "PROFESSIONAL SUMMARY:"
+        assert TEXT[sections[0]["start"] :].startswith("PROFESSIONAL SUMMARY:")
+        assert TEXT[sections[1]["start"] : sections[1]["end"]].startswith("Work Experience\n")
+        assert TEXT[sections[1]["start"] : sections[1]["end"]].endswith("regions\n")
+        assert sections[-1]["end"] == len(TEXT)
+
+    def test_extractors_share_index(self):
+        document = ResumeDocument(TEXT)
+        index = document.sections
+        assert extract_summary(document).startswith("Grew revenue 40%")
+        assert extract_awards_and_honors(document)[0]["title"] == "Engineer of the Year"
+        assert document.sections is index
+        assert [s.lines for s in index.named("experience")] == [range(4, 6)]
+
+    def test_achievements_from_experience_only(self):
+        achievements = extract_achievements(TEXT)
+        assert [a["metric"] for a in achievements] == ["35%"]
+
+    def test_achievements_without_experience_header(self):
+        text = TEXT.replace("Work Experience\n", "")
+        assert [a["metric"] for a in extract_achievements(text)] == ["40%", "35%"]
@@ -0,0 +1,97 @@
+"""Tests for the local HTTP parsing service."""
+
+import asyncio
+import json
+
+import pytest
+
+from resume_parser import parse_resume
+from resume_parser.server import ParseServer
+
+
+async def _request(server, method, path, body=b"", content_type="application/pdf"):
+    reader, writer = await asyncio.open_connection("127.0.0.1", server.port)
+    head = (
+        f"{method} {path} HTTP/1.1\r\nHost: localhost\r\nConnection: close\r\n"
+        f"Content-Type: {content_type}\r\nContent-Length: {len(body)}\r\n\r\n"
+    )
+    writer.write(head.encode("latin-1") + body)
+    response = await reader.read()
+    writer.close()
+    status_line, _, rest = response.partition(b"\r\n")
+    return int(status_line.split()[1]), json.loads(rest.partition(b"\r\n\r\n")[2])
+
+
+def _serve(test, **options):
+    async def run():
+        async with ParseServer(port=0, workers=1, **options) as server:
+            return await test(server)
+
+    return asyncio.run(run())
+
+
+@pytest.fixture
+def pdf_bytes(sample_pdf):
+    with open(sample_pdf, "rb") as f:
+        return f.read()
+
+
+class TestParseServer:
+    def test_parse_and_batching(self, pdf_bytes, sample_pdf, blank_nlp):
+        async def test(server):
+            uploads = [_request(server, "POST", "/parse", pdf_bytes) for _ in range(4)]
+            responses = await asyncio.gather(*uploads)
+            return responses, (await _request(server, "GET", "/latency"))[1]
+
+        responses, latency = _serve(test, max_batch=4, max_wait=0.5)
+        assert responses == [(200, parse_resume(sample_pdf))] * 4
+        assert latency["requests"] == 4 and latency["batches"] == 1
+        assert latency["mean_batch_size"] == 4 and latency["p99_ms"] > 0
+
+    def test_multipart_upload(self, pdf_bytes, sample_pdf, no_nlp):
+        form = (
+            b'--XX\r\nContent-Disposition: form-data; name="file"; filename="cv.pdf"\r\n'
+            b"Content-Type: application/pdf\r\n\r\n" + pdf_bytes + b"\r\n--XX--\r\n"
+        )
+
+        async def test(server):
+            return await _request(
+                server, "POST", "/parse", form, "multipart/form-data; boundary=XX"
+            )
+
+        assert _serve(test, fields=["email"]) == (200, parse_resume(sample_pdf, fields=["email"]))
+
+    def test_status_endpoints_and_errors(self, no_nlp):
+        async def test(server):
+            return [
+                await _request(server, "GET", "/health"),
+                await _request(server, "GET", "/queue"),
+                await _request(server, "GET", "/missing"),
+                await _request(server, "GET", "/parse"),
+                await _request(server, "POST", "/parse"),
+                await _request(server, "POST", "/parse", b"not a pdf"),
+                await _request(server, "POST", "/parse", b"%PDF-" + b"x" * 2000),
+            ]
+
+        health, queue, *errors = _serve(test, profile="fast", max_upload=1000)
+        assert health == (200, {**health[1], "status": "ok", "workers": 1, "profile": "fast"})
+        assert queue == (200, {"queued": 0, "in_flight": 0, "max_queue": 256, "max_batch": 8})
+        assert [status for status, _ in errors] == [404, 405, 400, 422, 413]
+
+    def test_timed_out_uploads_are_not_parsed(self, pdf_bytes, no_nlp):
+        async def test(server):
+            response = await _request(server, "POST", "/parse", pdf_bytes)
+            await asyncio.sleep(0.6)
+            return response, (await _request(server, "GET", "/latency"))[1]
+
+        (status, _), latency = _serve(test, max_batch=2, max_wait=0.5, timeout=0.1)
+        assert status == 504
+        assert latency["batches"] == 0 and latency["errors"] == 1
+
+    def test_invalid_options(self):
+        with pytest.raises(ValueError):
+            ParseServer(profile="slow")
+        with pytest.raises(ValueError):
+            ParseServer(max_batch=0)
+        with pytest.raises(ValueError):
+            ParseServer(fields=["salary"])
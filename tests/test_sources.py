@@ -0,0 +1,62 @@
+"""Tests for parsing PDFs from in-memory and file-like sources."""
+
+import io
+import mmap
+
+import pytest
+
+from resume_parser import ResultCache, Stores, parse_resume, parse_resumes
+from resume_parser.sources import as_buffer, load_source
+
+
+@pytest.fixture
+def pdf_bytes(sample_pdf):
+    with open(sample_pdf, "rb") as f:
+        return f.read()
+
+
+class TestSources:
+    def test_buffers_are_not_copied(self, pdf_bytes):
+        data = bytearray(pdf_bytes)
+        view = as_buffer(data)
+        data[0:1] = b"X"
+        assert view[0:1] == b"X"
+        stream = io.BytesIO(pdf_bytes)
+        assert as_buffer(stream).obj is not None
+        assert as_buffer("resume.pdf") is None
+
+    def test_stream_becomes_reusable_buffer(self, pdf_bytes):
+        source = load_source(io.BufferedReader(io.BytesIO(pdf_bytes)))
+        assert isinstance(source, memoryview)
+        assert bytes(source) == pdf_bytes
+        with pytest.raises(TypeError):
+            as_buffer(42)
+
+    def test_streams_read_from_current_position(self, pdf_bytes):
+        for stream in (
+            io.BytesIO(b"junk" + pdf_bytes),
+            io.BufferedReader(io.BytesIO(b"junk" + pdf_bytes)),
+        ):
+            stream.seek(4)
+            assert bytes(load_source(stream)) == pdf_bytes
+
+    def test_all_sources_match_path(self, sample_pdf, pdf_bytes, no_nlp):
+        expected = parse_resume(sample_pdf)
+        assert parse_resume(pdf_bytes) == expected
+        assert parse_resume(bytearray(pdf_bytes)) == expected
+        assert parse_resume(memoryview(pdf_bytes)) == expected
+        assert parse_resume(io.BytesIO(pdf_bytes)) == expected
+        with open(sample_pdf, "rb") as f:
+            assert parse_resume(f) == expected
+        assert parse_resumes([pdf_bytes, sample_pdf]) == [expected, expected]
+
+    def test_mmap_released_after_parse(self, sample_pdf, no_nlp):
+        with open(sample_pdf, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+            assert parse_resume(m)["name"] == "Sarah Johnson"
+        assert m.closed
+
+    def test_cache_with_bytes(self, tmp_path, sample_pdf, pdf_bytes, no_nlp):
+        cache = ResultCache(tmp_path / "cache.sqlite")
+        parse_resume(sample_pdf, stores=Stores(cache=cache))
+        parse_resume(pdf_bytes, stores=Stores(cache=cache))
+        assert (cache.hits, cache.misses) == (1, 1)
@@ -0,0 +1,67 @@
+"""Tests for field-by-field streaming."""
+
+import pymupdf as fitz
+import pytest
+
+from resume_parser import FIELDS, FieldUpdate, iter_resume_fields, parse_resume
+from resume_parser import resume_parser as rp
+
+
+def _final(updates):
+    return {update.field: update.value for update in updates if not update.item}
+
+
+class TestIterResumeFields:
+    def test_matches_parse_resume(self, sample_pdf, blank_nlp):
+        updates = list(iter_resume_fields(sample_pdf))
+        assert _final(updates) == parse_resume(sample_pdf)
+        order = [update.field for update in updates if not update.item]
+        assert order == ["email", "phone", "linkedin", "name", "role", "location"] + [
+            "summary",
+            "achievements",
+            "awards",
+            "sections",
+        ]
+        fields = ["role", "awards"]
+        streamed = _final(iter_resume_fields(sample_pdf, fields))
+        assert streamed == parse_resume(sample_pdf, fields=fields)
+
+    def test_regex_fields_before_spacy(self, sample_pdf, blank_nlp, monkeypatch):
+        calls = []
+        nlp_line = rp._nlp_line
+        monkeypatch.setattr(rp, "_nlp_line", lambda nlp, t: calls.append(t) or nlp_line(nlp, t))
+        updates = iter_resume_fields(sample_pdf)
+        assert next(updates).field == "email"
+        assert [next(updates).field for _ in range(2)] == ["phone", "linkedin"]
+        assert calls == []
+        list(updates)
+        assert calls
+
+    def test_achievements_item_by_item(self, sample_pdf, blank_nlp):
+        updates = [u for u in iter_resume_fields(sample_pdf) if u.field == "achievements"]
+        items = [u.value for u in updates[:-1]]
+        assert all(u.item for u in updates[:-1])
+        assert updates[-1] == FieldUpdate("achievements", items)
+        assert items == parse_resume(sample_pdf)["achievements"]
+
+    def test_email_on_a_later_page(self, tmp_path, no_nlp):
+        doc = fitz.open()
+        for number in range(3):
+            lines = [f"Project {number}-{i} shipped" for i in range(60)]
+            if number == 0:
+                lines.insert(0, "Jane Doe")
+            if number == 2:
+                lines.append("jane@example.com")
+            doc.new_page().insert_text((36, 36), "\n".join(lines), fontsize=7)
+        path = str(tmp_path / "long.pdf")
+        doc.save(path)
+        updates = list(iter_resume_fields(path))
+        order = [update.field for update in updates if not update.item]
+        assert order.index("email") > order.index("location")
+        assert _final(updates) == parse_resume(path)
+        assert set(order) == set(FIELDS)
+
+    def test_errors(self, tmp_path):
+        with pytest.raises(ValueError):
+            iter_resume_fields("resume.pdf", profile="turbo")
+        assert list(iter_resume_fields(str(tmp_path / "missing.pdf"))) == []